@@ -0,0 +1,236 @@
+"""
+Suite de rendimiento de las rutas críticas del juego.
+
+Uso:
+    python benchmarks/rendimiento.py --salida resultados.json
+    python benchmarks/rendimiento.py --comparar base.json --tolerancia 10
+    python benchmarks/rendimiento.py --tamanos 1000,100000,10000000
+
+Cada caso reporta operaciones por segundo y el pico de memoria asignada durante
+una ejecución. En modo comparación el proceso termina con código 1 si algún caso
+es más lento que la línea base en más del porcentaje de tolerancia.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from diagrama import DiagramaAhorcado  # noqa: E402
+from interfaz import InteraccionConsola  # noqa: E402
+from juego import Juego  # noqa: E402
+from palabras import GestorPalabras  # noqa: E402
+
+SEMILLA = 1024
+LETRAS = "abcdefghijklmnñopqrstuvwxyzáéíóú"
+
+
+def medir(preparar, ejecutar, operaciones, tiempo_minimo=0.2):
+    """
+    Mide las operaciones por segundo de `ejecutar` y su pico de memoria.
+
+    Args:
+        preparar (callable): Crea el estado de una ronda; no se cronometra.
+        ejecutar (callable): Recibe el estado y realiza `operaciones` operaciones.
+        operaciones (int): Operaciones que realiza cada llamada a `ejecutar`.
+        tiempo_minimo (float): Segundos mínimos de medición acumulada.
+
+    Returns:
+        dict: ops_por_segundo, memoria_pico_bytes y rondas.
+    """
+    estado = preparar()
+    tracemalloc.start()
+    ejecutar(estado)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mejor = float("inf")
+    acumulado = 0.0
+    rondas = 0
+    while acumulado < tiempo_minimo or rondas < 3:
+        estado = preparar()
+        inicio = time.perf_counter()
+        ejecutar(estado)
+        duracion = time.perf_counter() - inicio
+        mejor = min(mejor, duracion)
+        acumulado += duracion
+        rondas += 1
+    return {"ops_por_segundo": operaciones / mejor if mejor else float("inf"),
+            "memoria_pico_bytes": pico,
+            "rondas": rondas}
+
+
+def generar_csv(ruta, palabras_totales, temas=1000):
+    """
+    Escribe un CSV sintético de temas y palabras con contenido reproducible.
+
+    Args:
+        ruta (str): Ruta del archivo a crear.
+        palabras_totales (int): Cantidad total de palabras.
+        temas (int): Cantidad de temas.
+    """
+    aleatorio = random.Random(SEMILLA)
+    temas = min(temas, palabras_totales)
+    por_tema = palabras_totales // temas
+    with open(ruta, mode='w', encoding='utf-8', newline='') as archivo:
+        for numero in range(temas):
+            palabras = ("".join(aleatorio.choices(LETRAS, k=aleatorio.randint(4, 12)))
+                        for _ in range(por_tema))
+            archivo.write(f"Tema {numero}," + ",".join(palabras) + "\r\n")
+
+
+def casos_juego():
+    """Casos de `Juego.jugar_turno`, `normalizar_letra` y `generar_avance`."""
+    n = 10000
+    frase = ("el veloz murciélago hindú comía feliz cardillo y kiwi " * 4)[:200]
+
+    def juegos(palabra, entradas=()):
+        def preparar():
+            lista = [Juego(palabra) for _ in range(n)]
+            for juego in lista:
+                for entrada in entradas:
+                    juego.jugar_turno(entrada)
+            return lista
+        return preparar
+
+    def turno(entrada):
+        def ejecutar(lista):
+            for juego in lista:
+                juego.jugar_turno(entrada)
+        return ejecutar
+
+    juego = Juego("murciélago")
+    yield "jugar_turno_correcta", medir(juegos("murciélago"), turno("a"), n)
+    yield "jugar_turno_incorrecta", medir(juegos("murciélago"), turno("z"), n)
+    yield "jugar_turno_repetida", medir(juegos("murciélago", "a"), turno("a"), n)
+    yield "jugar_turno_palabra_completa", medir(juegos("murciélago"), turno("murcielago"), n)
+    yield "normalizar_letra_ascii", medir(lambda: None, lambda _: [juego.normalizar_letra("palabra") for _ in range(n)], n)
+    yield "normalizar_letra_acentos", medir(lambda: None, lambda _: [juego.normalizar_letra("Canción Ñandú") for _ in range(n)], n)
+
+    for nombre, palabra in (("corta", "café"), ("frase_200", frase)):
+        def preparar(palabra=palabra):
+            juego = Juego(palabra)
+            juego.letras_adivinadas = set("aeiou")
+            return juego
+
+        def ejecutar(juego):
+            for _ in range(1000):
+                juego.generar_avance()
+                juego.avance
+
+        yield f"generar_avance_{nombre}", medir(preparar, ejecutar, 1000)
+
+
+def casos_palabras(tamanos, directorio):
+    """Casos de `GestorPalabras.cargar_palabras` y `seleccionar_palabra` en sus tres modos de carga."""
+    for tamano in tamanos:
+        ruta = os.path.join(directorio, f"corpus_{tamano}.csv")
+        generar_csv(ruta, tamano)
+        GestorPalabras(ruta, carga_diferida=True)
+        GestorPalabras(ruta, compilado=True)
+        for modo, opciones in (("completo", {}),
+                               ("diferido", {"carga_diferida": True}),
+                               ("compilado", {"compilado": True})):
+            yield (f"cargar_palabras_{modo}_{tamano}",
+                   medir(lambda: None, lambda _: GestorPalabras(ruta, **opciones), 1, tiempo_minimo=0.0))
+            gestor = GestorPalabras(ruta, **opciones)
+            temas = gestor.obtener_temas()
+            yield (f"seleccionar_palabra_{modo}_{tamano}",
+                   medir(lambda: None, lambda _: [gestor.seleccionar_palabra(temas[i % len(temas)])
+                                                  for i in range(1000)], 1000))
+
+
+def casos_interfaz():
+    """Casos de `DiagramaAhorcado.dibujar` e `InteraccionConsola.mostrar_menu` con la salida descartada."""
+    diagrama = DiagramaAhorcado()
+
+    def dibujar(_):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for errores in range(1000):
+                diagrama.dibujar(errores % 7)
+
+    yield "diagrama_dibujar", medir(lambda: None, dibujar, 1000)
+
+    for cantidad in (10, 1000):
+        temas = [f"Tema número {i}" for i in range(cantidad)]
+
+        def mostrar(_, temas=temas):
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(10):
+                    InteraccionConsola.mostrar_menu(temas)
+
+        yield f"mostrar_menu_{cantidad}", medir(lambda: None, mostrar, 10)
+
+
+def comparar(resultados, base, tolerancia):
+    """
+    Compara los resultados con una línea base.
+
+    Args:
+        resultados (dict): Resultados actuales por caso.
+        base (dict): Resultados de la línea base por caso.
+        tolerancia (float): Porcentaje máximo de pérdida de ops/s permitido.
+
+    Returns:
+        list: Descripciones de los casos que empeoraron más de lo permitido.
+    """
+    regresiones = []
+    for caso, actual in resultados.items():
+        if caso not in base:
+            continue
+        referencia = base[caso]["ops_por_segundo"]
+        cambio = (actual["ops_por_segundo"] - referencia) / referencia * 100
+        if cambio < -tolerancia:
+            regresiones.append(f"{caso}: {actual['ops_por_segundo']:.0f} ops/s "
+                               f"frente a {referencia:.0f} ({cambio:+.1f} %)")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de rendimiento del juego del ahorcado.")
+    parser.add_argument("--salida", default="resultados_rendimiento.json", help="Archivo JSON de resultados")
+    parser.add_argument("--comparar", default=None, help="Archivo JSON con la línea base")
+    parser.add_argument("--tolerancia", type=float, default=10.0, help="Porcentaje de regresión permitido")
+    parser.add_argument("--tamanos", default="1000,100000,1000000",
+                        help="Tamaños de los corpus sintéticos, en palabras, separados por comas")
+    argumentos = parser.parse_args()
+    tamanos = [int(tamano) for tamano in argumentos.tamanos.split(",") if tamano]
+
+    # La línea base se lee antes de medir: `--salida` puede ser el mismo archivo y se sobrescribe
+    base = None
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding='utf-8') as archivo:
+            base = json.load(archivo)["resultados"]
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        for casos in (casos_juego(), casos_palabras(tamanos, directorio), casos_interfaz()):
+            for caso, medicion in casos:
+                resultados[caso] = medicion
+                print(f"{caso:45} {medicion['ops_por_segundo']:>14,.0f} ops/s "
+                      f"{medicion['memoria_pico_bytes'] / 1024:>10,.1f} KiB")
+
+    with open(argumentos.salida, mode='w', encoding='utf-8') as archivo:
+        json.dump({"python": platform.python_version(),
+                   "plataforma": platform.platform(),
+                   "resultados": resultados}, archivo, indent=2, ensure_ascii=False)
+
+    if base is not None:
+        regresiones = comparar(resultados, base, argumentos.tolerancia)
+        for regresion in regresiones:
+            print(f"REGRESIÓN {regresion}")
+        if regresiones:
+            sys.exit(1)
+        print(f"Sin regresiones mayores al {argumentos.tolerancia:g} %")
+
+
+if __name__ == "__main__":
+    main()
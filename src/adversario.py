@@ -0,0 +1,260 @@
+import numpy as np
+
+from juego import Juego, BIT_LETRA, indexar_palabra
+from normalizador import normalizar, normalizar_lote
+
+# Las posiciones de una letra se guardan en una máscara de 64 bits por palabra
+LONGITUD_MAXIMA = 64
+# Hasta esta longitud las familias se cuentan con una tabla de 2**longitud entradas
+LONGITUD_TABLA = 16
+# Código de las partes de más de un carácter que deja la normalización, fuera del rango Unicode
+PRIMER_CODIGO_EXTRA = 0x110000
+
+
+class GrupoLongitud:
+    """
+    Palabras de una misma longitud con las posiciones de cada letra normalizada precalculadas.
+
+    Attributes:
+        palabras (list): Las palabras originales.
+        mascaras (dict): Código de letra -> máscara de sus posiciones en cada palabra (numpy.uint64).
+        distintas (numpy.ndarray): Letras normalizadas distintas de cada palabra.
+        filas (dict): Palabra normalizada -> filas en las que aparece.
+    """
+
+    def __init__(self, palabras, normalizadas, codigos):
+        """
+        Args:
+            palabras (list): Las palabras originales.
+            normalizadas (list): Las palabras normalizadas.
+            codigos (numpy.ndarray): Matriz (palabras, longitud) con el código de cada letra normalizada.
+        """
+        self.palabras = palabras
+        self.filas = {}
+        for fila, normalizada in enumerate(normalizadas):
+            self.filas.setdefault(normalizada, []).append(fila)
+        # Una fila de máscaras por letra distinta; en cada posición, cada palabra
+        # tiene una sola letra, así que basta con una asignación por posición
+        letras, ids = np.unique(codigos, return_inverse=True)
+        ids = ids.reshape(codigos.shape)
+        mascaras = np.zeros((len(letras), len(palabras)), dtype=np.uint64)
+        filas = np.arange(len(palabras))
+        for posicion in range(codigos.shape[1]):
+            mascaras[ids[:, posicion], filas] |= np.uint64(1 << posicion)
+        self.mascaras = {int(codigo): mascaras[numero] for numero, codigo in enumerate(letras)}
+        self.distintas = (mascaras != 0).sum(axis=0)
+
+    def __len__(self):
+        return len(self.palabras)
+
+    @property
+    def longitud(self):
+        """int: La longitud de las palabras del grupo."""
+        return len(self.palabras[0])
+
+
+
+class IndiceCandidatas:
+    """
+    Índice de las palabras de un tema para el modo adversario.
+
+    Las palabras se agrupan por longitud y, para cada grupo, se precalcula la
+    máscara de posiciones de cada letra normalizada en cada palabra: repartir las
+    candidatas por una letra es tomar esas máscaras y contar sus valores, sin
+    recorrer las palabras. Se construye una vez por tema y lo comparten todas las partidas.
+
+    Attributes:
+        grupos (dict): Longitud -> GrupoLongitud.
+        extras (dict): Parte normalizada de más de un carácter -> su código.
+    """
+
+    def __init__(self, palabras):
+        """
+        Args:
+            palabras (Sequence): Las palabras del tema. Se omiten las vacías y las de
+                más de `LONGITUD_MAXIMA` caracteres.
+        """
+        self.extras = {}
+        por_longitud = {}
+        for palabra in palabras:
+            if 0 < len(palabra) <= LONGITUD_MAXIMA:
+                por_longitud.setdefault(len(palabra), []).append(palabra)
+        self.grupos = {}
+        for longitud, lista in por_longitud.items():
+            normalizadas = list(normalizar_lote(lista))
+            if all(len(normalizada) == longitud for normalizada in normalizadas):
+                codigos = np.frombuffer("".join(normalizadas).encode("utf-32-le"),
+                                        dtype=np.uint32).reshape(len(lista), longitud)
+            else:
+                codigos = np.array([self.codificar(palabra) for palabra in lista],
+                                   dtype=np.uint32).reshape(len(lista), longitud)
+            self.grupos[longitud] = GrupoLongitud(lista, normalizadas, codigos)
+
+    def codigo(self, letra):
+        """
+        Args:
+            letra (str): Letra normalizada (o parte normalizada de una letra).
+
+        Returns:
+            int: Su código, o None si ninguna palabra la contiene.
+        """
+        return ord(letra) if len(letra) == 1 else self.extras.get(letra)
+
+    def codificar(self, palabra):
+        """
+        Códigos de las letras normalizadas de una palabra, uno por posición de la
+        palabra original, para las palabras cuya normalización cambia de longitud.
+        """
+        codigos = []
+        for letra in palabra:
+            letra = normalizar(letra)
+            if len(letra) != 1 and letra not in self.extras:
+                self.extras[letra] = PRIMER_CODIGO_EXTRA + len(self.extras)
+            codigos.append(self.codigo(letra))
+        return codigos
+
+    def longitud_mas_comun(self):
+        """
+        Returns:
+            int: La longitud con más palabras (la menor, si hay empate).
+
+        Raises:
+            ValueError: Si el índice no tiene palabras.
+        """
+        if not self.grupos:
+            raise ValueError("No hay palabras para el modo adversario")
+        return max(sorted(self.grupos), key=lambda longitud: len(self.grupos[longitud]))
+
+
+class JuegoAdversario(Juego):
+    """
+    Juego en el que la palabra no se elige al comenzar.
+
+    Se mantienen todas las palabras del tema (de una misma longitud) que son
+    coherentes con lo jugado. Con cada letra nueva las candidatas se reparten en
+    familias según las posiciones en que aparecería la letra, y se conserva la
+    familia más grande; si hay empate, se prefiere la que no contiene la letra.
+    Un intento de palabra completa se resuelve igual (ver `descartar`).
+
+    La palabra del juego (`palabra` e `indice`) es siempre una de las candidatas,
+    por lo que la lógica de turnos, los estados y los puntos son los de `Juego`.
+
+    Attributes:
+        indice_candidatas (IndiceCandidatas): Índice de las palabras del tema.
+        grupo (GrupoLongitud): Las palabras de la longitud elegida.
+        candidatas (numpy.ndarray): Filas del grupo que siguen siendo posibles.
+    """
+    __slots__ = ("indice_candidatas", "grupo", "candidatas")
+
+    def __init__(self, indice_candidatas, longitud=None):
+        """
+        Args:
+            indice_candidatas (IndiceCandidatas): Índice de las palabras del tema.
+            longitud (int, optional): Longitud de la palabra; por defecto, la más común.
+
+        Raises:
+            ValueError: Si no hay palabras de esa longitud.
+        """
+        if longitud is None:
+            longitud = indice_candidatas.longitud_mas_comun()
+        grupo = indice_candidatas.grupos.get(longitud)
+        if grupo is None:
+            raise ValueError(f"No hay palabras de {longitud} letras para el modo adversario")
+        super().__init__(grupo.palabras[0])
+        self.indice_candidatas = indice_candidatas
+        self.grupo = grupo
+        self.candidatas = np.arange(len(grupo), dtype=np.int64)
+
+    def procesar_turno(self, entrada_usuario):
+        """
+        Reduce las candidatas según la entrada y aplica el turno como `Juego`.
+
+        Args:
+            entrada_usuario (str): La letra o palabra ingresada por el jugador.
+
+        Returns:
+            EstadoJuego: El estado actual del juego después de la entrada del jugador.
+            int: La puntuación obtenida en el turno actual.
+        """
+        entrada_normal = self.normalizar_letra(entrada_usuario)
+        if not self.ya_usada(entrada_normal):
+            if len(entrada_normal) == 1:
+                self.partir(entrada_normal)
+            elif len(entrada_normal) > 1:
+                self.descartar(entrada_normal)
+        return super().procesar_turno(entrada_usuario)
+
+    def ya_usada(self, entrada_normal):
+        """Indica si la entrada normalizada ya se jugó."""
+        bit = BIT_LETRA.get(entrada_normal, 0)
+        if bit:
+            return bool(self.mascara_usadas & bit)
+        return self.otras_usadas is not None and entrada_normal in self.otras_usadas
+
+    def partir(self, letra):
+        """
+        Reparte las candidatas por las posiciones de la letra y conserva la familia más grande.
+
+        Args:
+            letra (str): Letra normalizada.
+        """
+        codigo = self.indice_candidatas.codigo(letra)
+        mascaras = self.grupo.mascaras.get(codigo) if codigo is not None else None
+        if mascaras is None:
+            return
+        posiciones = mascaras[self.candidatas]
+        # En ambos casos las familias quedan ordenadas por máscara, así que, si la
+        # familia sin la letra (máscara 0) empata, argmax la elige
+        if self.grupo.longitud <= LONGITUD_TABLA:
+            familia = np.argmax(np.bincount(posiciones.astype(np.intp)))
+        else:
+            familias, tamanos = np.unique(posiciones, return_counts=True)
+            familia = familias[np.argmax(tamanos)]
+        self.candidatas = self.candidatas[posiciones == familia]
+        self.fijar_palabra()
+
+    def descartar(self, palabra_normal):
+        """
+        Resuelve un intento de palabra completa.
+
+        Las candidatas se reparten primero según si al jugador aún le quedan al
+        menos 3 letras por revelar (si no, el intento llega fuera de tiempo) y se
+        conserva el grupo más grande, prefiriendo el fuera de tiempo si empatan. Si
+        el intento es válido, la palabra se quita de las candidatas mientras queden otras.
+
+        Args:
+            palabra_normal (str): La palabra normalizada.
+        """
+        fuera_de_tiempo = self.letras_sin_revelar() < 3
+        if 2 * int(fuera_de_tiempo.sum()) >= len(fuera_de_tiempo):
+            self.candidatas = self.candidatas[fuera_de_tiempo]
+        else:
+            self.candidatas = self.candidatas[~fuera_de_tiempo]
+            filas = self.grupo.filas.get(palabra_normal)
+            if filas:
+                restantes = self.candidatas[~np.isin(self.candidatas, filas)]
+                if len(restantes):
+                    self.candidatas = restantes
+        self.fijar_palabra()
+
+    def letras_sin_revelar(self):
+        """
+        Las letras reveladas son las mismas en todas las candidatas, así que basta
+        con restarlas de las letras distintas de cada una.
+
+        Returns:
+            numpy.ndarray: Letras distintas aún no reveladas de cada candidata.
+        """
+        reveladas = len(self.indice.mascaras) - self.letras_restantes
+        return self.grupo.distintas[self.candidatas] - reveladas
+
+    def fijar_palabra(self):
+        """Toma como palabra del juego la primera candidata y recalcula las letras restantes."""
+        palabra = self.grupo.palabras[int(self.candidatas[0])]
+        if palabra == self.palabra:
+            return
+        self.palabra = palabra
+        self.indice = indexar_palabra(palabra)
+        revelado = self.revelado
+        self.letras_restantes = sum(1 for posiciones in self.indice.mascaras.values()
+                                    if not revelado & posiciones)
@@ -0,0 +1,179 @@
+import logging
+import sqlite3
+import threading
+
+registro = logging.getLogger(__name__)
+
+
+class AlmacenEnGrupo:
+    """
+    Base de los almacenes SQLite que confirman sus escrituras en grupo desde un hilo.
+
+    Las actualizaciones se acumulan en memoria en `pendientes` y un hilo escritor
+    las confirma juntas: todas las que llegan durante `intervalo_commit` se escriben
+    en una sola transacción, de modo que miles de actualizaciones por segundo cuestan
+    unas pocas sincronizaciones a disco. Mientras un lote se escribe sigue visible
+    en `en_vuelo`; si la escritura falla, vuelve a `pendientes` y se reintenta.
+
+    Las subclases implementan `escribir_lote` y, si hace falta, `combinar` y `mantener`,
+    y llaman a `iniciar_escritor` al terminar de prepararse.
+
+    Attributes:
+        ruta (str): La ruta del archivo SQLite.
+        intervalo_commit (float): Segundos máximos que una actualización espera a confirmarse.
+        max_pendientes (int): Actualizaciones acumuladas que fuerzan una confirmación inmediata.
+        confirmaciones (int): Transacciones confirmadas.
+        pendientes (dict): Clave -> valor de las actualizaciones aún sin escribir.
+        en_vuelo (dict): El lote que se está escribiendo; se sigue leyendo hasta su COMMIT.
+    """
+
+    def __init__(self, ruta, intervalo_commit, max_pendientes, sincronizacion="FULL"):
+        """
+        Args:
+            ruta (str): La ruta del archivo SQLite.
+            intervalo_commit (float): Segundos máximos que una actualización espera a confirmarse.
+            max_pendientes (int): Actualizaciones acumuladas que fuerzan una confirmación inmediata.
+            sincronizacion (str): Valor de `PRAGMA synchronous` para la base.
+        """
+        self.ruta = ruta
+        self.intervalo_commit = intervalo_commit
+        self.max_pendientes = max_pendientes
+        self.confirmaciones = 0
+        self.conexion = sqlite3.connect(ruta, check_same_thread=False, isolation_level=None)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute(f"PRAGMA synchronous={sincronizacion}")
+        self.candado_bd = threading.Lock()
+        # Solo un lote está en vuelo a la vez
+        self.candado_lote = threading.Lock()
+        self.condicion = threading.Condition()
+        self.pendientes = {}
+        self.en_vuelo = {}
+        self.activo = True
+        self.hilo = None
+
+    def iniciar_escritor(self):
+        """Arranca el hilo escritor."""
+        self.hilo = threading.Thread(target=self.escribir_en_segundo_plano, daemon=True)
+        self.hilo.start()
+
+    def combinar(self, anterior, nuevo):
+        """
+        Une dos actualizaciones de la misma clave; por omisión gana la más reciente.
+
+        Args:
+            anterior: El valor acumulado antes.
+            nuevo: El valor que llega después.
+
+        Returns:
+            El valor que debe quedar pendiente.
+        """
+        return nuevo
+
+    def acumular(self, actualizaciones):
+        """
+        Agrega actualizaciones a `pendientes`; se confirman en la siguiente escritura en grupo.
+
+        Args:
+            actualizaciones (dict): Clave -> valor.
+        """
+        with self.condicion:
+            for clave, valor in actualizaciones.items():
+                anterior = self.pendientes.get(clave)
+                self.pendientes[clave] = valor if anterior is None else self.combinar(anterior, valor)
+            if len(self.pendientes) >= self.max_pendientes:
+                self.condicion.notify()
+
+    def leer_pendiente(self, clave):
+        """
+        Returns:
+            El valor aún sin confirmar de la clave, o None si no hay ninguno.
+        """
+        with self.condicion:
+            valor = self.pendientes.get(clave)
+            return self.en_vuelo.get(clave) if valor is None else valor
+
+    def escribir_lote(self, lote):
+        """
+        Escribe un lote dentro de la transacción abierta por `escribir`.
+
+        Args:
+            lote (dict): Clave -> valor.
+        """
+        raise NotImplementedError("Implementa este método en la subclase")
+
+    def escribir(self, lote):
+        """Escribe un lote en una sola transacción."""
+        with self.candado_bd:
+            self.conexion.execute("BEGIN IMMEDIATE")
+            try:
+                self.escribir_lote(lote)
+            except BaseException:
+                self.conexion.execute("ROLLBACK")
+                raise
+            self.conexion.execute("COMMIT")
+            self.confirmaciones += 1
+
+    def sincronizar(self):
+        """
+        Confirma de inmediato todas las actualizaciones pendientes.
+
+        Si la escritura falla, el lote vuelve a `pendientes` (combinado con lo
+        acumulado después) para reintentarlo en la siguiente confirmación.
+
+        Returns:
+            int: Cantidad de claves escritas.
+        """
+        with self.candado_lote:
+            with self.condicion:
+                lote, self.pendientes = self.pendientes, {}
+                self.en_vuelo = lote
+            if not lote:
+                return 0
+            try:
+                self.escribir(lote)
+            except BaseException:
+                with self.condicion:
+                    for clave, valor in lote.items():
+                        posterior = self.pendientes.get(clave)
+                        self.pendientes[clave] = valor if posterior is None else self.combinar(valor, posterior)
+                    self.en_vuelo = {}
+                raise
+            with self.condicion:
+                self.en_vuelo = {}
+        return len(lote)
+
+    def mantener(self):
+        """Tarea periódica del hilo escritor tras cada confirmación; por omisión no hace nada."""
+
+    def escribir_en_segundo_plano(self):
+        """Bucle del hilo escritor: confirma en grupo y ejecuta `mantener`."""
+        while True:
+            with self.condicion:
+                if self.activo and len(self.pendientes) < self.max_pendientes:
+                    self.condicion.wait(self.intervalo_commit)
+                activo = self.activo
+            try:
+                self.sincronizar()
+                self.mantener()
+            except Exception:
+                # El lote ya volvió a `pendientes`: se reintenta en la siguiente vuelta
+                registro.exception("No se pudo escribir en %s", self.ruta)
+            if not activo:
+                return
+
+    def cerrar(self):
+        """Confirma lo pendiente, detiene el hilo escritor y cierra la base de datos."""
+        with self.condicion:
+            self.activo = False
+            self.condicion.notify()
+        if self.hilo is not None:
+            self.hilo.join()
+        with self.candado_bd:
+            self.conexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -0,0 +1,368 @@
+from array import array
+
+import numpy as np
+
+from juego import ALFABETO, EstadoJuego
+
+# Los puntos mayores caen en la última casilla del histograma
+MAXIMO_PUNTOS = 1023
+COLUMNAS_CONTADORES = ("partidas", "victorias", "suma_errores", "suma_puntos",
+                       "intentos_palabra", "fuera_de_tiempo")
+
+
+class CatalogoPalabras:
+    """
+    Ids densos de temas y de palabras, con cada palabra identificada por (tema, palabra).
+
+    Construido a partir de un `GestorPalabras`, los ids siguen el orden de sus temas
+    y palabras, de modo que catálogos construidos en distintos procesos con el mismo
+    corpus asignan los mismos ids. Las palabras desconocidas se agregan al final.
+
+    Attributes:
+        temas (list): Nombre de cada tema, por id.
+        claves (list): (id de tema, palabra) de cada palabra, por id.
+        tema_de_palabra (array): Id de tema de cada palabra.
+    """
+
+    def __init__(self):
+        self.temas = []
+        self.id_tema = {}
+        self.claves = []
+        self.id_palabra = {}
+        self.tema_de_palabra = array('q')
+
+    @classmethod
+    def desde_gestor(cls, gestor):
+        """
+        Args:
+            gestor (GestorPalabras): El gestor con los temas y palabras.
+
+        Returns:
+            CatalogoPalabras: El catálogo con todas sus palabras.
+        """
+        catalogo = cls()
+        for tema in gestor.obtener_temas():
+            for palabra in gestor.opciones[tema]:
+                catalogo.internar(tema, palabra)
+        return catalogo
+
+    def internar_tema(self, tema):
+        """Id de un tema, agregándolo si no existe."""
+        id_tema = self.id_tema.get(tema)
+        if id_tema is None:
+            id_tema = self.id_tema[tema] = len(self.temas)
+            self.temas.append(tema)
+        return id_tema
+
+    def internar(self, tema, palabra):
+        """
+        Args:
+            tema (str): El tema.
+            palabra (str): La palabra.
+
+        Returns:
+            int: Id de la palabra en ese tema, agregándola si no existe.
+        """
+        clave = (self.internar_tema(tema), palabra)
+        id_palabra = self.id_palabra.get(clave)
+        if id_palabra is None:
+            id_palabra = self.id_palabra[clave] = len(self.claves)
+            self.claves.append(clave)
+            self.tema_de_palabra.append(clave[0])
+        return id_palabra
+
+    def __len__(self):
+        return len(self.claves)
+
+    def temas_de(self, palabras):
+        """Id de tema de cada id de palabra, sin copiar la tabla del catálogo."""
+        return np.frombuffer(self.tema_de_palabra, dtype=np.int64)[palabras]
+
+
+def resumir_turnos(turnos):
+    """
+    Cuenta los intentos de palabra completa de una partida.
+
+    Args:
+        turnos (iterable): Pares (entrada del jugador, EstadoJuego del turno).
+
+    Returns:
+        tuple: (intentos de palabra completa, intentos que llegaron fuera de tiempo).
+    """
+    intentos = fuera_de_tiempo = 0
+    for entrada, estado in turnos:
+        if estado is EstadoJuego.PALABRA_FUERA_DE_TIEMPO:
+            fuera_de_tiempo += 1
+            intentos += 1
+        elif len(entrada) > 1 and estado is not EstadoJuego.LETRA_REPETIDA:
+            intentos += 1
+    return intentos, fuera_de_tiempo
+
+
+def columna_enteros(valores, cantidad, nombre):
+    """
+    Convierte una columna de un lote a int64; los None (por ejemplo, los puntos de una partida perdida) cuentan como 0.
+
+    Args:
+        valores (array): La columna.
+        cantidad (int): Partidas del lote.
+        nombre (str): Nombre de la columna, para el mensaje de error.
+
+    Returns:
+        numpy.ndarray: La columna como int64.
+
+    Raises:
+        ValueError: Si la columna no es numérica o no tiene un valor por partida.
+    """
+    arreglo = np.asarray(valores)
+    if arreglo.dtype == object:
+        arreglo = np.array([0 if valor is None else valor for valor in arreglo], dtype=object)
+    try:
+        arreglo = arreglo.astype(np.int64)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"La columna '{nombre}' no es numérica") from error
+    if arreglo.shape != (cantidad,):
+        raise ValueError(f"La columna '{nombre}' debe tener {cantidad} valores")
+    return arreglo
+
+
+class AgregadorPartidas:
+    """
+    Estadísticas por palabra y por tema de partidas terminadas, en columnas de NumPy.
+
+    Cada contador es un arreglo indexado por id de palabra (ver `CatalogoPalabras`);
+    un lote de partidas se acumula con un `bincount` por columna, sin recorrer las
+    partidas en Python. Las letras incorrectas se cuentan en una matriz
+    (palabras, letras del alfabeto) y los puntos en un histograma por tema. Los
+    totales por tema se obtienen al consultar, sumando las filas de sus palabras.
+
+    Attributes:
+        catalogo (CatalogoPalabras): Ids de temas y palabras.
+        contadores (dict): Columna (ver `COLUMNAS_CONTADORES`) -> arreglo int64 por palabra.
+        incorrectas (numpy.ndarray): Veces que cada letra fue incorrecta, por palabra.
+        puntos_tema (numpy.ndarray): Histograma de puntos de las partidas ganadas, por tema.
+        tamano_bufer (int): Partidas de `registrar` que se acumulan antes de agregarlas en lote.
+    """
+
+    def __init__(self, catalogo=None, tamano_bufer=65536):
+        self.catalogo = catalogo if catalogo is not None else CatalogoPalabras()
+        self.tamano_bufer = tamano_bufer
+        self.pendientes = []
+        capacidad = max(len(self.catalogo), 16)
+        self.contadores = {columna: np.zeros(capacidad, dtype=np.int64) for columna in COLUMNAS_CONTADORES}
+        self.incorrectas = np.zeros((capacidad, len(ALFABETO)), dtype=np.int64)
+        self.puntos_tema = np.zeros((max(len(self.catalogo.temas), 4), MAXIMO_PUNTOS + 1), dtype=np.int64)
+
+    def asegurar_capacidad(self):
+        """Agranda los arreglos, al doble, si el catálogo creció más allá de su tamaño."""
+        capacidad = len(self.contadores["partidas"])
+        if len(self.catalogo) > capacidad:
+            nueva = max(len(self.catalogo), 2 * capacidad)
+            for columna, valores in self.contadores.items():
+                self.contadores[columna] = np.concatenate((valores, np.zeros(nueva - capacidad, dtype=np.int64)))
+            self.incorrectas = np.concatenate(
+                (self.incorrectas, np.zeros((nueva - capacidad, len(ALFABETO)), dtype=np.int64)))
+        if len(self.catalogo.temas) > len(self.puntos_tema):
+            nueva = max(len(self.catalogo.temas), 2 * len(self.puntos_tema))
+            self.puntos_tema = np.concatenate(
+                (self.puntos_tema, np.zeros((nueva - len(self.puntos_tema), MAXIMO_PUNTOS + 1), dtype=np.int64)))
+
+    def agregar_lote(self, palabras, ganadas, errores, puntos, mascaras_incorrectas,
+                     intentos_palabra=None, fuera_de_tiempo=None):
+        """
+        Acumula un lote de partidas dado en columnas, una posición por partida.
+
+        Args:
+            palabras (array): Id de palabra de cada partida (ver `CatalogoPalabras.internar`).
+            ganadas (array): Si se ganó cada partida.
+            errores (array): Errores de cada partida.
+            puntos (array): Puntos de `calcular_puntos` de cada partida; None cuenta como 0.
+            mascaras_incorrectas (array): `Juego.mascara_incorrectas` de cada partida.
+            intentos_palabra (array, optional): Intentos de palabra completa de cada partida.
+            fuera_de_tiempo (array, optional): Intentos fuera de tiempo de cada partida.
+
+        Raises:
+            ValueError: Si una columna no es numérica, no tiene un valor por partida o
+                hay ids fuera del catálogo; en ese caso no se suma nada.
+        """
+        # Todo se valida y se calcula antes de sumar: un lote inválido no deja contadores a medias
+        palabras = np.asarray(palabras)
+        cantidad = len(palabras)
+        palabras = columna_enteros(palabras, cantidad, "palabras").astype(np.intp)
+        if cantidad and (palabras.min() < 0 or palabras.max() >= len(self.catalogo)):
+            raise ValueError("Hay ids de palabra que no están en el catálogo")
+        ganadas = columna_enteros(ganadas, cantidad, "ganadas") != 0
+        mascaras = columna_enteros(mascaras_incorrectas, cantidad, "mascaras_incorrectas")
+        columnas = {"partidas": None, "victorias": ganadas}
+        for columna, pesos in (("suma_errores", errores), ("suma_puntos", puntos),
+                               ("intentos_palabra", intentos_palabra), ("fuera_de_tiempo", fuera_de_tiempo)):
+            if pesos is not None:
+                columnas[columna] = columna_enteros(pesos, cantidad, columna)
+
+        self.asegurar_capacidad()
+        capacidad = len(self.contadores["partidas"])
+        sumas = {columna: np.bincount(palabras, weights=pesos, minlength=capacidad).astype(np.int64)
+                 for columna, pesos in columnas.items()}
+
+        con_errores = mascaras != 0
+        palabras_con_errores, mascaras = palabras[con_errores], mascaras[con_errores]
+        incorrectas = {}
+        for letra in range(len(ALFABETO)):
+            con_letra = palabras_con_errores[(mascaras & (1 << letra)) != 0]
+            if len(con_letra):
+                incorrectas[letra] = np.bincount(con_letra, minlength=capacidad)
+
+        temas = self.catalogo.temas_de(palabras[ganadas])
+        casillas = np.clip(columnas["suma_puntos"][ganadas], 0, MAXIMO_PUNTOS)
+        histograma = np.bincount(temas * (MAXIMO_PUNTOS + 1) + casillas,
+                                 minlength=self.puntos_tema.size).reshape(self.puntos_tema.shape)
+
+        for columna, suma in sumas.items():
+            self.contadores[columna] += suma
+        for letra, suma in incorrectas.items():
+            self.incorrectas[:, letra] += suma
+        self.puntos_tema += histograma
+
+    def registrar(self, tema, juego, gano, puntos, intentos_palabra=0, fuera_de_tiempo=0):
+        """
+        Acumula una partida terminada; se agrega en lote al llenarse el búfer o al consultar.
+
+        Args:
+            tema (str): El tema de la partida.
+            juego (Juego): La partida terminada.
+            gano (bool): Si el jugador ganó.
+            puntos (int): Los puntos de la partida; None (partida perdida) cuenta como 0.
+            intentos_palabra (int): Intentos de palabra completa (ver `resumir_turnos`).
+            fuera_de_tiempo (int): Intentos de palabra completa fuera de tiempo.
+        """
+        self.pendientes.append((self.catalogo.internar(tema, juego.palabra), gano, juego.errores, puntos,
+                                juego.mascara_incorrectas, intentos_palabra, fuera_de_tiempo))
+        if len(self.pendientes) >= self.tamano_bufer:
+            self.vaciar()
+
+    def vaciar(self):
+        """Agrega en lote las partidas pendientes de `registrar`; si falla, siguen pendientes."""
+        if self.pendientes:
+            lote, self.pendientes = self.pendientes, []
+            try:
+                self.agregar_lote(*zip(*lote))
+            except BaseException:
+                self.pendientes = lote + self.pendientes
+                raise
+
+    def fusionar(self, otro):
+        """
+        Suma a este agregador los contadores de otro, por ejemplo el de otro proceso.
+
+        Los ids del otro se traducen por (tema, palabra); si ambos catálogos
+        provienen del mismo corpus la traducción es la identidad.
+
+        Args:
+            otro (AgregadorPartidas): El agregador a incorporar.
+        """
+        otro.vaciar()
+        self.vaciar()
+        temas_otro = otro.catalogo.temas
+        mapa = np.fromiter((self.catalogo.internar(temas_otro[id_tema], palabra)
+                            for id_tema, palabra in otro.catalogo.claves),
+                           dtype=np.intp, count=len(otro.catalogo))
+        mapa_temas = np.fromiter((self.catalogo.internar_tema(tema) for tema in temas_otro),
+                                 dtype=np.intp, count=len(temas_otro))
+        self.asegurar_capacidad()
+        cantidad = len(mapa)
+        # Ambos mapas son inyectivos, así que la suma indexada no pierde repetidos
+        for columna, valores in self.contadores.items():
+            valores[mapa] += otro.contadores[columna][:cantidad]
+        self.incorrectas[mapa] += otro.incorrectas[:cantidad]
+        self.puntos_tema[mapa_temas] += otro.puntos_tema[:len(mapa_temas)]
+
+    def por_palabra(self, minimo_partidas=1):
+        """
+        Estadísticas de cada palabra con al menos `minimo_partidas` partidas.
+
+        Returns:
+            dict: Columnas de NumPy: id, partidas, tasa_victorias, errores_promedio,
+                puntos_promedio (de las ganadas), riesgo_palabra (intentos de palabra
+                completa por partida), tasa_fuera_de_tiempo (por intento) y
+                letra_incorrecta (la más común, o "" si no hubo).
+        """
+        self.vaciar()
+        cantidad = len(self.catalogo)
+        columnas = {columna: valores[:cantidad] for columna, valores in self.contadores.items()}
+        ids = np.flatnonzero(columnas["partidas"] >= max(minimo_partidas, 1))
+        resultado = self.calcular_tasas({columna: valores[ids] for columna, valores in columnas.items()})
+        incorrectas = self.incorrectas[ids]
+        letras = np.array(list(ALFABETO) + [""])
+        mas_comun = np.where(incorrectas.max(axis=1, initial=0) > 0, incorrectas.argmax(axis=1), len(ALFABETO))
+        resultado["id"] = ids
+        resultado["letra_incorrecta"] = letras[mas_comun]
+        return resultado
+
+    def por_tema(self):
+        """
+        Estadísticas de cada tema, sumando las de sus palabras.
+
+        Returns:
+            dict: Columnas de NumPy: tema (nombre), partidas, tasa_victorias,
+                errores_promedio, puntos_promedio, riesgo_palabra y tasa_fuera_de_tiempo.
+        """
+        self.vaciar()
+        cantidad = len(self.catalogo)
+        temas = self.catalogo.temas_de(slice(None))
+        columnas = {columna: np.bincount(temas, weights=valores[:cantidad],
+                                         minlength=len(self.catalogo.temas)).astype(np.int64)
+                    for columna, valores in self.contadores.items()}
+        resultado = self.calcular_tasas(columnas)
+        resultado["tema"] = np.array(self.catalogo.temas, dtype=object)
+        return resultado
+
+    @staticmethod
+    def calcular_tasas(columnas):
+        """Convierte contadores agrupados en tasas y promedios."""
+        partidas = columnas["partidas"]
+        victorias = columnas["victorias"]
+        intentos = columnas["intentos_palabra"]
+        return {"partidas": partidas,
+                "tasa_victorias": np.divide(victorias, partidas, out=np.zeros(len(partidas)), where=partidas > 0),
+                "errores_promedio": np.divide(columnas["suma_errores"], partidas,
+                                              out=np.zeros(len(partidas)), where=partidas > 0),
+                "puntos_promedio": np.divide(columnas["suma_puntos"], victorias,
+                                             out=np.zeros(len(partidas)), where=victorias > 0),
+                "riesgo_palabra": np.divide(intentos, partidas, out=np.zeros(len(partidas)), where=partidas > 0),
+                "tasa_fuera_de_tiempo": np.divide(columnas["fuera_de_tiempo"], intentos,
+                                                  out=np.zeros(len(partidas)), where=intentos > 0)}
+
+    def letras_incorrectas(self, tema, palabra, cantidad=3):
+        """
+        Args:
+            tema (str): El tema.
+            palabra (str): La palabra.
+            cantidad (int): Cuántas letras devolver.
+
+        Returns:
+            list: Pares (letra, veces) de las letras incorrectas más comunes con esa palabra.
+        """
+        self.vaciar()
+        id_palabra = self.catalogo.id_palabra.get((self.catalogo.id_tema.get(tema), palabra))
+        if id_palabra is None:
+            return []
+        fila = self.incorrectas[id_palabra]
+        orden = np.argsort(-fila, kind="stable")[:cantidad]
+        return [(ALFABETO[letra], int(fila[letra])) for letra in orden if fila[letra] > 0]
+
+    def distribucion_puntos(self, tema=None):
+        """
+        Args:
+            tema (str, optional): El tema; por defecto, todos.
+
+        Returns:
+            dict: Puntos -> partidas ganadas con esos puntos (`MAXIMO_PUNTOS` incluye los mayores).
+        """
+        self.vaciar()
+        if tema is None:
+            histograma = self.puntos_tema.sum(axis=0)
+        elif tema in self.catalogo.id_tema:
+            histograma = self.puntos_tema[self.catalogo.id_tema[tema]]
+        else:
+            return {}
+        return {int(puntos): int(histograma[puntos]) for puntos in np.flatnonzero(histograma)}
@@ -0,0 +1,581 @@
+import argparse
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from juego import Juego, EstadoJuego, PUNTOS_POR_SEGUNDO, escribir_varint, leer_varint
+
+MAGIA = b"AHBITAC3"
+# Tras la magia, cada segmento guarda el siguiente id de sesión libre al abrirse (8 bytes)
+TAMANO_CABECERA = len(MAGIA) + 8
+EXTENSION = ".bit"
+# Tipos de registro además de los turnos: inicio de partida con su palabra y
+# partida retomada a partir de su estado serializado con `Juego.to_bytes`
+INICIO = 0
+ESTADO = 0xFF
+# Código de un byte de cada EstadoJuego; no deben cambiar una vez escritos
+CODIGO_ESTADO = {
+    EstadoJuego.LETRA_REPETIDA: 1,
+    EstadoJuego.SEGUIR_JUGANDO: 2,
+    EstadoJuego.LETRA_INCORRECTA: 3,
+    EstadoJuego.LETRAS_COMPLETAS: 4,
+    EstadoJuego.PALABRA_CORRECTA: 5,
+    EstadoJuego.PALABRA_FUERA_DE_TIEMPO: 6,
+    EstadoJuego.TIEMPO_AGOTADO: 7,
+}
+ESTADO_CODIGO = {codigo: estado for estado, codigo in CODIGO_ESTADO.items()}
+# Un turno agotado no tiene entrada: se repite con `Juego.procesar_expiracion`
+TIEMPO_AGOTADO = CODIGO_ESTADO[EstadoJuego.TIEMPO_AGOTADO]
+# Los turnos ganadores guardan antes de la entrada los puntos otorgados y los
+# segundos completos que sobraron (varints), para verificar también el bono de tiempo
+CODIGOS_GANADORES = frozenset((CODIGO_ESTADO[EstadoJuego.LETRAS_COMPLETAS],
+                               CODIGO_ESTADO[EstadoJuego.PALABRA_CORRECTA]))
+
+registro = logging.getLogger(__name__)
+
+
+def codificar_registro(buffer, codigo, id_sesion, datos):
+    """Agrega un registro al búfer: código, id de sesión (varint), longitud (varint) y datos."""
+    buffer.append(codigo)
+    escribir_varint(buffer, id_sesion)
+    escribir_varint(buffer, len(datos))
+    buffer += datos
+
+
+def leer_registros(datos, posicion=TAMANO_CABECERA):
+    """
+    Decodifica los registros completos de un segmento.
+
+    Un registro cortado al final (por ejemplo, por una caída durante la escritura) se ignora.
+
+    Args:
+        datos (bytes): El contenido del segmento.
+        posicion (int): Dónde empieza el primer registro.
+
+    Yields:
+        tuple: (código, id de sesión, datos del registro, posición siguiente).
+    """
+    total = len(datos)
+    while posicion < total:
+        try:
+            codigo = datos[posicion]
+            id_sesion = datos[posicion + 1]
+            if id_sesion < 0x80:
+                posicion += 2
+            else:
+                id_sesion, posicion = leer_varint(datos, posicion + 1)
+            longitud = datos[posicion]
+            if longitud < 0x80:
+                posicion += 1
+            else:
+                longitud, posicion = leer_varint(datos, posicion)
+        except IndexError:
+            return
+        fin = posicion + longitud
+        if fin > total:
+            return
+        yield codigo, id_sesion, datos[posicion:fin], fin
+        posicion = fin
+
+
+def decodificar_turno(codigo, contenido):
+    """
+    Separa los datos de un registro de turno.
+
+    Args:
+        codigo (int): El código del registro.
+        contenido (bytes): Los datos del registro.
+
+    Returns:
+        tuple: (entrada del jugador, puntos otorgados, segundos sobrantes); los
+            puntos son None si el turno no es ganador.
+    """
+    if codigo not in CODIGOS_GANADORES:
+        return contenido.decode('utf-8'), None, 0
+    puntos, posicion = leer_varint(contenido, 0)
+    segundos, posicion = leer_varint(contenido, posicion)
+    return contenido[posicion:].decode('utf-8'), puntos, segundos
+
+
+def es_segmento(datos):
+    """bool: Si los datos empiezan con una cabecera de segmento completa."""
+    return datos.startswith(MAGIA) and len(datos) >= TAMANO_CABECERA
+
+
+def siguiente_id_segmento(datos):
+    """
+    Args:
+        datos (bytes): El contenido de un segmento con cabecera completa.
+
+    Returns:
+        tuple: El siguiente id de sesión libre tras el segmento y dónde termina su último registro completo.
+    """
+    siguiente = int.from_bytes(datos[len(MAGIA):TAMANO_CABECERA], 'little')
+    fin = TAMANO_CABECERA
+    for _, id_sesion, _, fin in leer_registros(datos):
+        siguiente = max(siguiente, id_sesion + 1)
+    return siguiente, fin
+
+
+class Bitacora:
+    """
+    Registro binario de solo agregado con cada turno de cada partida.
+
+    Cada registro ocupa un byte de código (el `EstadoJuego` resultante del turno,
+    o el inicio de una partida), el id de sesión y la longitud como varint, y la
+    entrada del jugador (o la palabra) en UTF-8: un turno de una letra ocupa entre 4 y 6 bytes.
+    Los turnos ganadores agregan además los puntos otorgados y los segundos sobrantes.
+    Los registros se acumulan en memoria y un hilo escritor los escribe en
+    segmentos que rotan al alcanzar `tamano_segmento` y los sincroniza a disco
+    cada `intervalo_fsync` segundos, así que registrar un turno nunca espera al
+    disco (ni bloquea el bucle de `ServidorAhorcado`). Cada segmento empieza con el
+    siguiente id de sesión libre al abrirlo, de modo que al reabrir la bitácora
+    basta leer el último segmento para no repetir ids.
+
+    Attributes:
+        directorio (str): Carpeta de los segmentos.
+        tamano_segmento (int): Bytes a partir de los cuales se abre un segmento nuevo.
+        intervalo_fsync (float): Segundos máximos entre sincronizaciones a disco.
+        tamano_bufer (int): Bytes acumulados que fuerzan una escritura al segmento.
+        siguiente_id (int): Próximo id de sesión que asigna `iniciar`.
+    """
+
+    def __init__(self, directorio, tamano_segmento=64 * 1024 * 1024, intervalo_fsync=1.0,
+                 tamano_bufer=64 * 1024):
+        self.directorio = directorio
+        self.tamano_segmento = tamano_segmento
+        self.intervalo_fsync = intervalo_fsync
+        self.tamano_bufer = tamano_bufer
+        self.bufer = bytearray()
+        # Búferes llenos que esperan al hilo escritor, en orden
+        self.bloques = []
+        self.ultimo_fsync = time.monotonic()
+        os.makedirs(directorio, exist_ok=True)
+        self.siguiente_id = 0
+        self.archivo = None
+        segmentos = listar_segmentos(directorio)
+        if segmentos:
+            self.recuperar(segmentos)
+        else:
+            self.abrir_segmento(0)
+        self.condicion = threading.Condition()
+        self.activo = True
+        self.hilo = threading.Thread(target=self.escribir_en_segundo_plano, daemon=True)
+        self.hilo.start()
+
+    def recuperar(self, segmentos):
+        """
+        Reabre el último segmento: recorta un registro final incompleto y
+        recupera el siguiente id de sesión libre de su cabecera y sus registros.
+
+        Args:
+            segmentos (list): Rutas de los segmentos existentes, en orden.
+        """
+        ruta = segmentos[-1]
+        with open(ruta, mode='rb') as archivo:
+            datos = archivo.read()
+        if not es_segmento(datos):
+            # Cortado al crearse: el segmento anterior se cerró completo y tiene los ids previos
+            if len(segmentos) > 1:
+                with open(segmentos[-2], mode='rb') as archivo:
+                    anterior = archivo.read()
+                if es_segmento(anterior):
+                    self.siguiente_id = siguiente_id_segmento(anterior)[0]
+            self.abrir_segmento(numero_de_segmento(ruta))
+            return
+        self.siguiente_id, fin = siguiente_id_segmento(datos)
+        self.numero_segmento = numero_de_segmento(ruta)
+        self.archivo = open(ruta, mode='r+b')
+        self.archivo.truncate(fin)
+        self.archivo.seek(0, os.SEEK_END)
+        self.tamano_actual = self.archivo.tell()
+
+    def abrir_segmento(self, numero):
+        """Cierra el segmento actual, si lo hay, y empieza el segmento `numero`."""
+        if self.archivo is not None:
+            self.archivo.flush()
+            os.fsync(self.archivo.fileno())
+            self.archivo.close()
+        self.numero_segmento = numero
+        self.archivo = open(os.path.join(self.directorio, f"{numero:08d}{EXTENSION}"), mode='wb')
+        # Los ids de los bloques aún sin escribir ya se asignaron: son menores que éste
+        self.archivo.write(MAGIA + self.siguiente_id.to_bytes(8, 'little'))
+        self.tamano_actual = TAMANO_CABECERA
+
+    def agregar(self, codigo, id_sesion, datos):
+        """Agrega un registro al búfer; si se llena, lo pasa al hilo escritor."""
+        with self.condicion:
+            codificar_registro(self.bufer, codigo, id_sesion, datos)
+            if len(self.bufer) >= self.tamano_bufer:
+                self.bloques.append(self.bufer)
+                self.bufer = bytearray()
+                self.condicion.notify()
+
+    def iniciar(self, palabra, id_sesion=None):
+        """
+        Registra el inicio de una partida.
+
+        Args:
+            palabra (str): La palabra a adivinar.
+            id_sesion (int, optional): Id de la partida; por defecto se asigna uno nuevo.
+
+        Returns:
+            int: El id de la partida.
+        """
+        if id_sesion is None:
+            id_sesion = self.siguiente_id
+        self.siguiente_id = max(self.siguiente_id, id_sesion + 1)
+        self.agregar(INICIO, id_sesion, palabra.encode('utf-8'))
+        return id_sesion
+
+    def retomar(self, juego, id_sesion=None):
+        """
+        Registra una partida retomada (por ejemplo, desde `AlmacenSesiones`) con su estado actual.
+
+        Returns:
+            int: El id con el que se registrarán sus turnos.
+        """
+        if id_sesion is None:
+            id_sesion = self.siguiente_id
+        self.siguiente_id = max(self.siguiente_id, id_sesion + 1)
+        self.agregar(ESTADO, id_sesion, juego.to_bytes())
+        return id_sesion
+
+    def registrar(self, id_sesion, entrada_usuario, estado, puntos=0, segundos_restantes=0):
+        """
+        Registra un turno.
+
+        Args:
+            id_sesion (int): Id de la partida.
+            entrada_usuario (str): La entrada del jugador tal como se pasó a `jugar_turno`.
+            estado (EstadoJuego): El resultado del turno.
+            puntos (int): Los puntos otorgados al jugador, con el bono de tiempo incluido.
+            segundos_restantes (float): Los segundos que sobraron al ganar en el modo cronometrado.
+        """
+        codigo = CODIGO_ESTADO[estado]
+        datos = entrada_usuario.encode('utf-8')
+        if codigo in CODIGOS_GANADORES:
+            prefijo = bytearray()
+            escribir_varint(prefijo, puntos)
+            escribir_varint(prefijo, int(max(segundos_restantes, 0)))
+            datos = bytes(prefijo) + datos
+        self.agregar(codigo, id_sesion, datos)
+
+    def escribir(self, bloque):
+        """Escribe un bloque de registros en el segmento actual, rotando antes si éste está lleno."""
+        if not bloque:
+            return
+        if self.tamano_actual >= self.tamano_segmento:
+            self.abrir_segmento(self.numero_segmento + 1)
+        self.archivo.write(bloque)
+        self.tamano_actual += len(bloque)
+
+    def sincronizar(self):
+        """Sincroniza el segmento actual a disco."""
+        self.archivo.flush()
+        os.fsync(self.archivo.fileno())
+        self.ultimo_fsync = time.monotonic()
+
+    def escribir_en_segundo_plano(self):
+        """Bucle del hilo escritor: escribe los búferes llenos y sincroniza cada `intervalo_fsync` segundos."""
+        while True:
+            with self.condicion:
+                espera = self.intervalo_fsync - (time.monotonic() - self.ultimo_fsync)
+                if self.activo and not self.bloques and espera > 0:
+                    self.condicion.wait(espera)
+                activo = self.activo
+                bloques, self.bloques = self.bloques, []
+                toca_fsync = not activo or time.monotonic() - self.ultimo_fsync >= self.intervalo_fsync
+                if toca_fsync:
+                    bloques.append(self.bufer)
+                    self.bufer = bytearray()
+            try:
+                for bloque in bloques:
+                    self.escribir(bloque)
+                if toca_fsync:
+                    self.sincronizar()
+            except OSError:
+                registro.exception("No se pudo escribir la bitácora en %s", self.directorio)
+            if not activo:
+                return
+
+    def cerrar(self):
+        """Detiene el hilo escritor, que escribe y sincroniza lo pendiente, y cierra el segmento actual."""
+        with self.condicion:
+            self.activo = False
+            self.condicion.notify()
+        self.hilo.join()
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def numero_de_segmento(ruta):
+    """Número de un segmento a partir del nombre de su archivo."""
+    return int(os.path.basename(ruta)[:-len(EXTENSION)])
+
+
+def listar_segmentos(directorio):
+    """
+    Returns:
+        list: Rutas de los segmentos de la bitácora, en orden.
+    """
+    nombres = sorted(nombre for nombre in os.listdir(directorio)
+                     if nombre.endswith(EXTENSION) and nombre[:-len(EXTENSION)].isdigit())
+    return [os.path.join(directorio, nombre) for nombre in nombres]
+
+
+def leer_bitacora(directorio):
+    """
+    Recorre los registros de todos los segmentos, de a un segmento en memoria.
+
+    Yields:
+        tuple: (código, id de sesión, datos del registro).
+
+    Raises:
+        ValueError: Si un archivo no es un segmento de bitácora.
+    """
+    return leer_segmentos(listar_segmentos(directorio))
+
+
+def leer_segmentos(rutas):
+    """
+    Recorre los registros de los segmentos dados, en orden y de a uno en memoria.
+
+    Yields:
+        tuple: (código, id de sesión, datos del registro).
+
+    Raises:
+        ValueError: Si un archivo no es un segmento de bitácora.
+    """
+    for ruta in rutas:
+        with open(ruta, mode='rb') as archivo:
+            datos = archivo.read()
+        if not es_segmento(datos):
+            raise ValueError(f"{ruta} no es un segmento de bitácora")
+        for codigo, id_sesion, contenido, _ in leer_registros(datos):
+            yield codigo, id_sesion, contenido
+
+
+class Verificacion:
+    """
+    Repite las partidas registro por registro y acumula lo que no coincide.
+
+    Cada turno debe producir el estado registrado y, si gana, los puntos
+    registrados: los de `Juego.calcular_puntos` más el bono por los segundos
+    sobrantes. Las partidas se descartan de memoria al terminar, de modo que solo
+    se mantienen las que siguen en curso.
+
+    Attributes:
+        juegos (dict): Id -> [Juego, número de turno] de las partidas en curso.
+        partidas (int): Partidas iniciadas o retomadas.
+        turnos (int): Turnos repetidos.
+        puntos (dict): Id -> puntos de las partidas ganadas.
+        discrepancias (list): Tuplas (id, número de turno, registrado, obtenido), con
+            estados o, si el estado coincide, puntos.
+    """
+
+    def __init__(self):
+        self.juegos = {}
+        self.partidas = 0
+        self.turnos = 0
+        self.puntos = {}
+        self.discrepancias = []
+
+    def repetir(self, codigo, id_sesion, contenido):
+        """Repite un registro de la bitácora."""
+        if codigo == INICIO or codigo == ESTADO:
+            juego = Juego(contenido.decode('utf-8')) if codigo == INICIO else Juego.from_bytes(contenido)
+            self.juegos[id_sesion] = [juego, 0]
+            self.partidas += 1
+            return
+        en_curso = self.juegos.get(id_sesion)
+        if en_curso is None:
+            self.discrepancias.append((id_sesion, None, ESTADO_CODIGO.get(codigo), None))
+            return
+        juego = en_curso[0]
+        if codigo == TIEMPO_AGOTADO:
+            estado, puntos = juego.procesar_expiracion()
+            registrados = None
+        else:
+            entrada, registrados, segundos = decodificar_turno(codigo, contenido)
+            estado, puntos = juego.procesar_turno(entrada)
+        self.turnos += 1
+        en_curso[1] += 1
+        if CODIGO_ESTADO[estado] != codigo:
+            self.discrepancias.append((id_sesion, en_curso[1], ESTADO_CODIGO.get(codigo), estado))
+        elif registrados is not None:
+            puntos += segundos * PUNTOS_POR_SEGUNDO
+            if puntos != registrados:
+                self.discrepancias.append((id_sesion, en_curso[1], registrados, puntos))
+        if puntos:
+            self.puntos[id_sesion] = puntos
+        if puntos or juego.errores >= juego.intentos_max:
+            del self.juegos[id_sesion]
+
+    def continuar(self, parcial):
+        """
+        Continúa con el resultado de `verificar_segmentos` del tramo siguiente.
+
+        Primero repite los registros del tramo que siguen partidas en curso de los
+        tramos anteriores; luego descarta las partidas que el tramo vuelve a
+        iniciar y adopta las que deja en curso.
+
+        Args:
+            parcial (tuple): (Verificacion, pendientes, iniciadas) del tramo.
+        """
+        verificacion, pendientes, iniciadas = parcial
+        for id_sesion, registros in pendientes.items():
+            for codigo, contenido in registros:
+                self.repetir(codigo, id_sesion, contenido)
+        for id_sesion in iniciadas:
+            self.juegos.pop(id_sesion, None)
+        self.juegos.update(verificacion.juegos)
+        self.partidas += verificacion.partidas
+        self.turnos += verificacion.turnos
+        self.puntos.update(verificacion.puntos)
+        self.discrepancias += verificacion.discrepancias
+
+    def resultado(self):
+        """
+        Returns:
+            dict: partidas, turnos, puntos y discrepancias.
+        """
+        return {"partidas": self.partidas, "turnos": self.turnos, "puntos": self.puntos,
+                "discrepancias": self.discrepancias}
+
+
+def verificar_segmentos(rutas):
+    """
+    Repite las partidas de un tramo contiguo de segmentos.
+
+    Los turnos de partidas que no se iniciaron en el tramo no se pueden repetir
+    aquí: se devuelven aparte, en orden, para que `Verificacion.continuar` los
+    repita con las partidas que dejaron en curso los tramos anteriores.
+
+    Args:
+        rutas (list): Rutas de los segmentos del tramo, en orden.
+
+    Returns:
+        tuple: (Verificacion del tramo, id -> [(código, datos)] de los turnos de
+            partidas anteriores al tramo, set de ids iniciados en el tramo).
+    """
+    verificacion = Verificacion()
+    pendientes = {}
+    iniciadas = set()
+    for codigo, id_sesion, contenido in leer_segmentos(rutas):
+        if codigo == INICIO or codigo == ESTADO:
+            iniciadas.add(id_sesion)
+        elif id_sesion not in iniciadas:
+            pendientes.setdefault(id_sesion, []).append((codigo, contenido))
+            continue
+        verificacion.repetir(codigo, id_sesion, contenido)
+    return verificacion, pendientes, iniciadas
+
+
+def repartir_segmentos(segmentos, tramos):
+    """
+    Returns:
+        list: A lo sumo `tramos` listas contiguas y no vacías de segmentos, de tamaños parecidos.
+    """
+    tramos = max(1, min(tramos, len(segmentos)))
+    return [segmentos[len(segmentos) * numero // tramos:len(segmentos) * (numero + 1) // tramos]
+            for numero in range(tramos)]
+
+
+class Reproductor:
+    """
+    Reconstruye partidas a partir de la bitácora, sin interfaz.
+
+    Attributes:
+        directorio (str): Carpeta de los segmentos.
+        turnos (int): Turnos reproducidos en la última ejecución.
+    """
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        self.turnos = 0
+
+    def reconstruir(self, id_sesion):
+        """
+        Reconstruye el estado final de una partida; solo se repiten los turnos de esa partida.
+
+        Args:
+            id_sesion (int): Id de la partida.
+
+        Returns:
+            Juego: La partida tras su último turno registrado, o None si no existe.
+        """
+        juego = None
+        self.turnos = 0
+        for codigo, id_registro, contenido in leer_bitacora(self.directorio):
+            if id_registro != id_sesion:
+                continue
+            if codigo == INICIO:
+                juego = Juego(contenido.decode('utf-8'))
+            elif codigo == ESTADO:
+                juego = Juego.from_bytes(contenido)
+            elif juego is not None:
+                if codigo == TIEMPO_AGOTADO:
+                    juego.procesar_expiracion()
+                else:
+                    juego.procesar_turno(decodificar_turno(codigo, contenido)[0])
+                self.turnos += 1
+        return juego
+
+    def verificar(self, procesos=1):
+        """
+        Repite todas las partidas y comprueba sus estados y puntos.
+
+        Con varios procesos, cada uno lee y repite un tramo contiguo de segmentos
+        (el trabajo no se reparte entre más procesos que segmentos); las partidas
+        que cruzan de un tramo al siguiente se completan luego, en orden.
+
+        Args:
+            procesos (int): Procesos entre los que se reparten los segmentos.
+
+        Returns:
+            dict: partidas, turnos, puntos (id -> puntos de las partidas ganadas) y
+                discrepancias (ver `Verificacion`).
+        """
+        tramos = repartir_segmentos(listar_segmentos(self.directorio), procesos)
+        if len(tramos) <= 1:
+            parciales = [verificar_segmentos(tramo) for tramo in tramos]
+        else:
+            with ProcessPoolExecutor(max_workers=len(tramos)) as ejecutor:
+                parciales = list(ejecutor.map(verificar_segmentos, tramos))
+        verificacion = Verificacion()
+        for parcial in parciales:
+            verificacion.continuar(parcial)
+        self.turnos = verificacion.turnos
+        return verificacion.resultado()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Repite las partidas de una bitácora y verifica sus resultados.")
+    parser.add_argument("directorio", help="Carpeta de los segmentos de la bitácora")
+    parser.add_argument("--procesos", type=int, default=1, help="Procesos entre los que se reparten los segmentos")
+    parser.add_argument("--partida", type=int, default=None, help="Muestra el estado final de una sola partida")
+    argumentos = parser.parse_args()
+
+    reproductor = Reproductor(argumentos.directorio)
+    if argumentos.partida is not None:
+        juego = reproductor.reconstruir(argumentos.partida)
+        if juego is None:
+            print(f"La partida {argumentos.partida} no existe")
+        else:
+            print(f"{juego.palabra}: {juego.avance}  errores: {juego.errores}  turnos: {reproductor.turnos}")
+    else:
+        inicio = time.perf_counter()
+        resultado = reproductor.verificar(argumentos.procesos)
+        segundos = time.perf_counter() - inicio
+        print(f"Partidas: {resultado['partidas']}  turnos: {resultado['turnos']}  "
+              f"ganadas: {len(resultado['puntos'])}  discrepancias: {len(resultado['discrepancias'])}")
+        print(f"{segundos:.2f} s, {resultado['turnos'] / segundos if segundos else 0.0:,.0f} turnos/s")
+        for id_sesion, turno, registrado, obtenido in resultado["discrepancias"][:20]:
+            print(f"  partida {id_sesion}, turno {turno}: registrado {registrado}, obtenido {obtenido}")
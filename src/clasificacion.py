@@ -0,0 +1,381 @@
+import random
+from almacen_grupo import AlmacenEnGrupo
+
+# Tema con el que se guarda la clasificación global
+GLOBAL = ""
+MAX_NIVELES = 24
+
+
+class NodoSaltos:
+    """Nodo de `ListaSaltos`; `anchos[n]` es la distancia hasta el siguiente nodo del nivel n."""
+    __slots__ = ("clave", "valor", "siguientes", "anchos")
+
+    def __init__(self, clave, valor, niveles):
+        self.clave = clave
+        self.valor = valor
+        self.siguientes = [None] * niveles
+        self.anchos = [1] * niveles
+
+
+class ListaSaltos:
+    """
+    Lista de saltos indexable: mantiene sus claves ordenadas de menor a mayor con
+    inserción, eliminación, posición de una clave y acceso por posición en O(log n).
+
+    Attributes:
+        cabeza (NodoSaltos): Nodo centinela anterior al primer elemento.
+        cola (NodoSaltos): Último nodo, o None si la lista está vacía.
+        niveles (int): Niveles en uso; los superiores están vacíos y no se recorren.
+        longitud (int): Cantidad de elementos.
+    """
+
+    def __init__(self, semilla=None):
+        self.cabeza = NodoSaltos(None, None, MAX_NIVELES)
+        self.cola = None
+        self.niveles = 1
+        self.longitud = 0
+        self.aleatorio = random.Random(semilla)
+
+    def __len__(self):
+        return self.longitud
+
+    def buscar_previos(self, clave):
+        """
+        Recorre la lista hasta justo antes de `clave` en cada nivel.
+
+        Returns:
+            tuple: Los nodos previos y sus posiciones (la cabeza es la posición 0), por nivel.
+        """
+        previos = [self.cabeza] * MAX_NIVELES
+        posiciones = [0] * MAX_NIVELES
+        actual = self.cabeza
+        avance = 0
+        for nivel in reversed(range(self.niveles)):
+            siguiente = actual.siguientes[nivel]
+            while siguiente is not None and siguiente.clave < clave:
+                avance += actual.anchos[nivel]
+                actual = siguiente
+                siguiente = actual.siguientes[nivel]
+            previos[nivel] = actual
+            posiciones[nivel] = avance
+        return previos, posiciones
+
+    def insertar(self, clave, valor):
+        """
+        Inserta un elemento; la clave no debe estar ya en la lista.
+
+        Args:
+            clave: Clave comparable que define el orden.
+            valor: Dato asociado a la clave.
+        """
+        niveles = 1
+        while niveles < MAX_NIVELES and self.aleatorio.getrandbits(1):
+            niveles += 1
+        nodo = NodoSaltos(clave, valor, niveles)
+        self.niveles = max(self.niveles, niveles)
+        previos, posiciones = self.buscar_previos(clave)
+        posicion = posiciones[0] + 1
+        for nivel in range(MAX_NIVELES):
+            previo = previos[nivel]
+            if nivel < niveles:
+                nodo.siguientes[nivel] = previo.siguientes[nivel]
+                previo.siguientes[nivel] = nodo
+                nodo.anchos[nivel] = previo.anchos[nivel] - (posicion - posiciones[nivel]) + 1
+                previo.anchos[nivel] = posicion - posiciones[nivel]
+            else:
+                previo.anchos[nivel] += 1
+        if nodo.siguientes[0] is None:
+            self.cola = nodo
+        self.longitud += 1
+
+    def eliminar(self, clave):
+        """
+        Elimina un elemento por su clave.
+
+        Returns:
+            El valor asociado a la clave.
+
+        Raises:
+            KeyError: Si la clave no está en la lista.
+        """
+        previos, _ = self.buscar_previos(clave)
+        nodo = previos[0].siguientes[0]
+        if nodo is None or nodo.clave != clave:
+            raise KeyError(clave)
+        for nivel in range(MAX_NIVELES):
+            previo = previos[nivel]
+            if previo.siguientes[nivel] is nodo:
+                previo.anchos[nivel] += nodo.anchos[nivel] - 1
+                previo.siguientes[nivel] = nodo.siguientes[nivel]
+            else:
+                previo.anchos[nivel] -= 1
+        if nodo is self.cola:
+            self.cola = None if previos[0] is self.cabeza else previos[0]
+        self.longitud -= 1
+        return nodo.valor
+
+    def posicion(self, clave):
+        """
+        Returns:
+            int: Posición de la clave en el orden, empezando en 0.
+
+        Raises:
+            KeyError: Si la clave no está en la lista.
+        """
+        previos, posiciones = self.buscar_previos(clave)
+        nodo = previos[0].siguientes[0]
+        if nodo is None or nodo.clave != clave:
+            raise KeyError(clave)
+        return posiciones[0]
+
+    def en_posicion(self, indice):
+        """
+        Returns:
+            tuple: La clave y el valor en la posición `indice`, empezando en 0.
+        """
+        if not 0 <= indice < self.longitud:
+            raise IndexError(indice)
+        objetivo = indice + 1
+        actual = self.cabeza
+        avance = 0
+        for nivel in reversed(range(self.niveles)):
+            while actual.siguientes[nivel] is not None and avance + actual.anchos[nivel] <= objetivo:
+                avance += actual.anchos[nivel]
+                actual = actual.siguientes[nivel]
+        return actual.clave, actual.valor
+
+    def ultimo(self):
+        """
+        Returns:
+            tuple: La clave y el valor del último elemento, en O(1).
+        """
+        if self.cola is None:
+            raise IndexError("lista vacía")
+        return self.cola.clave, self.cola.valor
+
+    def __iter__(self):
+        nodo = self.cabeza.siguientes[0]
+        while nodo is not None:
+            yield nodo.clave, nodo.valor
+            nodo = nodo.siguientes[0]
+
+
+class TablaPosiciones:
+    """
+    Las `capacidad` mejores puntuaciones, con una sola entrada (la mejor) por jugador.
+
+    A igual puntuación queda por delante quien la obtuvo primero. Registrar una
+    puntuación, consultar la posición de un jugador y leer los primeros n
+    lugares cuestan O(log K) (más O(n) para leerlos), sin recorrer todas las puntuaciones.
+
+    Attributes:
+        capacidad (int): Cantidad máxima de jugadores en la tabla.
+        lista (ListaSaltos): Entradas ordenadas por la clave (-puntos, secuencia).
+        claves (dict): Jugador -> su clave en la lista.
+    """
+
+    def __init__(self, capacidad=1000):
+        self.capacidad = capacidad
+        self.lista = ListaSaltos()
+        self.claves = {}
+
+    def __len__(self):
+        return len(self.lista)
+
+    @property
+    def minimo(self):
+        """int: Puntos del último lugar, o None si la tabla no está llena."""
+        if len(self.lista) < self.capacidad:
+            return None
+        return -self.lista.ultimo()[0][0]
+
+    def registrar(self, jugador, puntos, secuencia):
+        """
+        Registra una puntuación si mejora la del jugador y cabe en la tabla.
+
+        Args:
+            jugador (str): Nombre del jugador.
+            puntos (int): Puntos obtenidos.
+            secuencia (int): Orden de llegada, para desempatar.
+
+        Returns:
+            bool: True si la tabla cambió.
+        """
+        anterior = self.claves.get(jugador)
+        if anterior is not None and -anterior[0] >= puntos:
+            return False
+        if anterior is None and len(self.lista) >= self.capacidad:
+            ultima, ultimo_jugador = self.lista.ultimo()
+            if (-puntos, secuencia) > ultima:
+                return False
+            self.lista.eliminar(ultima)
+            del self.claves[ultimo_jugador]
+        if anterior is not None:
+            self.lista.eliminar(anterior)
+        clave = (-puntos, secuencia)
+        self.lista.insertar(clave, jugador)
+        self.claves[jugador] = clave
+        return True
+
+    def mejores(self, cantidad=100):
+        """
+        Returns:
+            list: Tuplas (jugador, puntos) de los primeros lugares, del mejor al peor.
+        """
+        resultado = []
+        for (puntos, _), jugador in self.lista:
+            if len(resultado) >= cantidad:
+                break
+            resultado.append((jugador, -puntos))
+        return resultado
+
+    def posicion(self, jugador):
+        """
+        Returns:
+            int: Lugar del jugador empezando en 1, o None si no está en la tabla.
+        """
+        clave = self.claves.get(jugador)
+        return None if clave is None else self.lista.posicion(clave) + 1
+
+
+class Clasificaciones(AlmacenEnGrupo):
+    """
+    Clasificación global y por tema de las partidas ganadas, persistida en SQLite.
+
+    En memoria se mantiene solo una `TablaPosiciones` acotada por tema; la base de
+    datos guarda la mejor puntuación de cada jugador en cada tema. Las escrituras
+    se confirman en grupo como en `AlmacenEnGrupo`, sin que el jugador espere al disco.
+
+    Attributes:
+        capacidad (int): Tamaño de cada tabla de posiciones en memoria.
+        tablas (dict): Tema -> TablaPosiciones; la global usa el tema `GLOBAL`.
+        secuencia (int): Siguiente número de orden de llegada.
+        pendientes (dict): (tema, jugador) -> (puntos, secuencia) aún sin escribir.
+    """
+
+    def __init__(self, ruta, capacidad=1000, intervalo_commit=1.0, max_pendientes=10000):
+        super().__init__(ruta, intervalo_commit, max_pendientes, sincronizacion="NORMAL")
+        self.capacidad = capacidad
+        self.conexion.execute("""CREATE TABLE IF NOT EXISTS puntuaciones (
+                                     tema TEXT NOT NULL,
+                                     jugador TEXT NOT NULL,
+                                     puntos INTEGER NOT NULL,
+                                     secuencia INTEGER NOT NULL,
+                                     PRIMARY KEY (tema, jugador)
+                                 ) WITHOUT ROWID""")
+        self.conexion.execute("""CREATE INDEX IF NOT EXISTS puntuaciones_orden
+                                 ON puntuaciones (tema, puntos DESC, secuencia)""")
+        self.tablas = {}
+        self.secuencia = self.cargar()
+        self.iniciar_escritor()
+
+    def cargar(self):
+        """
+        Reconstruye en memoria las tablas de posiciones desde la base de datos.
+
+        Returns:
+            int: El siguiente número de secuencia libre.
+        """
+        temas = [fila[0] for fila in self.conexion.execute("SELECT DISTINCT tema FROM puntuaciones")]
+        for tema in temas:
+            tabla = self.tabla(tema)
+            filas = self.conexion.execute("""SELECT jugador, puntos, secuencia FROM puntuaciones
+                                             WHERE tema = ? ORDER BY puntos DESC, secuencia
+                                             LIMIT ?""", (tema, self.capacidad))
+            for jugador, puntos, secuencia in filas:
+                tabla.registrar(jugador, puntos, secuencia)
+        ultima = self.conexion.execute("SELECT MAX(secuencia) FROM puntuaciones").fetchone()[0]
+        return 0 if ultima is None else ultima + 1
+
+    def tabla(self, tema=None):
+        """
+        Args:
+            tema (str, optional): El tema; None para la clasificación global.
+
+        Returns:
+            TablaPosiciones: La tabla de posiciones del tema.
+        """
+        tema = GLOBAL if tema is None else tema
+        tabla = self.tablas.get(tema)
+        if tabla is None:
+            tabla = self.tablas[tema] = TablaPosiciones(self.capacidad)
+        return tabla
+
+    def registrar(self, jugador, tema, puntos):
+        """
+        Registra la puntuación de una partida ganada en la clasificación global y en la del tema.
+
+        Args:
+            jugador (str): Nombre del jugador.
+            tema (str): Tema de la palabra jugada.
+            puntos (int): Puntos de `Juego.calcular_puntos`.
+        """
+        self.ingerir([(jugador, tema, puntos)], diferir=True)
+
+    def mejores(self, tema=None, cantidad=100):
+        """
+        Returns:
+            list: Tuplas (jugador, puntos) de los primeros lugares del tema, o globales si es None.
+        """
+        return self.tabla(tema).mejores(cantidad)
+
+    def posicion(self, jugador, tema=None):
+        """
+        Returns:
+            int: Lugar del jugador empezando en 1, o None si está fuera de la tabla.
+        """
+        return self.tabla(tema).posicion(jugador)
+
+    def combinar(self, anterior, nuevo):
+        """Conserva la mejor de dos puntuaciones (puntos, secuencia) del mismo jugador y tema."""
+        return nuevo if nuevo[0] > anterior[0] else anterior
+
+    def escribir_lote(self, lote):
+        """Guarda un lote (tema, jugador) -> (puntos, secuencia) conservando la mejor puntuación de cada jugador."""
+        # En orden de clave primaria, las inserciones recorren el árbol de la tabla secuencialmente
+        filas = sorted((tema, jugador, puntos, secuencia)
+                       for (tema, jugador), (puntos, secuencia) in lote.items())
+        self.conexion.executemany("""INSERT INTO puntuaciones VALUES (?, ?, ?, ?)
+                                     ON CONFLICT (tema, jugador) DO UPDATE
+                                     SET puntos = excluded.puntos, secuencia = excluded.secuencia
+                                     WHERE excluded.puntos > puntuaciones.puntos""", filas)
+
+    def ingerir(self, resultados, tamano_lote=500000, diferir=False):
+        """
+        Registra resultados en orden; sirve también para la carga masiva de históricos.
+
+        Cada lote se reduce en memoria a la mejor puntuación por jugador y tema y
+        se escribe en una sola transacción; las puntuaciones que no superan el
+        último lugar de una tabla llena se descartan sin modificarla.
+
+        Args:
+            resultados (iterable): Tuplas (jugador, tema, puntos) en orden cronológico.
+            tamano_lote (int): Filas distintas (tema y jugador) acumuladas antes de cada transacción.
+            diferir (bool): Si los lotes se dejan al hilo escritor en lugar de escribirse ya.
+
+        Returns:
+            int: Cantidad de resultados procesados.
+        """
+        total = 0
+        lote = {}
+        entregar = self.acumular if diferir else self.escribir
+        tabla_global = self.tabla(GLOBAL)
+        for jugador, tema, puntos in resultados:
+            secuencia = self.secuencia
+            self.secuencia += 1
+            tabla_tema = self.tablas.get(tema)
+            if tabla_tema is None:
+                tabla_tema = self.tabla(tema)
+            for clave, tabla in ((GLOBAL, tabla_global), (tema, tabla_tema)):
+                if len(tabla.claves) < tabla.capacidad or puntos > -tabla.lista.cola.clave[0]:
+                    tabla.registrar(jugador, puntos, secuencia)
+                anterior = lote.get((clave, jugador))
+                if anterior is None or anterior[0] < puntos:
+                    lote[(clave, jugador)] = (puntos, secuencia)
+            total += 1
+            if len(lote) >= tamano_lote:
+                entregar(lote)
+                lote = {}
+        if lote:
+            entregar(lote)
+        return total
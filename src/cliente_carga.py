@@ -0,0 +1,145 @@
+import argparse
+import asyncio
+import time
+from simulador import FRECUENCIA_ESPANOL
+
+ESTADOS_FINALES = {b"LETRAS_COMPLETAS", b"PALABRA_CORRECTA"}
+
+
+def percentil(valores_ordenados, porcentaje):
+    """
+    Obtiene un percentil de una lista ya ordenada por el método del rango más cercano.
+
+    Args:
+        valores_ordenados (list): Valores ordenados de menor a mayor.
+        porcentaje (float): Percentil a obtener, entre 0 y 100.
+
+    Returns:
+        float: El valor del percentil, o 0 si la lista está vacía.
+    """
+    if not valores_ordenados:
+        return 0.0
+    posicion = max(0, int(round(porcentaje / 100 * len(valores_ordenados))) - 1)
+    return valores_ordenados[min(posicion, len(valores_ordenados) - 1)]
+
+
+class InicioComun:
+    """
+    Libera todas las sesiones a la vez, cuando cada una terminó de conectarse (o falló al hacerlo).
+
+    Attributes:
+        faltantes (int): Sesiones que aún no terminaron de conectarse.
+        evento (asyncio.Event): Se activa cuando no quedan faltantes.
+    """
+
+    def __init__(self, sesiones):
+        self.faltantes = sesiones
+        self.evento = asyncio.Event()
+        if sesiones <= 0:
+            self.evento.set()
+
+    def conectada(self):
+        """Cuenta una sesión conectada (o fallida) y libera a todas si era la última."""
+        self.faltantes -= 1
+        if self.faltantes <= 0:
+            self.evento.set()
+
+    async def esperar(self):
+        """Espera a que todas las sesiones estén conectadas."""
+        await self.evento.wait()
+
+
+async def leer_partida(lector):
+    """
+    Lee la respuesta a NUEVO, saltando la línea `SESION` que envía un servidor con `--sesiones`.
+
+    Returns:
+        int: Los intentos máximos de la partida.
+
+    Raises:
+        ConnectionError: Si el servidor cerró la conexión o respondió con un error.
+    """
+    while True:
+        linea = await lector.readline()
+        if linea.startswith(b"PARTIDA"):
+            return int(linea.split()[1])
+        if not linea or linea.startswith(b"ERROR"):
+            raise ConnectionError(f"Respuesta inesperada a NUEVO: {linea!r}")
+
+
+async def jugar_sesion(host, puerto, unix, latencias, inicio_comun):
+    """
+    Abre una conexión, juega una partida con letras en orden de frecuencia y registra
+    la latencia de cada turno en nanosegundos.
+
+    Args:
+        host (str): Dirección del servidor.
+        puerto (int): Puerto TCP del servidor.
+        unix (str): Ruta del socket Unix, o None para usar TCP.
+        latencias (list): Lista donde se agregan las latencias medidas.
+        inicio_comun (InicioComun): Libera todas las sesiones a la vez.
+    """
+    try:
+        if unix:
+            lector, escritor = await asyncio.open_unix_connection(unix)
+        else:
+            lector, escritor = await asyncio.open_connection(host, puerto)
+    finally:
+        inicio_comun.conectada()
+    try:
+        await inicio_comun.esperar()
+        escritor.write(b"NUEVO\n")
+        await escritor.drain()
+        intentos_max = await leer_partida(lector)
+        for letra in FRECUENCIA_ESPANOL:
+            inicio = time.perf_counter_ns()
+            escritor.write(f"JUGAR {letra}\n".encode('utf-8'))
+            await escritor.drain()
+            respuesta = await lector.readline()
+            latencias.append(time.perf_counter_ns() - inicio)
+            partes = respuesta.split(maxsplit=4)
+            if len(partes) < 4 or partes[0] != b"TURNO":
+                break
+            if partes[1] in ESTADOS_FINALES or int(partes[3]) >= intentos_max:
+                await lector.readline()
+                break
+        escritor.write(b"SALIR\n")
+        await escritor.drain()
+    finally:
+        escritor.close()
+
+
+async def ejecutar_carga(host, puerto, unix, sesiones):
+    """
+    Conecta todas las sesiones, las libera a la vez y mide la latencia de sus turnos.
+
+    Returns:
+        list: Latencias de todos los turnos en nanosegundos, ordenadas.
+    """
+    latencias = []
+    inicio_comun = InicioComun(sesiones)
+    tareas = [asyncio.create_task(jugar_sesion(host, puerto, unix, latencias, inicio_comun))
+              for _ in range(sesiones)]
+    resultados = await asyncio.gather(*tareas, return_exceptions=True)
+    fallidas = [resultado for resultado in resultados if isinstance(resultado, Exception)]
+    if fallidas:
+        print(f"{len(fallidas)} sesiones fallaron (primer error: {fallidas[0]!r}). "
+              "Revisa el límite de descriptores abiertos con `ulimit -n`.")
+    return sorted(latencias)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor del ahorcado.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=5000)
+    parser.add_argument("--unix", default=None, help="Ruta del socket Unix del servidor")
+    parser.add_argument("--sesiones", type=int, default=10000, help="Sesiones simultáneas")
+    argumentos = parser.parse_args()
+
+    inicio = time.perf_counter()
+    latencias = asyncio.run(ejecutar_carga(argumentos.host, argumentos.puerto,
+                                           argumentos.unix, argumentos.sesiones))
+    duracion = time.perf_counter() - inicio
+    print(f"Turnos: {len(latencias)} en {duracion:.2f} s ({len(latencias) / duracion:.0f} turnos/s)")
+    print(f"p50: {percentil(latencias, 50) / 1e6:.2f} ms")
+    print(f"p99: {percentil(latencias, 99) / 1e6:.2f} ms")
@@ -0,0 +1,216 @@
+import csv
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import MutableMapping, Sequence
+
+MAGIA = b"AHORCAD1"
+# magia, marca de orden de bytes, mtime_ns y tamaño del CSV, temas, palabras, cadenas
+CABECERA = struct.Struct("=8sIqqIII")
+MARCA_ORDEN = 0x01020304
+
+
+def compilar_corpus(archivo_csv, archivo_binario):
+    """
+    Convierte el CSV de temas y palabras en el formato binario compacto.
+
+    El archivo contiene una cabecera, la tabla de temas (cadena del nombre, inicio
+    y cantidad de palabras), el arreglo de palabras como identificadores de cadena,
+    los desplazamientos de cada cadena y un único bloque UTF-8 con las cadenas sin repetir.
+
+    Args:
+        archivo_csv (str): La ruta al archivo CSV de origen.
+        archivo_binario (str): La ruta del archivo binario a generar.
+    """
+    estado = os.stat(archivo_csv)
+    identificadores = {}
+    desplazamientos = array("Q", [0])
+    bloque = bytearray()
+    temas = {}
+    palabras = array("I")
+
+    def internar(cadena):
+        identificador = identificadores.get(cadena)
+        if identificador is None:
+            identificador = identificadores[cadena] = len(identificadores)
+            bloque.extend(cadena.encode("utf-8"))
+            desplazamientos.append(len(bloque))
+        return identificador
+
+    with open(archivo_csv, mode='r', encoding='utf-8') as archivo:
+        for fila in csv.reader(archivo):
+            if not fila:
+                continue
+            tema, *palabras_tema = fila
+            inicio = len(palabras)
+            palabras.extend(internar(palabra) for palabra in palabras_tema)
+            temas[tema] = (internar(tema), inicio, len(palabras_tema))
+
+    tabla_temas = array("I")
+    for fila_tema in temas.values():
+        tabla_temas.extend(fila_tema)
+
+    temporal = archivo_binario + ".tmp"
+    with open(temporal, mode='wb') as archivo:
+        archivo.write(CABECERA.pack(MAGIA, MARCA_ORDEN, estado.st_mtime_ns, estado.st_size,
+                                    len(temas), len(palabras), len(identificadores)))
+        archivo.write(tabla_temas.tobytes())
+        archivo.write(palabras.tobytes())
+        if archivo.tell() % desplazamientos.itemsize:
+            archivo.write(bytes(desplazamientos.itemsize - archivo.tell() % desplazamientos.itemsize))
+        archivo.write(desplazamientos.tobytes())
+        archivo.write(bloque)
+    os.replace(temporal, archivo_binario)
+
+
+def corpus_vigente(archivo_csv, archivo_binario):
+    """
+    Indica si el archivo binario corresponde a la versión actual del CSV.
+
+    Args:
+        archivo_csv (str): La ruta al archivo CSV de origen.
+        archivo_binario (str): La ruta del archivo binario.
+
+    Returns:
+        bool: True si el binario existe, es legible en esta máquina y no está desactualizado.
+    """
+    try:
+        estado = os.stat(archivo_csv)
+        with open(archivo_binario, mode='rb') as archivo:
+            datos = archivo.read(CABECERA.size)
+    except OSError:
+        return False
+    if len(datos) < CABECERA.size:
+        return False
+    magia, marca, mtime_ns, tamano, *_ = CABECERA.unpack(datos)
+    return (magia == MAGIA and marca == MARCA_ORDEN
+            and mtime_ns == estado.st_mtime_ns and tamano == estado.st_size)
+
+
+class PalabrasCompiladas(Sequence):
+    """
+    Secuencia de solo lectura con las palabras de un tema; cada palabra se
+    decodifica únicamente cuando se accede a ella.
+    """
+
+    def __init__(self, corpus, inicio, cantidad):
+        self.corpus = corpus
+        self.inicio = inicio
+        self.cantidad = cantidad
+
+    def __len__(self):
+        return self.cantidad
+
+    def __getitem__(self, posicion):
+        if isinstance(posicion, slice):
+            return [self[i] for i in range(*posicion.indices(self.cantidad))]
+        if posicion < 0:
+            posicion += self.cantidad
+        if not 0 <= posicion < self.cantidad:
+            raise IndexError(posicion)
+        return self.corpus.cadena(self.corpus.palabras[self.inicio + posicion])
+
+
+class CorpusCompilado(MutableMapping):
+    """
+    Diccionario de temas respaldado por el archivo binario abierto con `mmap`.
+
+    Los temas que se modifican en memoria se guardan aparte en `modificados`
+    y tienen prioridad sobre el contenido del archivo.
+
+    Attributes:
+        archivo_binario (str): La ruta del archivo binario.
+        temas (dict): Temas del archivo como claves y tuplas (inicio, cantidad) como valores.
+        modificados (dict): Temas agregados o reemplazados en memoria.
+    """
+
+    def __init__(self, archivo_binario):
+        """
+        Abre el archivo binario y crea las vistas sobre sus secciones sin copiarlas.
+
+        Args:
+            archivo_binario (str): La ruta del archivo binario.
+        """
+        self.archivo_binario = archivo_binario
+        with open(archivo_binario, mode='rb') as archivo:
+            self.mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, _, n_temas, n_palabras, n_cadenas = CABECERA.unpack_from(self.mapa)
+
+        vista = memoryview(self.mapa)
+        posicion = CABECERA.size
+        tabla_temas = vista[posicion:posicion + n_temas * 12].cast("I")
+        posicion += n_temas * 12
+        self.palabras = vista[posicion:posicion + n_palabras * 4].cast("I")
+        posicion += n_palabras * 4
+        posicion += -posicion % 8
+        self.desplazamientos = vista[posicion:posicion + (n_cadenas + 1) * 8].cast("Q")
+        posicion += (n_cadenas + 1) * 8
+        self.bloque = vista[posicion:]
+
+        self.temas = {self.cadena(tabla_temas[i]): (tabla_temas[i + 1], tabla_temas[i + 2])
+                      for i in range(0, len(tabla_temas), 3)}
+        self.modificados = {}
+        self.eliminados = set()
+
+    def corresponde_a(self, archivo_csv):
+        """
+        Indica si el archivo abierto se compiló a partir de la versión actual del CSV.
+
+        Args:
+            archivo_csv (str): La ruta al archivo CSV de origen.
+
+        Returns:
+            bool: True si la fecha de modificación y el tamaño del CSV coinciden con la cabecera.
+        """
+        try:
+            estado = os.stat(archivo_csv)
+        except OSError:
+            return False
+        _, _, mtime_ns, tamano, *_ = CABECERA.unpack_from(self.mapa)
+        return mtime_ns == estado.st_mtime_ns and tamano == estado.st_size
+
+    def cadena(self, identificador):
+        """
+        Decodifica una cadena del bloque UTF-8.
+
+        Args:
+            identificador (int): Identificador de la cadena.
+
+        Returns:
+            str: La cadena decodificada.
+        """
+        inicio = self.desplazamientos[identificador]
+        fin = self.desplazamientos[identificador + 1]
+        return str(self.bloque[inicio:fin], 'utf-8')
+
+    def __getitem__(self, tema):
+        if tema in self.modificados:
+            return self.modificados[tema]
+        if tema in self.eliminados or tema not in self.temas:
+            raise KeyError(tema)
+        return PalabrasCompiladas(self, *self.temas[tema])
+
+    def __setitem__(self, tema, palabras):
+        self.modificados[tema] = palabras
+        self.eliminados.discard(tema)
+
+    def __delitem__(self, tema):
+        if tema not in self:
+            raise KeyError(tema)
+        self.modificados.pop(tema, None)
+        self.eliminados.add(tema)
+
+    def __contains__(self, tema):
+        return tema in self.modificados or (tema in self.temas and tema not in self.eliminados)
+
+    def __iter__(self):
+        for tema in self.temas:
+            if tema not in self.eliminados:
+                yield tema
+        for tema in self.modificados:
+            if tema not in self.temas:
+                yield tema
+
+    def __len__(self):
+        return sum(1 for _ in self)
@@ -1,7 +1,65 @@
+import sys
+
+
 class Diagrama:
-    def dibujar(self, errores):
+    """
+    Clase base de los diagramas del juego.
+
+    Las subclases definen `cuerpo` y `construir_cuadro`; los `len(cuerpo) + 1` cuadros
+    se precalculan una sola vez por clase y configuración de `cuerpo`, y se
+    comparten entre todas las instancias.
+    """
+    cuadros_compartidos = {}
+
+    def construir_cuadro(self, errores):
         raise NotImplementedError("Implementa este método en la subclase")
 
+    def cuadros(self):
+        """
+        Obtiene los cuadros precalculados para la configuración actual de `cuerpo`.
+
+        Returns:
+            tuple: Un cuadro por cada cantidad de errores, de 0 a `len(cuerpo)`.
+        """
+        clave = (type(self), tuple(self.cuerpo))
+        cuadros = Diagrama.cuadros_compartidos.get(clave)
+        if cuadros is None:
+            cuadros = tuple(self.construir_cuadro(errores) for errores in range(len(self.cuerpo) + 1))
+            Diagrama.cuadros_compartidos[clave] = cuadros
+        return cuadros
+
+    def renderizar(self, errores):
+        """
+        Obtiene el diagrama correspondiente a los errores cometidos como texto.
+
+        Args:
+            errores (int): errores cometidos en el juego
+
+        Returns:
+            str: El cuadro del diagrama, con un salto de línea al final de cada línea.
+        """
+        cuadros = self.cuadros()
+        return cuadros[min(max(errores, 0), len(cuadros) - 1)]
+
+    def escribir(self, errores, flujo):
+        """
+        Escribe el diagrama en un flujo de texto.
+
+        Args:
+            errores (int): errores cometidos en el juego
+            flujo: Flujo de texto con método `write`.
+        """
+        flujo.write(self.renderizar(errores))
+
+    def dibujar(self, errores):
+        """
+        Muestra el diagrama en la salida estándar.
+
+        Args:
+            errores (int): errores cometidos en el juego
+        """
+        self.escribir(errores, sys.stdout)
+
 class DiagramaAhorcado(Diagrama):
     """
     Clase que representa el dibujo del ahorcado en el juego.
@@ -10,17 +68,24 @@ class DiagramaAhorcado(Diagrama):
     def __init__(self, cuerpo=None):
         self.cuerpo = cuerpo or ["0","|", "/", "\\", "/", "\\"]
 
-    def dibujar(self, errores):
+    def construir_cuadro(self, errores):
         """
-        Muestra el diagrama del ahorcado en función de los errores cometidos.
+        Construye el diagrama del ahorcado en función de los errores cometidos.
 
         Args:
             errores (int): errores cometidos en el juego
+
+        Returns:
+            str: El cuadro del diagrama.
         """
         partes_dibujar = [parte if i < errores else " " for i, parte in enumerate(self.cuerpo)]
-        print(f"=" * 10)
-        print(f"||{' ':5}|")
-        print(f"||{' ':5}{partes_dibujar[0]}")
-        print(f"||{' ':4}{partes_dibujar[2]}{partes_dibujar[1]}{partes_dibujar[3]}")
-        print(f"||{' ':4}{partes_dibujar[4]} {partes_dibujar[5]}")
-        print("=" * 10)
+        partes_dibujar += [" "] * (6 - len(partes_dibujar))
+        lineas = [
+            "=" * 10,
+            f"||{' ':5}|",
+            f"||{' ':5}{partes_dibujar[0]}",
+            f"||{' ':4}{partes_dibujar[2]}{partes_dibujar[1]}{partes_dibujar[3]}",
+            f"||{' ':4}{partes_dibujar[4]} {partes_dibujar[5]}",
+            "=" * 10,
+        ]
+        return "\n".join(lineas) + "\n"
@@ -0,0 +1,236 @@
+import os
+from collections.abc import Sequence
+
+import numpy as np
+
+from normalizador import normalizar_lote
+
+BANDAS = ("facil", "media", "dificil")
+COLUMNAS = ("longitud", "unicas", "rareza", "errores_esperados", "puntaje", "banda")
+
+
+def calcular_dificultad(palabras, intentos_max=6):
+    """
+    Calcula en lote las métricas de dificultad de una lista de palabras.
+
+    Las palabras se normalizan con las mismas reglas que `Juego.normalizar_letra` y
+    se codifican como un único arreglo de puntos de código; todas las métricas se
+    obtienen con operaciones vectorizadas sobre los pares (palabra, letra) distintos.
+
+    Args:
+        palabras (list): Las palabras a evaluar.
+        intentos_max (int): Errores con los que se pierde una partida.
+
+    Returns:
+        dict: Columnas de NumPy, una fila por palabra:
+            longitud: caracteres de la palabra normalizada.
+            unicas: letras normalizadas distintas.
+            rareza: sorpresa media, en bits, de sus letras según la fracción de
+                palabras del corpus que las contienen.
+            errores_esperados: errores de un jugador que prueba las letras de la
+                más a la menos frecuente, hasta `intentos_max`.
+            puntaje: `errores_esperados` con la rareza como desempate, en [errores, errores + 1).
+    """
+    cantidad = len(palabras)
+    normalizadas = list(normalizar_lote(palabras))
+    longitud = np.fromiter(map(len, normalizadas), dtype=np.int64, count=cantidad)
+    codigos = np.frombuffer("".join(normalizadas).encode("utf-32-le"), dtype=np.uint32)
+    # Identificador denso de cada letra distinta, con una tabla indexada por punto de código
+    presentes = np.zeros(int(codigos.max()) + 1 if len(codigos) else 0, dtype=bool)
+    presentes[codigos] = True
+    letras = np.flatnonzero(presentes)
+    letra_por_caracter = (np.cumsum(presentes) - 1)[codigos]
+    palabra_por_caracter = np.repeat(np.arange(cantidad, dtype=np.int64), longitud)
+
+    # Pares (palabra, letra) distintos, ordenados por palabra; las claves ya vienen
+    # agrupadas por palabra, así que el ordenamiento estable solo reordena dentro de cada una
+    pares = np.sort(palabra_por_caracter * len(letras) + letra_por_caracter, kind="stable")
+    pares = pares[np.concatenate(([True], pares[1:] != pares[:-1]))] if len(pares) else pares
+    palabra_par = pares // max(len(letras), 1)
+    letra_par = pares % max(len(letras), 1)
+
+    unicas = np.bincount(palabra_par, minlength=cantidad)
+    presencia = np.bincount(letra_par, minlength=len(letras))
+    sorpresa = -np.log2(presencia / max(cantidad, 1), where=presencia > 0,
+                        out=np.zeros(len(letras)))
+    rareza = np.bincount(palabra_par, weights=sorpresa[letra_par], minlength=cantidad).astype(np.float64)
+    np.divide(rareza, unicas, out=rareza, where=unicas > 0)
+
+    rango = np.empty(len(letras), dtype=np.int64)
+    rango[np.argsort(-presencia, kind="stable")] = np.arange(len(letras))
+    rango_maximo = np.zeros(cantidad, dtype=np.int64)
+    con_letras = unicas > 0
+    if len(pares):
+        inicios = (np.cumsum(unicas) - unicas)[con_letras]
+        rango_maximo[con_letras] = np.maximum.reduceat(rango[letra_par], inicios)
+    errores = np.where(con_letras, np.minimum(rango_maximo + 1 - unicas, intentos_max), 0)
+
+    maximo = rareza.max() if cantidad else 0.0
+    return {"longitud": longitud.astype(np.uint16),
+            "unicas": unicas.astype(np.uint16),
+            "rareza": rareza.astype(np.float32),
+            "errores_esperados": errores.astype(np.uint8),
+            "puntaje": (errores + rareza / (maximo + 1)).astype(np.float32)}
+
+
+def numero_banda(dificultad):
+    """
+    Args:
+        dificultad (str or int): Nombre de la banda ("facil", "media", "dificil") o su número.
+
+    Returns:
+        int: El número de la banda.
+
+    Raises:
+        ValueError: Si la dificultad no existe.
+    """
+    if isinstance(dificultad, str):
+        if dificultad not in BANDAS:
+            raise ValueError(f"La dificultad '{dificultad}' no existe. Usa una de {', '.join(BANDAS)}.")
+        return BANDAS.index(dificultad)
+    if not 0 <= dificultad < len(BANDAS):
+        raise ValueError(f"La dificultad {dificultad} no existe.")
+    return int(dificultad)
+
+
+class PalabrasBanda(Sequence):
+    """Vista de solo lectura de las palabras de un tema que pertenecen a una banda."""
+
+    def __init__(self, palabras, posiciones):
+        self.palabras = palabras
+        self.posiciones = posiciones
+
+    def __len__(self):
+        return len(self.posiciones)
+
+    def __getitem__(self, indice):
+        return self.palabras[int(self.posiciones[indice])]
+
+
+class IndiceDificultad:
+    """
+    Dificultad precalculada de todas las palabras, agrupadas por tema y banda.
+
+    Dentro de cada tema las palabras se ordenan por `puntaje` y se reparten en
+    tercios: fácil, media y difícil. `orden` guarda la posición de cada palabra
+    dentro de su tema, agrupada por (tema, banda), e `inicios` dónde empieza cada
+    grupo, de modo que elegir una palabra de una banda no recorre la lista.
+
+    Attributes:
+        temas (list): Los temas, en el orden de `GestorPalabras.opciones`.
+        columnas (dict): Columnas por palabra (ver `COLUMNAS`), en el orden de los temas.
+        orden (numpy.ndarray): Posición dentro del tema, agrupada por (tema, banda).
+        inicios (numpy.ndarray): Inicio de cada grupo (tema, banda) en `orden`, más el final.
+    """
+
+    def __init__(self, temas, columnas, orden, inicios):
+        self.temas = list(temas)
+        self.posicion_tema = {tema: numero for numero, tema in enumerate(self.temas)}
+        self.columnas = columnas
+        self.orden = orden
+        self.inicios = inicios
+
+    @classmethod
+    def construir(cls, opciones, intentos_max=6):
+        """
+        Calcula el índice de un diccionario de temas y palabras.
+
+        Args:
+            opciones (Mapping): Tema -> palabras.
+            intentos_max (int): Errores con los que se pierde una partida.
+
+        Returns:
+            IndiceDificultad: El índice.
+        """
+        temas = list(opciones)
+        listas = [opciones[tema] for tema in temas]
+        cantidades = np.array([len(palabras) for palabras in listas], dtype=np.int64)
+        todas = [palabra for palabras in listas for palabra in palabras]
+        columnas = calcular_dificultad(todas, intentos_max)
+
+        tema_palabra = np.repeat(np.arange(len(temas), dtype=np.int64), cantidades)
+        inicio_tema = np.cumsum(cantidades) - cantidades
+        orden = np.lexsort((columnas["puntaje"], tema_palabra))
+        tema_ordenado = tema_palabra[orden]
+        rango = np.arange(len(todas)) - inicio_tema[tema_ordenado]
+        banda_ordenada = rango * len(BANDAS) // np.maximum(cantidades[tema_ordenado], 1)
+        banda = np.empty(len(todas), dtype=np.uint8)
+        banda[orden] = banda_ordenada
+        columnas["banda"] = banda
+
+        grupos = tema_ordenado * len(BANDAS) + banda_ordenada
+        inicios = np.searchsorted(grupos, np.arange(len(temas) * len(BANDAS) + 1))
+        return cls(temas, columnas, (orden - inicio_tema[tema_ordenado]).astype(np.uint32),
+                   inicios.astype(np.int64))
+
+    def guardar(self, ruta, estado):
+        """
+        Escribe el índice como archivo `.npz` de columnas, de forma atómica.
+
+        Args:
+            ruta (str): Ruta del archivo a escribir.
+            estado (tuple): mtime_ns y tamaño del CSV del que proviene.
+        """
+        temporal = ruta + ".tmp"
+        with open(temporal, mode='wb') as archivo:
+            np.savez(archivo, temas=np.array(self.temas, dtype=str), orden=self.orden,
+                     inicios=self.inicios, estado=np.array(estado, dtype=np.int64),
+                     **self.columnas)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta, estado, temas):
+        """
+        Lee un índice guardado si corresponde al CSV y a los temas actuales.
+
+        Args:
+            ruta (str): Ruta del archivo `.npz`.
+            estado (tuple): mtime_ns y tamaño actuales del CSV.
+            temas (list): Los temas actuales.
+
+        Returns:
+            IndiceDificultad: El índice, o None si no existe o está desactualizado.
+        """
+        try:
+            with np.load(ruta) as datos:
+                if tuple(datos["estado"]) != tuple(estado) or datos["temas"].tolist() != list(temas):
+                    return None
+                columnas = {columna: datos[columna] for columna in COLUMNAS}
+                return cls(temas, columnas, datos["orden"], datos["inicios"])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def banda_disponible(self, tema, dificultad):
+        """
+        Busca la banda con palabras más cercana a la pedida.
+
+        Un tema con menos palabras que bandas deja alguna vacía (con dos palabras
+        no hay difíciles); entonces se usa la banda vecina y, entre dos igual de
+        cercanas, la más fácil.
+
+        Args:
+            tema (str): El tema.
+            dificultad (str or int): La banda de dificultad pedida.
+
+        Returns:
+            int: El número de la banda, o el de la pedida si el tema no tiene palabras.
+        """
+        pedida = numero_banda(dificultad)
+        inicio = self.posicion_tema[tema] * len(BANDAS)
+        for banda in sorted(range(len(BANDAS)), key=lambda banda: (abs(banda - pedida), banda)):
+            if self.inicios[inicio + banda + 1] > self.inicios[inicio + banda]:
+                return banda
+        return pedida
+
+    def palabras_banda(self, tema, dificultad, palabras):
+        """
+        Args:
+            tema (str): El tema.
+            dificultad (str or int): La banda de dificultad; si está vacía, se usa la más cercana con palabras.
+            palabras (Sequence): Las palabras del tema.
+
+        Returns:
+            PalabrasBanda: Las palabras del tema en esa banda.
+        """
+        grupo = self.posicion_tema[tema] * len(BANDAS) + self.banda_disponible(tema, dificultad)
+        return PalabrasBanda(palabras, self.orden[self.inicios[grupo]:self.inicios[grupo + 1]])
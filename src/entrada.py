@@ -0,0 +1,204 @@
+import codecs
+import math
+import os
+import platform
+import queue
+import selectors
+import sys
+import threading
+import time
+
+try:
+    import termios
+except ImportError:
+    termios = None
+
+
+class RelojPartida:
+    """
+    Plazos de un turno y de la partida completa sobre un reloj monótono.
+
+    Attributes:
+        segundos_turno (float): Segundos por turno, o None sin límite por turno.
+        segundos_partida (float): Segundos para toda la partida, o None sin límite.
+        fin_turno (float): Instante en que vence el turno actual.
+        fin_partida (float): Instante en que vence la partida.
+    """
+
+    def __init__(self, segundos_turno=None, segundos_partida=None, reloj=time.monotonic):
+        """
+        Args:
+            segundos_turno (float, optional): Segundos por turno.
+            segundos_partida (float, optional): Segundos para toda la partida.
+            reloj (callable): Reloj monótono en segundos; se puede reemplazar en pruebas.
+        """
+        self.segundos_turno = segundos_turno
+        self.segundos_partida = segundos_partida
+        self.reloj = reloj
+        self.fin_turno = self.fin_partida = None
+
+    def iniciar(self):
+        """Empieza a contar el tiempo de la partida."""
+        if self.segundos_partida is not None:
+            self.fin_partida = self.reloj() + self.segundos_partida
+
+    def iniciar_turno(self):
+        """Empieza a contar el tiempo de un turno."""
+        if self.segundos_turno is not None:
+            self.fin_turno = self.reloj() + self.segundos_turno
+
+    def limite(self):
+        """
+        Returns:
+            float: El primero de los plazos del turno y de la partida, o None si no hay.
+        """
+        plazos = [plazo for plazo in (self.fin_turno, self.fin_partida) if plazo is not None]
+        return min(plazos) if plazos else None
+
+    def restante(self, plazo):
+        """Segundos que faltan para un plazo, o None si no hay plazo."""
+        return None if plazo is None else max(plazo - self.reloj(), 0.0)
+
+    def partida_agotada(self):
+        """Indica si venció el tiempo de la partida."""
+        return self.fin_partida is not None and self.reloj() >= self.fin_partida
+
+    def segundos_restantes(self):
+        """
+        Returns:
+            float: Segundos que le sobran a la partida, o al turno si la partida no
+                tiene límite; 0 sin límites. Es lo que suma `Juego.calcular_puntos`.
+        """
+        restante = self.restante(self.fin_partida if self.fin_partida is not None else self.fin_turno)
+        return restante or 0.0
+
+    def texto(self):
+        """
+        Returns:
+            str: La cuenta regresiva en segundos completos, por ejemplo "Turno: 9 s  Partida: 95 s".
+        """
+        partes = []
+        for nombre, plazo in (("Turno", self.fin_turno), ("Partida", self.fin_partida)):
+            restante = self.restante(plazo)
+            if restante is not None:
+                partes.append(f"{nombre}: {math.ceil(restante)} s")
+        return "  ".join(partes)
+
+
+class LectorEntrada:
+    """
+    Lee líneas de la entrada estándar sin bloquear más allá de un plazo.
+
+    En sistemas POSIX espera con un selector sobre el descriptor de la entrada,
+    despertando solo cuando hay datos, cuando vence el plazo o cuando cambia el
+    segundo que muestra la cuenta regresiva. Donde no se puede esperar así (en
+    Windows la consola no admite `select`), un hilo lee las líneas y las deja en
+    una cola que se consulta con el mismo plazo.
+
+    Attributes:
+        flujo: Flujo de texto de entrada, por defecto `sys.stdin`.
+        pendiente (str): Texto leído que aún no forma una línea completa o no se ha entregado.
+        fin (bool): Si la entrada llegó a su fin.
+    """
+
+    def __init__(self, flujo=None, usar_hilo=None):
+        """
+        Args:
+            flujo (optional): Flujo de entrada, por defecto `sys.stdin`.
+            usar_hilo (bool, optional): Fuerza (o evita) la lectura con un hilo; por
+                defecto se usa solo en Windows o si el flujo no tiene descriptor.
+        """
+        self.flujo = flujo or sys.stdin
+        self.pendiente = ""
+        self.fin = False
+        self.selector = self.cola = None
+        try:
+            self.descriptor = self.flujo.fileno()
+        except (AttributeError, OSError, ValueError):
+            self.descriptor = None
+        if usar_hilo is None:
+            usar_hilo = self.descriptor is None or platform.system() == "Windows"
+        if usar_hilo:
+            self.cola = queue.Queue()
+            threading.Thread(target=self.leer_en_hilo, daemon=True).start()
+        else:
+            self.decodificador = codecs.getincrementaldecoder("utf-8")("replace")
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.descriptor, selectors.EVENT_READ)
+
+    def leer_en_hilo(self):
+        """Lee líneas del flujo y las deja en la cola; None marca el fin de la entrada."""
+        while True:
+            linea = self.flujo.readline()
+            self.cola.put(linea or None)
+            if not linea:
+                return
+
+    def leer_linea(self, limite=None, al_tic=None):
+        """
+        Espera una línea hasta un plazo.
+
+        Args:
+            limite (float, optional): Instante de `time.monotonic` en que se deja de esperar.
+            al_tic (callable, optional): Se llama con los segundos restantes al
+                empezar y cada vez que cambia el segundo completo restante, para
+                redibujar una cuenta regresiva.
+
+        Returns:
+            str: La línea sin el salto final, o None si venció el plazo.
+
+        Raises:
+            EOFError: Si la entrada terminó sin más líneas.
+        """
+        while True:
+            linea, salto, resto = self.pendiente.partition("\n")
+            if salto:
+                self.pendiente = resto
+                return linea.rstrip("\r")
+            if self.fin:
+                if self.pendiente:
+                    self.pendiente = ""
+                    return linea
+                raise EOFError
+            espera = None
+            if limite is not None:
+                espera = limite - time.monotonic()
+                if espera <= 0:
+                    return None
+                if al_tic is not None:
+                    al_tic(espera)
+                    # Despertar cuando cambie el segundo completo que se muestra
+                    espera = min(espera, espera - math.ceil(espera) + 1)
+            self.esperar(espera)
+
+    def esperar(self, espera):
+        """Espera datos hasta `espera` segundos y agrega a `pendiente` lo que llegue."""
+        if self.cola is not None:
+            try:
+                linea = self.cola.get(timeout=espera)
+            except queue.Empty:
+                return
+            if linea is None:
+                self.fin = True
+            else:
+                self.pendiente += linea
+            return
+        if not self.selector.select(espera):
+            return
+        datos = os.read(self.descriptor, 4096)
+        if datos:
+            self.pendiente += self.decodificador.decode(datos)
+        else:
+            self.pendiente += self.decodificador.decode(b"", final=True)
+            self.fin = True
+
+    def descartar_pendiente(self):
+        """Descarta lo escrito a medias cuando vence un turno, también en la terminal si se puede."""
+        self.pendiente = ""
+        if termios is not None and self.selector is not None and os.isatty(self.descriptor):
+            termios.tcflush(self.descriptor, termios.TCIFLUSH)
+
+    def cerrar(self):
+        """Libera el selector."""
+        if self.selector is not None:
+            self.selector.close()
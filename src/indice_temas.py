@@ -0,0 +1,195 @@
+import math
+
+from normalizador import normalizar
+
+
+class NodoTema:
+    """
+    Nodo del trie de temas.
+
+    Attributes:
+        hijos (dict): Carácter normalizado -> NodoTema.
+        temas (list): Posiciones, en orden y sin repetir, de los temas que tienen
+            una palabra que empieza con el prefijo de este nodo.
+    """
+    __slots__ = ("hijos", "temas")
+
+    def __init__(self):
+        self.hijos = {}
+        self.temas = []
+
+
+class IndiceTemas:
+    """
+    Trie de los nombres de tema normalizados, para filtrar el menú por prefijo.
+
+    Cada tema se inserta desde el inicio de cada una de sus palabras, así que
+    "mar" encuentra "Animales del mar". Cada nodo guarda ya la lista de temas que
+    coinciden con su prefijo: filtrar es bajar un nodo por carácter escrito, sin
+    recorrer los temas. Se construye una vez por lista de temas.
+
+    Attributes:
+        temas (list): Los temas, en el orden del menú.
+        raiz (NodoTema): Nodo del prefijo vacío; coincide con todos los temas.
+    """
+
+    def __init__(self, temas):
+        """
+        Args:
+            temas (Sequence): Los temas, en el orden en que se numeran en el menú.
+        """
+        self.temas = list(temas)
+        self.raiz = NodoTema()
+        self.raiz.temas = list(range(len(self.temas)))
+        for posicion, tema in enumerate(self.temas):
+            nombre = normalizar(tema)
+            inicios = [indice for indice, caracter in enumerate(nombre)
+                       if not caracter.isspace() and (indice == 0 or nombre[indice - 1].isspace())]
+            for inicio in inicios:
+                nodo = self.raiz
+                for caracter in nombre[inicio:]:
+                    nodo = nodo.hijos.setdefault(caracter, NodoTema())
+                    # Los temas se insertan en orden: un repetido sería el último agregado
+                    if not nodo.temas or nodo.temas[-1] != posicion:
+                        nodo.temas.append(posicion)
+
+    def __len__(self):
+        return len(self.temas)
+
+    def bajar(self, nodo, texto):
+        """
+        Args:
+            nodo (NodoTema): Nodo de partida, o None.
+            texto (str): Texto normalizado a agregar al prefijo del nodo.
+
+        Returns:
+            NodoTema: El nodo del prefijo extendido, o None si ningún tema coincide.
+        """
+        for caracter in texto:
+            if nodo is None:
+                return None
+            nodo = nodo.hijos.get(caracter)
+        return nodo
+
+    def buscar(self, prefijo):
+        """
+        Args:
+            prefijo (str): Texto escrito por el jugador; se normaliza.
+
+        Returns:
+            list: Posiciones de los temas que coinciden, en el orden del menú. No debe modificarse.
+        """
+        nodo = self.bajar(self.raiz, normalizar(prefijo).lstrip())
+        return nodo.temas if nodo is not None else []
+
+
+class MenuTemas:
+    """
+    Estado de un menú de temas que se filtra al escribir y se muestra por páginas.
+
+    Cada tecla escrita baja un nodo en el `IndiceTemas` y cada tecla borrada
+    vuelve al nodo anterior, así que las coincidencias se actualizan en tiempo
+    constante por tecla. Un texto formado solo por dígitos no filtra: es el
+    número de un tema y el menú salta a la página que lo contiene. Los números
+    son siempre los del menú completo.
+
+    Attributes:
+        indice (IndiceTemas): El índice de los temas.
+        tamano_pagina (int): Temas por página.
+        texto (str): Lo escrito por el jugador.
+        pagina (int): Página visible, desde 0.
+    """
+
+    def __init__(self, indice, tamano_pagina=20):
+        self.indice = indice
+        self.tamano_pagina = tamano_pagina
+        self.texto = ""
+        # Nodo del trie alcanzado tras cada carácter de `texto`
+        self.nodos = [indice.raiz]
+        self.pagina = 0
+
+    @property
+    def numero(self):
+        """int: El número escrito, o None si el texto no es un número."""
+        return int(self.texto) if self.texto.isascii() and self.texto.isdigit() else None
+
+    @property
+    def coincidencias(self):
+        """list: Posiciones de los temas que coinciden con el texto escrito."""
+        if self.numero is not None:
+            return self.indice.raiz.temas
+        nodo = self.nodos[-1]
+        return nodo.temas if nodo is not None else []
+
+    @property
+    def paginas(self):
+        """int: Cantidad de páginas de las coincidencias (al menos 1)."""
+        return max(math.ceil(len(self.coincidencias) / self.tamano_pagina), 1)
+
+    def escribir(self, texto):
+        """Agrega texto a lo escrito, bajando en el trie solo por los caracteres nuevos."""
+        for caracter in texto:
+            self.texto += caracter
+            nodo = self.nodos[-1]
+            # Los espacios al inicio no filtran, igual que en `IndiceTemas.buscar`
+            if nodo is not self.indice.raiz or not caracter.isspace():
+                nodo = self.indice.bajar(nodo, normalizar(caracter))
+            self.nodos.append(nodo)
+        self.ajustar_pagina()
+
+    def borrar(self, cantidad=1):
+        """Borra los últimos caracteres escritos, volviendo a sus nodos anteriores."""
+        cantidad = min(cantidad, len(self.texto))
+        if cantidad:
+            self.texto = self.texto[:-cantidad]
+            del self.nodos[-cantidad:]
+        self.ajustar_pagina()
+
+    def reemplazar(self, texto):
+        """Cambia lo escrito por otro texto, conservando los nodos del prefijo común."""
+        comun = 0
+        for anterior, nuevo in zip(self.texto, texto):
+            if anterior != nuevo:
+                break
+            comun += 1
+        self.borrar(len(self.texto) - comun)
+        self.escribir(texto[comun:])
+
+    def ajustar_pagina(self):
+        """Muestra la página del número escrito o, si se filtra, la primera."""
+        numero = self.numero
+        if numero is not None and 1 <= numero <= len(self.indice):
+            self.pagina = (numero - 1) // self.tamano_pagina
+        else:
+            self.pagina = 0
+
+    def cambiar_pagina(self, paso):
+        """Avanza (o retrocede, con paso negativo) páginas sin salir del rango."""
+        self.pagina = min(max(self.pagina + paso, 0), self.paginas - 1)
+
+    def visibles(self):
+        """
+        Returns:
+            list: Pares (número en el menú, tema) de la página visible.
+        """
+        inicio = self.pagina * self.tamano_pagina
+        temas = self.indice.temas
+        return [(posicion + 1, temas[posicion])
+                for posicion in self.coincidencias[inicio:inicio + self.tamano_pagina]]
+
+    def elegido(self):
+        """
+        Returns:
+            str: El tema del número escrito o, si el filtro deja uno solo, ese tema; si no, None.
+        """
+        numero = self.numero
+        if numero is not None:
+            return self.indice.temas[numero - 1] if 1 <= numero <= len(self.indice) else None
+        coincidencias = self.coincidencias
+        return self.indice.temas[coincidencias[0]] if self.texto and len(coincidencias) == 1 else None
+
+    def resumen(self):
+        """str: Línea con la página, las coincidencias y el filtro."""
+        filtro = f"  Filtro: {self.texto}" if self.texto and self.numero is None else ""
+        return (f"Página {self.pagina + 1}/{self.paginas}  "
+                f"({len(self.coincidencias)} de {len(self.indice)} temas){filtro}")
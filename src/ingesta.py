@@ -0,0 +1,315 @@
+import argparse
+import csv
+import io
+import os
+import tempfile
+import time
+import zlib
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from juego import ALFABETO
+from normalizador import normalizar
+
+# Caracteres que puede tener una palabra normalizada: las letras del alfabeto y el espacio entre palabras
+CARACTERES_VALIDOS = frozenset(ALFABETO + " ")
+MOTIVOS_RECHAZO = ("vacia", "longitud", "caracteres")
+
+
+def limpiar_palabra(palabra):
+    """Quita los espacios de los extremos y reduce los interiores a uno solo."""
+    return " ".join(palabra.split())
+
+
+def validar_palabra(palabra, longitud_maxima):
+    """
+    Valida una palabra ya limpia.
+
+    Args:
+        palabra (str): La palabra.
+        longitud_maxima (int): Longitud máxima permitida.
+
+    Returns:
+        tuple: (palabra normalizada, None) si es válida, o (None, motivo de rechazo).
+    """
+    if not palabra:
+        return None, "vacia"
+    if len(palabra) > longitud_maxima:
+        return None, "longitud"
+    normalizada = normalizar(palabra)
+    if not CARACTERES_VALIDOS.issuperset(normalizada):
+        return None, "caracteres"
+    return normalizada, None
+
+
+def procesar_bloque(bloque, particiones, longitud_maxima):
+    """
+    Limpia, normaliza y valida un bloque de palabras en un proceso trabajador.
+
+    Las palabras aceptadas se entregan ya serializadas como filas CSV
+    (tema, palabra, normalizada) agrupadas por partición, según el hash del tema,
+    para que el proceso principal solo tenga que escribirlas.
+
+    Args:
+        bloque (list): Tuplas (tema, palabras, validar); las palabras con `validar`
+            falso (las del corpus base) se conservan tal cual y solo se deduplican.
+        particiones (int): Cantidad de particiones.
+        longitud_maxima (int): Longitud máxima de una palabra.
+
+    Returns:
+        tuple: (dict partición -> texto CSV, temas en orden de aparición,
+            palabras leídas, duplicadas dentro del bloque, Counter de rechazos).
+    """
+    salidas = {}
+    temas = {}
+    vistas = set()
+    leidas = duplicadas = 0
+    rechazos = Counter()
+    for tema, palabras, validar in bloque:
+        particion = temas.get(tema)
+        if particion is None:
+            particion = temas[tema] = zlib.crc32(tema.encode("utf-8")) % particiones
+        salida = salidas.get(particion)
+        if salida is None:
+            salida = salidas[particion] = io.StringIO()
+        escritor = csv.writer(salida, lineterminator="\n")
+        for palabra in palabras:
+            leidas += 1
+            if validar:
+                palabra = limpiar_palabra(palabra)
+                normalizada, motivo = validar_palabra(palabra, longitud_maxima)
+                if motivo is not None:
+                    rechazos[motivo] += 1
+                    continue
+            else:
+                normalizada = normalizar(palabra)
+            if (tema, normalizada) in vistas:
+                duplicadas += 1
+                continue
+            vistas.add((tema, normalizada))
+            escritor.writerow((tema, palabra, normalizada))
+    return ({particion: salida.getvalue() for particion, salida in salidas.items()},
+            list(temas), leidas, duplicadas, rechazos)
+
+
+class IngestaCorpus:
+    """
+    Incorpora listas de palabras externas al corpus de temas con memoria acotada.
+
+    1. Las entradas se leen en bloques que varios procesos limpian, normalizan y
+       validan (solo se aceptan letras representables por `Juego` y espacios).
+    2. Las palabras aceptadas se reparten en archivos temporales por hash del tema.
+    3. Cada partición se carga sola, se eliminan los duplicados de cada tema según
+       su forma normalizada (se conserva la primera aparición) y se escriben sus filas.
+    4. Las filas se copian al CSV final, con los temas en orden de aparición, y
+       éste reemplaza al anterior con un renombrado atómico.
+
+    La memoria necesaria es la de la partición más grande (la del tema más grande
+    si un tema domina el corpus), no la del corpus completo.
+
+    Attributes:
+        procesos (int): Procesos trabajadores.
+        particiones (int): Archivos temporales en los que se reparten los temas.
+        tamano_bloque (int): Palabras por bloque enviado a un trabajador.
+        longitud_maxima (int): Longitud máxima de una palabra.
+    """
+
+    def __init__(self, procesos=None, particiones=64, tamano_bloque=20000, longitud_maxima=40):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.particiones = particiones
+        self.tamano_bloque = tamano_bloque
+        self.longitud_maxima = longitud_maxima
+
+    def leer_bloques(self, entradas, base=()):
+        """
+        Lee las entradas en bloques de a lo sumo `tamano_bloque` palabras.
+
+        Args:
+            entradas (list): Rutas de archivos CSV con filas "tema,palabra,...", o
+                tuplas (ruta, tema) de archivos de texto con una palabra por línea.
+            base (list): Rutas de archivos CSV del corpus existente, que se leen
+                primero y cuyas palabras no se validan.
+
+        Yields:
+            list: Tuplas (tema, palabras, validar).
+        """
+        bloque = []
+        cantidad = 0
+        for entrada, validar in [(ruta, False) for ruta in base] + [(entrada, True) for entrada in entradas]:
+            ruta, tema = (entrada, None) if isinstance(entrada, str) else entrada
+            with open(ruta, mode='r', encoding='utf-8', newline='') as archivo:
+                if tema is None:
+                    filas = csv.reader(archivo)
+                else:
+                    filas = ([tema, linea.rstrip("\r\n")] for linea in archivo)
+                for fila in filas:
+                    if not fila:
+                        continue
+                    tema_fila, *palabras = fila
+                    for inicio in range(0, len(palabras), self.tamano_bloque):
+                        parte = palabras[inicio:inicio + self.tamano_bloque]
+                        bloque.append((tema_fila, parte, validar))
+                        cantidad += len(parte)
+                        if cantidad >= self.tamano_bloque:
+                            yield bloque
+                            bloque = []
+                            cantidad = 0
+        if bloque:
+            yield bloque
+
+    def procesar(self, bloques):
+        """
+        Reparte los bloques entre los trabajadores, con a lo sumo dos por proceso
+        en vuelo, y entrega sus resultados en el orden de lectura.
+
+        Yields:
+            tuple: El resultado de `procesar_bloque` de cada bloque.
+        """
+        en_vuelo = deque()
+        with ProcessPoolExecutor(max_workers=self.procesos) as ejecutor:
+            for bloque in bloques:
+                en_vuelo.append(ejecutor.submit(procesar_bloque, bloque, self.particiones,
+                                                self.longitud_maxima))
+                if len(en_vuelo) >= 2 * self.procesos:
+                    yield en_vuelo.popleft().result()
+            while en_vuelo:
+                yield en_vuelo.popleft().result()
+
+    def ejecutar(self, entradas, salida, base=()):
+        """
+        Ingiere las entradas y escribe el corpus resultante.
+
+        Args:
+            entradas (list): Entradas en orden de prioridad (ver `leer_bloques`).
+            salida (str): Ruta del CSV a escribir.
+            base (list): CSV del corpus existente (y su diario), que van primero y se
+                conservan sin validar: reescribir el corpus nunca le quita palabras
+                por reglas que no existían cuando se agregaron.
+
+        Returns:
+            dict: Palabras leídas, aceptadas y duplicadas, rechazos por motivo,
+                temas, segundos y palabras por segundo.
+        """
+        inicio = time.perf_counter()
+        orden_temas = {}
+        leidas = duplicadas = 0
+        rechazos = Counter()
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(salida))) as directorio:
+            rutas = [os.path.join(directorio, f"particion_{numero}.csv") for numero in range(self.particiones)]
+            archivos = [open(ruta, mode='w', encoding='utf-8', newline='') for ruta in rutas]
+            try:
+                for textos, temas, leidas_bloque, duplicadas_bloque, rechazos_bloque in self.procesar(
+                        self.leer_bloques(entradas, base)):
+                    for particion, texto in textos.items():
+                        archivos[particion].write(texto)
+                    orden_temas.update(dict.fromkeys(temas))
+                    leidas += leidas_bloque
+                    duplicadas += duplicadas_bloque
+                    rechazos.update(rechazos_bloque)
+            finally:
+                for archivo in archivos:
+                    archivo.close()
+
+            filas = {}
+            aceptadas = 0
+            for ruta in rutas:
+                palabras_particion, duplicadas_particion = self.deduplicar(ruta)
+                duplicadas += duplicadas_particion
+                with open(ruta, mode='wb') as archivo:
+                    for tema_fila, palabras in palabras_particion.items():
+                        texto = io.StringIO()
+                        csv.writer(texto).writerow([tema_fila, *palabras])
+                        datos = texto.getvalue().encode("utf-8")
+                        filas[tema_fila] = (ruta, archivo.tell(), len(datos))
+                        archivo.write(datos)
+                        aceptadas += len(palabras)
+            self.escribir_corpus(salida, orden_temas, filas)
+
+        segundos = time.perf_counter() - inicio
+        return {"leidas": leidas, "aceptadas": aceptadas, "duplicadas": duplicadas,
+                "rechazadas": {motivo: rechazos[motivo] for motivo in MOTIVOS_RECHAZO},
+                "temas": len(filas), "segundos": segundos,
+                "palabras_por_segundo": leidas / segundos if segundos else 0.0}
+
+    @staticmethod
+    def deduplicar(ruta):
+        """
+        Elimina las palabras repetidas de cada tema de una partición.
+
+        Returns:
+            tuple: (dict tema -> palabras sin repetir en orden de aparición, duplicadas).
+        """
+        palabras = {}
+        vistas = {}
+        duplicadas = 0
+        with open(ruta, mode='r', encoding='utf-8', newline='') as archivo:
+            for tema, palabra, normalizada in csv.reader(archivo):
+                normalizadas = vistas.get(tema)
+                if normalizadas is None:
+                    normalizadas = vistas[tema] = set()
+                    palabras[tema] = []
+                if normalizada in normalizadas:
+                    duplicadas += 1
+                    continue
+                normalizadas.add(normalizada)
+                palabras[tema].append(palabra)
+        return palabras, duplicadas
+
+    @staticmethod
+    def escribir_corpus(salida, orden_temas, filas):
+        """
+        Copia las filas de cada tema al CSV final en orden de aparición y lo
+        reemplaza de forma atómica.
+        """
+        temporal = salida + ".tmp"
+        abiertos = {}
+        try:
+            with open(temporal, mode='wb') as archivo:
+                for tema in orden_temas:
+                    if tema not in filas:
+                        continue
+                    ruta, desplazamiento, longitud = filas[tema]
+                    origen = abiertos.get(ruta)
+                    if origen is None:
+                        origen = abiertos[ruta] = open(ruta, mode='rb')
+                    origen.seek(desplazamiento)
+                    archivo.write(origen.read(longitud))
+                archivo.flush()
+                os.fsync(archivo.fileno())
+        finally:
+            for origen in abiertos.values():
+                origen.close()
+        os.replace(temporal, salida)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incorpora listas de palabras al corpus de temas.")
+    parser.add_argument("entradas", nargs="+", help="Archivos CSV (tema,palabra,...) o listas de palabras con --tema")
+    parser.add_argument("--salida", default="temas_palabras.csv", help="CSV del corpus a escribir")
+    parser.add_argument("--base", default=None,
+                        help="Corpus existente que se conserva primero, junto con su diario pendiente")
+    parser.add_argument("--tema", default=None, help="Trata cada entrada como una palabra por línea de este tema")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos trabajadores")
+    parser.add_argument("--particiones", type=int, default=64, help="Archivos temporales para acotar la memoria")
+    parser.add_argument("--longitud-maxima", type=int, default=40, help="Longitud máxima de una palabra")
+    argumentos = parser.parse_args()
+
+    ingesta = IngestaCorpus(argumentos.procesos, argumentos.particiones,
+                            longitud_maxima=argumentos.longitud_maxima)
+    entradas = [entrada if argumentos.tema is None else (entrada, argumentos.tema)
+                for entrada in argumentos.entradas]
+    diario = None
+    base = []
+    if argumentos.base:
+        diario = argumentos.base + ".diario"
+        base = [argumentos.base] + ([diario] if os.path.exists(diario) else [])
+    resultado = ingesta.ejecutar(entradas, argumentos.salida, base)
+    if diario and os.path.abspath(argumentos.base) == os.path.abspath(argumentos.salida):
+        try:
+            os.remove(diario)
+        except FileNotFoundError:
+            pass
+
+    print(f"Leídas: {resultado['leidas']}  aceptadas: {resultado['aceptadas']}  "
+          f"duplicadas: {resultado['duplicadas']}  temas: {resultado['temas']}")
+    print("Rechazadas: " + ", ".join(f"{motivo} {cantidad}" for motivo, cantidad in resultado["rechazadas"].items()))
+    print(f"{resultado['segundos']:.2f} s, {resultado['palabras_por_segundo']:,.0f} palabras/s")
@@ -1,10 +1,43 @@
 import os
+import sys
 import time
 import platform
 from juego import EstadoJuego
+from entrada import LectorEntrada
+from indice_temas import IndiceTemas, MenuTemas
+from renderizado import RenderizadorTerminal
+
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = tty = None
+
+# Teclas del menú de temas en modo tecla a tecla
+TECLAS_BORRAR = ("\x7f", "\b")
+TECLAS_PAGINA_SIGUIENTE = (">", "\t", "\x1b[6~", "\x1b[B")
+TECLAS_PAGINA_ANTERIOR = ("<", "\x1b[Z", "\x1b[5~", "\x1b[A")
 
 class InteraccionConsola:
     """Clase para gestionar la interacción del juego del ahorcado en la consola."""
+
+    def __init__(self, tamano_pagina=20, teclas=None, lector=None):
+        """
+        Args:
+            tamano_pagina (int): Temas por página en el menú.
+            teclas (bool, optional): Filtra el menú tecla a tecla leyendo la terminal
+                sin esperar el enter; por defecto, si la entrada es una terminal POSIX.
+            lector (LectorEntrada, optional): Si se indica, todas las líneas se leen
+                con él en lugar de `input`. Debe ser el mismo que use `ControladorAhorcado`:
+                `input` guarda en el búfer de `sys.stdin` lo que el lector ya no vería.
+        """
+        self.tamano_pagina = tamano_pagina
+        self.lector = lector
+        if teclas is None:
+            teclas = termios is not None and sys.stdin.isatty()
+        self.teclas = teclas
+        # Índice de los temas del último menú, reutilizado mientras no cambien
+        self.indice_temas = None
     
     @staticmethod
     def limpiar_pantalla():
@@ -16,39 +49,143 @@ class InteraccionConsola:
 
 
     @staticmethod
-    def mostrar_menu(opciones):
+    def lineas_menu(opciones, numeros=None):
         """
-        Muestra un menú interactivo de opciones disponibles 
+        Construye el cuadro del menú; el ancho depende solo de las opciones dadas.
 
         Args:
-            opciones (list): Lista de temas disponibles.
+            opciones (list): Temas a mostrar.
+            numeros (list, optional): Número de cada tema en el menú; por defecto, desde 1.
+
+        Returns:
+            list: Las líneas del cuadro.
         """
         separador = "="
-        ancho_max = len(max(opciones, key=len))
-        print("\nSelecciona un tema para comenzar:\n")
-        print(separador * (ancho_max + 16))
-        for i, opcion in enumerate(opciones):
-            linea_menu = f"{i + 1:<3}.- {opcion}"
-            print(f"||{' ' * 4}{linea_menu:{ancho_max + 8}}||")
-        print(separador * (ancho_max + 16))
+        ancho_max = max(map(len, opciones), default=len("(sin coincidencias)"))
+        if numeros is None:
+            numeros = range(1, len(opciones) + 1)
+        lineas = ["", "Selecciona un tema para comenzar:", "", separador * (ancho_max + 16)]
+        for numero, opcion in zip(numeros, opciones):
+            linea_menu = f"{numero:<3}.- {opcion}"
+            lineas.append(f"||{' ' * 4}{linea_menu:{ancho_max + 8}}||")
+        if not opciones:
+            lineas.append(f"||{' ' * 4}{'(sin coincidencias)':{ancho_max + 8}}||")
+        lineas.append(separador * (ancho_max + 16))
+        return lineas
+
+    @staticmethod
+    def mostrar_menu(opciones, numeros=None):
+        """
+        Muestra un menú interactivo de opciones disponibles 
+
+        Args:
+            opciones (list): Lista de temas a mostrar.
+            numeros (list, optional): Número de cada tema en el menú; por defecto, desde 1.
+        """
+        print("\n".join(InteraccionConsola.lineas_menu(opciones, numeros)))
+
+    def leer_linea(self, mensaje):
+        """
+        Muestra un mensaje y lee una línea, con el lector si lo hay.
+
+        Returns:
+            str: La línea sin el salto final.
+
+        Raises:
+            EOFError: Si la entrada terminó.
+        """
+        if self.lector is None:
+            return input(mensaje)
+        print(mensaje, end="", flush=True)
+        return self.lector.leer_linea()
+
+    def obtener_indice_temas(self, opciones):
+        """
+        Returns:
+            IndiceTemas: El índice de las opciones, reutilizando el anterior si no cambiaron.
+        """
+        if self.indice_temas is None or self.indice_temas.temas != list(opciones):
+            self.indice_temas = IndiceTemas(opciones)
+        return self.indice_temas
 
     def seleccionar_tema(self, opciones):
         """
         Captura la selección del usuario para elegir un tema del menú.
 
+        El menú se muestra por páginas. El jugador puede escribir el número de un
+        tema o parte de su nombre para filtrarlo; si el filtro deja un solo tema, se
+        elige ese. Con `teclas` el filtro se aplica en cada tecla; si no, en cada línea.
+
         Args:
             opciones (list): Lista de temas disponibles.
 
         Returns:
             str: El tema seleccionado por el usuario.
         """
-        self.mostrar_menu(opciones)
-        opciones_numericas = {str(i + 1): opcion for i, opcion in enumerate(opciones)}
+        menu = MenuTemas(self.obtener_indice_temas(opciones), self.tamano_pagina)
+        if self.teclas:
+            return self.seleccionar_tema_teclas(menu)
         while True:
-            opcion_seleccionada = input("Selecciona una opción: ")
-            if opcion_seleccionada in opciones_numericas:
-                return opciones_numericas[opcion_seleccionada]
-            print("Opción no válida. Intenta de nuevo.")
+            self.mostrar_pagina(menu)
+            opcion_seleccionada = self.leer_linea("Selecciona una opción: ").strip()
+            if opcion_seleccionada in (">", "<"):
+                menu.cambiar_pagina(1 if opcion_seleccionada == ">" else -1)
+                continue
+            menu.reemplazar(opcion_seleccionada)
+            tema = menu.elegido()
+            if tema is not None:
+                return tema
+            if menu.numero is not None or not menu.coincidencias:
+                print("Opción no válida. Intenta de nuevo.")
+
+    def mostrar_pagina(self, menu):
+        """Muestra la página visible del menú y, si hace falta, cómo cambiar de página."""
+        numeros, temas = zip(*menu.visibles()) if menu.coincidencias else ((), ())
+        self.mostrar_menu(list(temas), list(numeros))
+        if menu.paginas > 1 or menu.texto:
+            print(f"{menu.resumen()}  (> siguiente, < anterior, o escribe para filtrar)")
+
+    def seleccionar_tema_teclas(self, menu):
+        """
+        Menú que se filtra en cada tecla: la terminal se lee sin esperar el enter y
+        solo se redibujan las líneas de la página que cambiaron.
+
+        Args:
+            menu (MenuTemas): El estado del menú.
+
+        Returns:
+            str: El tema seleccionado.
+        """
+        descriptor = sys.stdin.fileno()
+        configuracion = termios.tcgetattr(descriptor)
+        renderizador = RenderizadorTerminal()
+        try:
+            tty.setcbreak(descriptor)
+            while True:
+                numeros, temas = zip(*menu.visibles()) if menu.coincidencias else ((), ())
+                renderizador.dibujar([*self.lineas_menu(list(temas), list(numeros)), menu.resumen(),
+                                      "Escribe un número o parte del tema; Tab o > y < cambian de página"])
+                sys.stdout.write(f"Selecciona una opción: {menu.texto}")
+                sys.stdout.flush()
+                tecla = os.read(descriptor, 8).decode("utf-8", "replace")
+                if tecla in ("\r", "\n"):
+                    tema = menu.elegido()
+                    if tema is not None:
+                        return tema
+                    renderizador.mostrar_estado("Opción no válida. Intenta de nuevo.")
+                elif tecla in TECLAS_BORRAR:
+                    menu.borrar()
+                elif tecla in TECLAS_PAGINA_SIGUIENTE:
+                    menu.cambiar_pagina(1)
+                elif tecla in TECLAS_PAGINA_ANTERIOR:
+                    menu.cambiar_pagina(-1)
+                elif tecla.isprintable():
+                    menu.escribir(tecla)
+        finally:
+            termios.tcsetattr(descriptor, termios.TCSADRAIN, configuracion)
+            if renderizador.temporizador is not None:
+                renderizador.temporizador.cancel()
+            print()
 
     def mostrar_instrucciones(self):
         """Muestra las instrucciones del juego al usuario."""
@@ -73,7 +210,7 @@ class InteraccionConsola:
         ¡Buena suerte, y que comience el desafío!
         """
         print(instrucciones)
-        input("Presiona enter para continuar . . .")
+        self.leer_linea("Presiona enter para continuar . . .")
         self.limpiar_pantalla()
 
 
@@ -82,7 +219,8 @@ class InteraccionConsola:
 class ControladorAhorcado:
     """Clase controladora para gestionar el flujo del juego del ahorcado."""
 
-    def __init__(self, juego, diagrama, interacciones):
+    def __init__(self, juego, diagrama, interacciones, renderizador=None, bitacora=None,
+                 reloj=None, lector=None):
         """
         Inicializa el controlador del juego del ahorcado.
 
@@ -90,43 +228,150 @@ class ControladorAhorcado:
             juego (Juego): Instancia del juego.
             diagrama (DiagramaAhorcado): Instancia para dibujar el diagrama del ahorcado.
             interacciones (InteraccionConsola): Instancia para gestionar la interacción en consola.
+            renderizador (RenderizadorTerminal, optional): Si se indica, cada turno se
+                redibuja con secuencias ANSI en lugar de limpiar la pantalla, y los
+                mensajes de estado se borran solos sin pausar el juego.
+            bitacora (Bitacora, optional): Si se indica, la partida y cada turno se registran en ella.
+            reloj (RelojPartida, optional): Activa el modo cronometrado: cada turno
+                y la partida tienen un plazo, un turno vencido cuenta como error y el
+                tiempo sobrante suma puntos.
+            lector (LectorEntrada, optional): Lector de la entrada en el modo
+                cronometrado; por defecto, el de `interacciones` o uno nuevo sobre `sys.stdin`.
         """
         self.juego = juego
         self.diagrama = diagrama
         self.interacciones = interacciones
+        self.renderizador = renderizador
+        self.bitacora = bitacora
+        self.reloj = reloj
+        if lector is None and reloj is not None:
+            lector = interacciones.lector or LectorEntrada()
+        self.lector = lector
 
     def mostrar_avance(self):
         """Muestra el estado actual del juego y el progreso del jugador."""
+        if self.renderizador is not None:
+            self.renderizador.dibujar(self.lineas_avance())
+            return
         self.interacciones.limpiar_pantalla()
         self.diagrama.dibujar(self.juego.errores)
-        
+
+    def lineas_avance(self):
+        """
+        Construye las líneas del cuadro con el diagrama y el progreso del jugador.
+
+        Returns:
+            list: Las líneas del cuadro.
+        """
+        diagrama = self.diagrama.renderizar(self.juego.errores)
+        lineas = [*diagrama.splitlines(), f"Progreso: {self.juego.avance}"]
+        if self.reloj is not None:
+            lineas.append(f"Tiempo: {self.reloj.texto()}")
+        return lineas
+
+    def leer_entrada(self):
+        """
+        Pide la entrada del turno; en el modo cronometrado espera solo hasta el plazo
+        y, con renderizador, actualiza la cuenta regresiva una vez por segundo.
+
+        Returns:
+            str: La entrada del jugador, o None si venció el plazo.
+
+        Raises:
+            EOFError: Si la entrada terminó.
+        """
+        mensaje = "Ingresa una letra o intenta adivinar la palabra: "
+        if self.reloj is None:
+            return self.interacciones.leer_linea(mensaje)
+        if self.renderizador is None:
+            print(f"Tiempo: {self.reloj.texto()}")
+            al_tic = None
+        else:
+            al_tic = self.mostrar_cuenta
+        print(mensaje, end="", flush=True)
+        entrada_usuario = self.lector.leer_linea(self.reloj.limite(), al_tic)
+        if entrada_usuario is None:
+            self.lector.descartar_pendiente()
+            print()
+        return entrada_usuario
+
+    def mostrar_cuenta(self, restante):
+        """Redibuja la línea de la cuenta regresiva sin tocar lo que el jugador está escribiendo."""
+        self.renderizador.actualizar_linea(-1, f"Tiempo: {self.reloj.texto()}")
+
+    def mostrar_mensaje(self, mensaje):
+        """
+        Muestra un mensaje de estado del turno.
+
+        Args:
+            mensaje (str): El mensaje a mostrar.
+        """
+        if self.renderizador is not None:
+            self.renderizador.mostrar_estado(mensaje)
+        else:
+            print(mensaje)
+            time.sleep(2)
         
     def jugar(self):
-        """Ejecuta el bucle principal del juego, gestionando cada turno."""
+        """
+        Ejecuta el bucle principal del juego, gestionando cada turno.
+
+        Returns:
+            int: Los puntos obtenidos si el jugador ganó, o None si perdió.
+        """
         print("¡El juego ha comenzado! Adivina la palabra.")
-        while self.juego.errores < self.juego.intentos_max:
+        id_bitacora = self.bitacora.iniciar(self.juego.palabra) if self.bitacora is not None else None
+        if self.reloj is not None:
+            self.reloj.iniciar()
+        while (self.juego.errores < self.juego.intentos_max
+               and not (self.reloj is not None and self.reloj.partida_agotada())):
+            if self.reloj is not None:
+                self.reloj.iniciar_turno()
             self.mostrar_avance()
-            print(f"Progreso: {self.juego.avance}")
-            entrada_usuario = input("Ingresa una letra o intenta adivinar la palabra: ")
+            if self.renderizador is None:
+                print(f"Progreso: {self.juego.avance}")
+            try:
+                entrada_usuario = self.leer_entrada()
+            except EOFError:
+                print()
+                print("La entrada terminó antes que la partida.")
+                print(f"La palabra secreta era: {self.juego.palabra}")
+                return None
           
-            resultado_turno, puntos = self.juego.jugar_turno(entrada_usuario)        
-            if resultado_turno in [EstadoJuego.LETRAS_COMPLETAS, EstadoJuego.PALABRA_CORRECTA]:
+            if entrada_usuario is None:
+                resultado_turno, puntos = self.juego.expirar_turno()
+            else:
+                resultado_turno, puntos = self.juego.jugar_turno(entrada_usuario)        
+            gano = resultado_turno in [EstadoJuego.LETRAS_COMPLETAS, EstadoJuego.PALABRA_CORRECTA]
+            segundos_restantes = 0
+            if gano and self.reloj is not None:
+                segundos_restantes = self.reloj.segundos_restantes()
+                puntos = self.juego.calcular_puntos(segundos_restantes)
+            if self.bitacora is not None:
+                self.bitacora.registrar(id_bitacora, entrada_usuario or "", resultado_turno,
+                                        puntos, segundos_restantes)
+            if gano:
                 self.mostrar_avance()
                 print(f"La palabra es: {' '.join(self.juego.palabra)}")
                 print("¡¡¡Felicidades, ganaste!!!")
                 print(f"Puntos: {puntos}")
-                break
+                if self.juego.instrumentacion is not None:
+                    self.juego.instrumentacion.juego_terminado(self.juego, True, puntos)
+                return puntos
            
             elif resultado_turno in {EstadoJuego.PALABRA_FUERA_DE_TIEMPO,
+                                     EstadoJuego.TIEMPO_AGOTADO,
                                      EstadoJuego.LETRA_INCORRECTA,
                                      EstadoJuego.LETRA_REPETIDA}:
-                print(resultado_turno.value)
-                time.sleep(2)
+                self.mostrar_mensaje(resultado_turno.value)
         
         else:
             self.mostrar_avance()
             print("¡¡¡Perdiste!!!")
             print(f"La palabra secreta era: {self.juego.palabra}")
+            if self.juego.instrumentacion is not None:
+                self.juego.instrumentacion.juego_terminado(self.juego, False, self.juego.calcular_puntos())
+        return None
 
 
 
@@ -1,5 +1,8 @@
-import unicodedata
+import struct
+from collections import namedtuple
+from functools import lru_cache
 from palabras import GestorPalabras
+from normalizador import normalizar
 from enum import Enum
 
 class EstadoJuego(Enum):
@@ -16,12 +19,125 @@ class EstadoJuego(Enum):
     # Se ingresa toda la palabra completa y es correcta
     PALABRA_CORRECTA = "Palabra correcta"
     PALABRA_FUERA_DE_TIEMPO = "Palabra fuera de tiempo ya no puedes adivinar la palabra completa"
+    # Se acaba el tiempo del turno sin que el jugador ingrese nada; cuenta como error
+    TIEMPO_AGOTADO = "Se acabó el tiempo del turno"
+
+
+# Puntos extra por cada segundo que sobra en el modo cronometrado
+PUNTOS_POR_SEGUNDO = 2
+
+# Alfabeto normalizado representado como máscara de bits en el estado de cada juego
+ALFABETO = "abcdefghijklmnopqrstuvwxyzñ"
+BIT_LETRA = {letra: 1 << posicion for posicion, letra in enumerate(ALFABETO)}
+
+# versión, errores, intentos_max, puntos, letras_restantes, máscaras de usadas, incorrectas y adivinadas
+CABECERA_ESTADO = struct.Struct("<BHHhHIII")
+VERSION_ESTADO = 1
+
+IndicePalabra = namedtuple("IndicePalabra", "palabra_normalizada mascaras todas")
+IndicePalabra.__doc__ = """
+Índice de una palabra compartido por todos los juegos que la usan.
+
+Attributes:
+    palabra_normalizada (str): La palabra normalizada.
+    mascaras (dict): Letra normalizada -> máscara de bits de sus posiciones en la palabra.
+    todas (int): Máscara con todas las posiciones de la palabra.
+"""
+
+
+@lru_cache(maxsize=65536)
+def indexar_palabra(palabra):
+    """
+    Construye el índice letra normalizada -> posiciones de una palabra.
+
+    Args:
+        palabra (str): La palabra a indexar.
+
+    Returns:
+        IndicePalabra: El índice de la palabra.
+    """
+    mascaras = {}
+    for posicion, letra in enumerate(palabra):
+        letra_normal = normalizar(letra)
+        mascaras[letra_normal] = mascaras.get(letra_normal, 0) | 1 << posicion
+    return IndicePalabra(normalizar(palabra), mascaras, (1 << len(palabra)) - 1)
+
+
+def escribir_varint(buffer, valor):
+    """Agrega un entero no negativo al búfer en formato varint (7 bits por byte)."""
+    while valor > 0x7F:
+        buffer.append(valor & 0x7F | 0x80)
+        valor >>= 7
+    buffer.append(valor)
+
+
+def leer_varint(datos, posicion):
+    """
+    Lee un entero varint de los datos.
+
+    Returns:
+        tuple: (valor, posición siguiente).
+    """
+    valor = desplazamiento = 0
+    while True:
+        byte = datos[posicion]
+        posicion += 1
+        valor |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return valor, posicion
+        desplazamiento += 7
+
+
+def separar_letras(letras):
+    """
+    Separa un conjunto de entradas en la máscara de letras del alfabeto y el resto.
+
+    Args:
+        letras (iterable): Letras o palabras normalizadas.
+
+    Returns:
+        tuple: (máscara de bits, set con las demás entradas o None si no hay).
+    """
+    mascara = 0
+    otras = set()
+    for letra in letras:
+        bit = BIT_LETRA.get(letra)
+        if bit:
+            mascara |= bit
+        else:
+            otras.add(letra)
+    return mascara, otras or None
+
+
+def unir_letras(mascara, otras):
+    """
+    Reconstruye el conjunto de entradas a partir de su máscara y las demás entradas.
+
+    Returns:
+        frozenset: Las letras y palabras normalizadas. Es de solo lectura porque es
+            una copia: modificarlo no cambiaría el juego.
+    """
+    letras = {letra for letra, bit in BIT_LETRA.items() if mascara & bit}
+    if otras:
+        letras |= otras
+    return frozenset(letras)
 
 
-print(EstadoJuego.LETRA_INCORRECTA.value)
 class Juego:
-    """Clase que representa el juego de adivinanza de palabras."""
-    
+    """
+    Clase que representa el juego de adivinanza de palabras.
+
+    El estado es compacto: las letras del alfabeto usadas, incorrectas y adivinadas
+    se guardan como máscaras de bits y las demás entradas (palabras completas,
+    otros símbolos) en conjuntos aparte que solo se crean si hacen falta. Las
+    posiciones reveladas son otra máscara de bits sobre la palabra.
+    """
+    __slots__ = ("palabra", "indice", "errores", "puntos", "intentos_max", "letras_restantes",
+                 "revelado", "mascara_usadas", "mascara_incorrectas", "mascara_adivinadas",
+                 "otras_usadas", "otras_incorrectas", "otras_adivinadas")
+    # Instrumentación opcional compartida por todos los juegos (ver metricas.Instrumentacion)
+    instrumentacion = None
+
     def __init__(self, palabra):
         """
         Inicializa el juego con la palabra a adivinar.
@@ -30,17 +146,54 @@ class Juego:
             palabra (str): La palabra que el jugador intentará adivinar.
         """
         self.palabra = palabra
-        self.palabra_normalizada = self.normalizar_letra(self.palabra)
+        # Índice letra normalizada -> posiciones, compartido entre juegos con la misma palabra
+        self.indice = indexar_palabra(palabra)
         self.errores = 0
-        self.letras_usadas = set()
-        self.letras_incorrectas = set()
-        self.letras_adivinadas = set()
-        self.avance = "_ " * len(self.palabra)
-        letras_unicas = set(self.normalizar_letra(self.palabra))
-        self.letras_restantes = len(letras_unicas) - len(self.letras_adivinadas)
+        self.mascara_usadas = self.mascara_incorrectas = self.mascara_adivinadas = 0
+        self.otras_usadas = self.otras_incorrectas = self.otras_adivinadas = None
+        self.revelado = 0
+        self.letras_restantes = len(self.indice.mascaras)
         self.puntos = 0
         self.intentos_max = 6
-        
+
+    @property
+    def palabra_normalizada(self):
+        """str: La palabra a adivinar normalizada."""
+        return self.indice.palabra_normalizada
+
+    @property
+    def letras_usadas(self):
+        """frozenset: Letras y palabras normalizadas ya jugadas; se reemplaza asignando un conjunto."""
+        return unir_letras(self.mascara_usadas, self.otras_usadas)
+
+    @letras_usadas.setter
+    def letras_usadas(self, letras):
+        self.mascara_usadas, self.otras_usadas = separar_letras(letras)
+
+    @property
+    def letras_incorrectas(self):
+        """frozenset: Letras jugadas que no están en la palabra; se reemplaza asignando un conjunto."""
+        return unir_letras(self.mascara_incorrectas, self.otras_incorrectas)
+
+    @letras_incorrectas.setter
+    def letras_incorrectas(self, letras):
+        self.mascara_incorrectas, self.otras_incorrectas = separar_letras(letras)
+
+    @property
+    def letras_adivinadas(self):
+        """frozenset: Letras y palabras jugadas que no se contaron como error; se reemplaza asignando un conjunto."""
+        return unir_letras(self.mascara_adivinadas, self.otras_adivinadas)
+
+    @letras_adivinadas.setter
+    def letras_adivinadas(self, letras):
+        self.mascara_adivinadas, self.otras_adivinadas = separar_letras(letras)
+
+    @property
+    def avance(self):
+        """str: La palabra con guiones en las posiciones que aún no se han revelado."""
+        revelado = self.revelado
+        return " ".join([letra if revelado >> posicion & 1 else "_"
+                         for posicion, letra in enumerate(self.palabra)])
 
     def normalizar_letra(self, letra):
         """
@@ -53,20 +206,7 @@ class Juego:
         Returns:
             str: La letra o palabra normalizada.
         """
-        # Convertir a minúsculas
-        letra = letra.lower()
-
-        # Reemplazar "ñ" con un marcador temporal antes de normalizar
-        letra = letra.replace("ñ", "__TEMP_N__")
-
-        # Descomponer caracteres y eliminar marcas de acento
-        letra = ''.join(
-            c for c in unicodedata.normalize('NFD', letra)
-            if unicodedata.category(c) != 'Mn'
-        )
-
-        # Restaurar "ñ" desde el marcador
-        return letra.replace("__TEMP_N__", "ñ")
+        return normalizar(letra)
 
 
     def verificar_ganar_letra(self):
@@ -76,7 +216,7 @@ class Juego:
         Returns:
             bool: True si todas las letras han sido adivinadas, False en caso contrario.
         """
-        return "_" not in self.avance
+        return self.revelado == self.indice.todas
     
     def verificar_ganar_palabra(self, entrada_usuario):
         """
@@ -91,30 +231,71 @@ class Juego:
         return (len(entrada_usuario) > 1 
                 and entrada_usuario == self.palabra_normalizada)
     
-    def generar_avance(self):
+    def generar_avance(self, letra=None):
         """
         Actualiza el progreso del jugador cambiando los 
         guiones por las letras adivinadas correctamente.
+
+        Con una letra solo se revelan sus posiciones; sin argumentos se
+        sincroniza el avance completo con `letras_adivinadas`.
+
+        Args:
+            letra (str, optional): Letra normalizada recién adivinada.
         """
-        self.avance = " ".join([letra if self.normalizar_letra(letra) in 
-                                self.letras_adivinadas else "_"
-                                for letra in self.palabra])
-        
-        letras_unicas = set(self.normalizar_letra(self.palabra))
-        self.letras_restantes = len(letras_unicas) - len(self.letras_adivinadas)
+        if letra is None:
+            self.revelado = 0
+            self.letras_restantes = len(self.indice.mascaras)
+            letras = self.letras_adivinadas
+        else:
+            letras = (letra,)
+
+        for letra_adivinada in letras:
+            posiciones = self.indice.mascaras.get(letra_adivinada, 0)
+            if posiciones and not self.revelado & posiciones:
+                self.revelado |= posiciones
+                self.letras_restantes -= 1
        
-    def calcular_puntos(self):
+    def calcular_puntos(self, segundos_restantes=0):
         """Calcula la puntuación al terminar el juego
+
+        Args:
+            segundos_restantes (float): Segundos que le sobraron al jugador en el
+                modo cronometrado; cada segundo completo suma `PUNTOS_POR_SEGUNDO`.
+
         Returns:
-            int: Puntuación considerando letras restantes y 
-                 cantidad de errores
+            int: Puntuación considerando letras restantes, 
+                 cantidad de errores y tiempo sobrante
         """
 
         puntos = (200 + (self.letras_restantes) * 20 
-                      - len(self.letras_incorrectas) * 5)
+                      - len(self.letras_incorrectas) * 5
+                      + int(max(segundos_restantes, 0)) * PUNTOS_POR_SEGUNDO)
 
         return puntos
 
+    def expirar_turno(self):
+        """
+        Registra un turno en el que se acabó el tiempo sin que el jugador jugara; cuenta como error.
+
+        Returns:
+            EstadoJuego: `TIEMPO_AGOTADO`.
+            int: 0 puntos.
+        """
+        if self.instrumentacion is not None:
+            return self.instrumentacion.medir_turno(self, None)
+        return self.procesar_expiracion()
+
+    def procesar_expiracion(self):
+        """
+        Aplica un turno vencido al estado del juego, sin instrumentación.
+
+        Returns:
+            EstadoJuego: `TIEMPO_AGOTADO`.
+            int: 0 puntos.
+        """
+        self.errores += 1
+        return EstadoJuego.TIEMPO_AGOTADO, 0
+
     def jugar_turno(self, entrada_usuario):
         """
         Procesa el turno del jugador con la entrada dada y actualiza el estado del juego.
@@ -126,19 +307,47 @@ class Juego:
             EstadoJuego: El estado actual del juego después de la entrada del jugador.
             int: La puntuación obtenida en el turno actual.
         """
-        
+        if self.instrumentacion is not None:
+            return self.instrumentacion.medir_turno(self, entrada_usuario)
+        return self.procesar_turno(entrada_usuario)
+
+    def procesar_turno(self, entrada_usuario):
+        """
+        Aplica la entrada del jugador al estado del juego, sin instrumentación.
+
+        Args:
+            entrada_usuario (str): La letra o palabra ingresada por el jugador.
+
+        Returns:
+            EstadoJuego: El estado actual del juego después de la entrada del jugador.
+            int: La puntuación obtenida en el turno actual.
+        """
         entrada_normal = self.normalizar_letra(entrada_usuario)
+        bit = BIT_LETRA.get(entrada_normal, 0)
         
         # Verificar si la letra ya fue usada
-        if entrada_normal in self.letras_usadas:
+        if bit:
+            if self.mascara_usadas & bit:
+                return EstadoJuego.LETRA_REPETIDA, 0
+        elif self.otras_usadas is not None and entrada_normal in self.otras_usadas:
             return EstadoJuego.LETRA_REPETIDA, 0
             
         # Agregar la entrada a las letras usadas
-        self.letras_usadas.add(entrada_normal)
+        if bit:
+            self.mascara_usadas |= bit
+        elif self.otras_usadas is None:
+            self.otras_usadas = {entrada_normal}
+        else:
+            self.otras_usadas.add(entrada_normal)
         
         # Verificar si es una letra incorrecta
         if len(entrada_normal) == 1 and entrada_normal not in self.palabra_normalizada:
-            self.letras_incorrectas.add(entrada_normal)
+            if bit:
+                self.mascara_incorrectas |= bit
+            elif self.otras_incorrectas is None:
+                self.otras_incorrectas = {entrada_normal}
+            else:
+                self.otras_incorrectas.add(entrada_normal)
             self.errores += 1
             
             return EstadoJuego.LETRA_INCORRECTA, 0
@@ -151,8 +360,13 @@ class Juego:
         if self.verificar_ganar_palabra(entrada_normal):
             return EstadoJuego.PALABRA_CORRECTA, self.calcular_puntos()
         
-        self.letras_adivinadas.add(entrada_normal)
-        self.generar_avance()
+        if bit:
+            self.mascara_adivinadas |= bit
+        elif self.otras_adivinadas is None:
+            self.otras_adivinadas = {entrada_normal}
+        else:
+            self.otras_adivinadas.add(entrada_normal)
+        self.generar_avance(entrada_normal)
        
         # Verificar si se completaron todas las letras
         if self.verificar_ganar_letra():
@@ -160,3 +374,62 @@ class Juego:
 
         return EstadoJuego.SEGUIR_JUGANDO, 0
 
+    def to_bytes(self):
+        """
+        Serializa el estado del juego en un formato binario compacto.
+
+        Returns:
+            bytes: El estado serializado.
+        """
+        buffer = bytearray(CABECERA_ESTADO.pack(
+            VERSION_ESTADO, self.errores, self.intentos_max, self.puntos, self.letras_restantes,
+            self.mascara_usadas, self.mascara_incorrectas, self.mascara_adivinadas))
+        for texto in (self.palabra.encode('utf-8'),
+                      self.revelado.to_bytes((len(self.palabra) + 7) // 8, "little")):
+            escribir_varint(buffer, len(texto))
+            buffer += texto
+        for otras in (self.otras_usadas, self.otras_incorrectas, self.otras_adivinadas):
+            escribir_varint(buffer, len(otras or ()))
+            for entrada in sorted(otras or ()):
+                codificada = entrada.encode('utf-8')
+                escribir_varint(buffer, len(codificada))
+                buffer += codificada
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, datos):
+        """
+        Reconstruye un juego a partir de su estado serializado, sin repetir los turnos.
+
+        Args:
+            datos (bytes): El estado generado por `to_bytes`.
+
+        Returns:
+            Juego: El juego reconstruido.
+        """
+        (version, errores, intentos_max, puntos, letras_restantes,
+         usadas, incorrectas, adivinadas) = CABECERA_ESTADO.unpack_from(datos)
+        if version != VERSION_ESTADO:
+            raise ValueError(f"Versión de estado no soportada: {version}")
+        posicion = CABECERA_ESTADO.size
+        campos = []
+        for _ in range(2):
+            longitud, posicion = leer_varint(datos, posicion)
+            campos.append(bytes(datos[posicion:posicion + longitud]))
+            posicion += longitud
+        juego = cls(campos[0].decode('utf-8'))
+        juego.revelado = int.from_bytes(campos[1], "little")
+        juego.errores, juego.intentos_max, juego.puntos = errores, intentos_max, puntos
+        juego.letras_restantes = letras_restantes
+        juego.mascara_usadas, juego.mascara_incorrectas, juego.mascara_adivinadas = usadas, incorrectas, adivinadas
+        otras = []
+        for _ in range(3):
+            cantidad, posicion = leer_varint(datos, posicion)
+            entradas = set()
+            for _ in range(cantidad):
+                longitud, posicion = leer_varint(datos, posicion)
+                entradas.add(bytes(datos[posicion:posicion + longitud]).decode('utf-8'))
+                posicion += longitud
+            otras.append(entradas or None)
+        juego.otras_usadas, juego.otras_incorrectas, juego.otras_adivinadas = otras
+        return juego
@@ -0,0 +1,275 @@
+import numpy as np
+
+from juego import ALFABETO, BIT_LETRA, EstadoJuego, indexar_palabra
+from normalizador import LIMITE_LATINO, normalizar, normalizar_lote
+
+# Las posiciones reveladas de cada partida se guardan en una máscara de 64 bits
+LONGITUD_MAXIMA = 64
+# Código de las entradas que no son una letra del alfabeto; se resuelven una por una
+CODIGO_OTRA = len(ALFABETO)
+# Código de estado de las partidas que no jugaron en un paso
+SIN_TURNO = -1
+ESTADOS = tuple(EstadoJuego)
+CODIGO_ESTADO = {estado: codigo for codigo, estado in enumerate(ESTADOS)}
+BITS_ALFABETO = np.left_shift(np.int64(1), np.arange(len(ALFABETO), dtype=np.int64))
+
+
+def contar_bits(mascaras):
+    """Cantidad de bits encendidos de cada máscara no negativa."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(mascaras).astype(np.int64)
+    bytes_mascaras = np.ascontiguousarray(mascaras, dtype="<u8").view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(bytes_mascaras, axis=1).sum(axis=1, dtype=np.int64)
+
+
+class LoteJuegos:
+    """
+    Muchas partidas que avanzan a la vez, un turno por partida en cada paso.
+
+    Las palabras distintas se codifican en una matriz (palabras, longitud) con el
+    código de cada letra normalizada (las del alfabeto son su posición en
+    `ALFABETO`; las demás partes normalizadas reciben códigos desde `CODIGO_OTRA`;
+    -1 rellena). De ella se precalculan, por palabra, la máscara de posiciones de
+    cada letra del alfabeto y la máscara de letras que contiene. El estado de las
+    partidas son arreglos con las mismas máscaras que `Juego`, así que un paso con
+    letras del alfabeto se resuelve con operaciones vectorizadas. Las entradas que
+    no son una letra del alfabeto (palabras completas, otros símbolos) se
+    resuelven una por una con las mismas reglas; son pocas en una estrategia típica.
+
+    Los estados y puntos de cada turno son exactamente los de `Juego.jugar_turno`
+    con la misma palabra y las mismas entradas, incluso después de terminada la partida.
+
+    Attributes:
+        palabras (list): Las palabras distintas del lote.
+        normalizadas (list): Cada palabra normalizada.
+        codigos (numpy.ndarray): Matriz de códigos de letras normalizadas, con -1 de relleno.
+        posiciones (numpy.ndarray): Máscara de posiciones de cada letra del alfabeto, por palabra.
+        contiene (numpy.ndarray): Máscara de las letras del alfabeto de cada palabra normalizada.
+        todas (numpy.ndarray): Máscara con todas las posiciones de cada palabra.
+        fila (numpy.ndarray): Palabra (fila) de cada partida.
+        errores, letras_restantes, revelado (numpy.ndarray): Estado de cada partida, como en `Juego`.
+        mascara_usadas, mascara_incorrectas, mascara_adivinadas (numpy.ndarray): Letras del
+            alfabeto de cada partida, como en `Juego`.
+        otras_usadas, otras_incorrectas, otras_adivinadas (list): Las demás entradas de
+            cada partida, un set o None.
+        intentos_max (int): Errores permitidos por partida.
+    """
+
+    def __init__(self, palabras, intentos_max=6):
+        """
+        Args:
+            palabras (Sequence): La palabra de cada partida; pueden repetirse.
+            intentos_max (int): Errores permitidos por partida.
+
+        Raises:
+            ValueError: Si una palabra tiene más de `LONGITUD_MAXIMA` caracteres.
+        """
+        filas = {}
+        self.fila = np.fromiter((filas.setdefault(palabra, len(filas)) for palabra in palabras),
+                                dtype=np.intp, count=len(palabras))
+        self.palabras = list(filas)
+        if any(len(palabra) > LONGITUD_MAXIMA for palabra in self.palabras):
+            raise ValueError(f"El lote admite palabras de hasta {LONGITUD_MAXIMA} letras")
+        self.normalizadas = list(normalizar_lote(self.palabras))
+        self.extras = {}
+        self.codificar_palabras()
+
+        cantidad = len(self.fila)
+        self.intentos_max = intentos_max
+        self.errores = np.zeros(cantidad, dtype=np.int64)
+        self.mascara_usadas = np.zeros(cantidad, dtype=np.int64)
+        self.mascara_incorrectas = np.zeros(cantidad, dtype=np.int64)
+        self.mascara_adivinadas = np.zeros(cantidad, dtype=np.int64)
+        self.cantidad_otras_incorrectas = np.zeros(cantidad, dtype=np.int64)
+        self.otras_usadas = [None] * cantidad
+        self.otras_incorrectas = [None] * cantidad
+        self.otras_adivinadas = [None] * cantidad
+        self.revelado = np.zeros(cantidad, dtype=np.uint64)
+        self.letras_restantes = self.distintas[self.fila]
+
+    def __len__(self):
+        return len(self.fila)
+
+    def codigo(self, letra):
+        """Código de una letra normalizada (o parte normalizada de más de un carácter)."""
+        bit = BIT_LETRA.get(letra)
+        if bit:
+            return bit.bit_length() - 1
+        return self.extras.setdefault(letra, CODIGO_OTRA + len(self.extras))
+
+    def codificar_palabras(self):
+        """
+        Construye la matriz de códigos y las máscaras por palabra.
+
+        Una palabra latina cuya normalización conserva la longitud se normaliza
+        carácter a carácter, así que sus códigos salen de la palabra normalizada de
+        una vez; las demás se codifican carácter por carácter como `indexar_palabra`.
+        """
+        longitudes = np.fromiter(map(len, self.palabras), dtype=np.int64, count=len(self.palabras))
+        ancho = int(longitudes.max(initial=0))
+        self.codigos = np.full((len(self.palabras), ancho), -1, dtype=np.int32)
+        regulares = np.fromiter((len(normalizada) == len(palabra)
+                                 and (palabra.isascii() or ord(max(palabra)) <= LIMITE_LATINO)
+                                 for palabra, normalizada in zip(self.palabras, self.normalizadas)),
+                                dtype=bool, count=len(self.palabras))
+        if regulares.any():
+            texto = "".join(self.normalizadas[fila] for fila in np.flatnonzero(regulares))
+            puntos_codigo = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32)
+            distintos, inversos = np.unique(puntos_codigo, return_inverse=True)
+            traduccion = np.array([self.codigo(chr(punto)) for punto in distintos], dtype=np.int32)
+            ocupadas = np.arange(ancho) < longitudes[regulares][:, None]
+            submatriz = np.full((int(regulares.sum()), ancho), -1, dtype=np.int32)
+            submatriz[ocupadas] = traduccion[inversos.ravel()]
+            self.codigos[regulares] = submatriz
+        irregulares = np.flatnonzero(~regulares).tolist()
+        for fila in irregulares:
+            palabra = self.palabras[fila]
+            self.codigos[fila, :len(palabra)] = [self.codigo(normalizar(letra)) for letra in palabra]
+
+        # Una letra por posición: basta una asignación por posición para todas las palabras
+        filas = np.arange(len(self.palabras))
+        posiciones = np.zeros((len(self.palabras), CODIGO_OTRA + 1), dtype=np.uint64)
+        for posicion in range(ancho):
+            columna = np.clip(self.codigos[:, posicion], -1, CODIGO_OTRA)
+            ocupada = columna >= 0
+            posiciones[filas[ocupada], columna[ocupada]] |= np.uint64(1 << posicion)
+        self.posiciones = posiciones[:, :CODIGO_OTRA]
+        self.contiene = ((self.posiciones != 0) * BITS_ALFABETO).sum(axis=1)
+        for fila in irregulares:
+            self.contiene[fila] = sum(BIT_LETRA.get(letra, 0) for letra in set(self.normalizadas[fila]))
+        self.todas = np.zeros(len(self.palabras), dtype=np.uint64)
+        con_letras = longitudes > 0
+        self.todas[con_letras] = np.uint64(2 ** 64 - 1) >> (64 - longitudes[con_letras]).astype(np.uint64)
+        ordenados = np.sort(self.codigos, axis=1)
+        self.distintas = ((ordenados[:, 1:] != ordenados[:, :-1]) & (ordenados[:, 1:] >= 0)).sum(axis=1)
+        if ancho:
+            self.distintas += ordenados[:, 0] >= 0
+        self.distintas = self.distintas.astype(np.int64)
+
+    def jugar_turno(self, entradas):
+        """
+        Aplica una entrada a cada partida.
+
+        Args:
+            entradas (Sequence): La letra o palabra de cada partida, o None si esa
+                partida no juega en este paso.
+
+        Returns:
+            numpy.ndarray: El código de estado de cada partida (índice en `ESTADOS`,
+                o `SIN_TURNO`).
+            numpy.ndarray: Los puntos obtenidos por cada partida en este turno.
+        """
+        if len(entradas) != len(self):
+            raise ValueError(f"Se esperaban {len(self)} entradas y se recibieron {len(entradas)}")
+        normalizadas = {None: None}
+        codigos_entrada = {None: SIN_TURNO}
+        for entrada in set(entradas) - {None}:
+            normalizada = normalizadas[entrada] = normalizar(entrada)
+            bit = BIT_LETRA.get(normalizada)
+            codigos_entrada[entrada] = bit.bit_length() - 1 if bit else CODIGO_OTRA
+        codigos = np.fromiter(map(codigos_entrada.__getitem__, entradas), dtype=np.int64, count=len(entradas))
+
+        estados = np.full(len(self), SIN_TURNO, dtype=np.int8)
+        puntos = np.zeros(len(self), dtype=np.int64)
+        letras = np.flatnonzero((codigos >= 0) & (codigos < CODIGO_OTRA))
+        if len(letras):
+            self.jugar_letras(letras, codigos[letras], estados, puntos)
+        for juego in np.flatnonzero(codigos == CODIGO_OTRA).tolist():
+            estados[juego], puntos[juego] = self.jugar_otra(juego, normalizadas[entradas[juego]])
+        return estados, puntos
+
+    def jugar_letras(self, juegos, letras, estados, puntos):
+        """
+        Aplica a la vez una letra del alfabeto a cada una de las partidas dadas.
+
+        Args:
+            juegos (numpy.ndarray): Las partidas, sin repetir.
+            letras (numpy.ndarray): El código de la letra de cada una.
+            estados, puntos (numpy.ndarray): Resultados del paso, que se completan.
+        """
+        bits = BITS_ALFABETO[letras]
+        repetidas = self.mascara_usadas[juegos] & bits != 0
+        estados[juegos[repetidas]] = CODIGO_ESTADO[EstadoJuego.LETRA_REPETIDA]
+        nuevas = ~repetidas
+        juegos, letras, bits = juegos[nuevas], letras[nuevas], bits[nuevas]
+        self.mascara_usadas[juegos] |= bits
+
+        filas = self.fila[juegos]
+        incorrectas = self.contiene[filas] & bits == 0
+        fallidos = juegos[incorrectas]
+        self.mascara_incorrectas[fallidos] |= bits[incorrectas]
+        self.errores[fallidos] += 1
+        estados[fallidos] = CODIGO_ESTADO[EstadoJuego.LETRA_INCORRECTA]
+
+        correctas = ~incorrectas
+        juegos, letras, bits, filas = juegos[correctas], letras[correctas], bits[correctas], filas[correctas]
+        self.mascara_adivinadas[juegos] |= bits
+        posiciones = self.posiciones[filas, letras]
+        revelado = self.revelado[juegos]
+        reveladas = (posiciones != 0) & (revelado & posiciones == 0)
+        revelado = np.where(reveladas, revelado | posiciones, revelado)
+        self.revelado[juegos] = revelado
+        self.letras_restantes[juegos] -= reveladas
+
+        completas = revelado == self.todas[filas]
+        estados[juegos] = np.where(completas, CODIGO_ESTADO[EstadoJuego.LETRAS_COMPLETAS],
+                                   CODIGO_ESTADO[EstadoJuego.SEGUIR_JUGANDO])
+        ganadores = juegos[completas]
+        puntos[ganadores] = self.calcular_puntos(ganadores)
+
+    def jugar_otra(self, juego, entrada_normal):
+        """
+        Aplica a una partida una entrada que no es una letra del alfabeto, como `Juego.procesar_turno`.
+
+        Returns:
+            int: El código de estado.
+            int: Los puntos del turno.
+        """
+        usadas = self.otras_usadas[juego]
+        if usadas is not None and entrada_normal in usadas:
+            return CODIGO_ESTADO[EstadoJuego.LETRA_REPETIDA], 0
+        self.otras_usadas[juego] = (usadas or set()) | {entrada_normal}
+
+        fila = self.fila[juego]
+        palabra_normalizada = self.normalizadas[fila]
+        if len(entrada_normal) == 1 and entrada_normal not in palabra_normalizada:
+            self.otras_incorrectas[juego] = (self.otras_incorrectas[juego] or set()) | {entrada_normal}
+            self.cantidad_otras_incorrectas[juego] = len(self.otras_incorrectas[juego])
+            self.errores[juego] += 1
+            return CODIGO_ESTADO[EstadoJuego.LETRA_INCORRECTA], 0
+        if len(entrada_normal) > 1 and self.letras_restantes[juego] < 3:
+            return CODIGO_ESTADO[EstadoJuego.PALABRA_FUERA_DE_TIEMPO], 0
+        if len(entrada_normal) > 1 and entrada_normal == palabra_normalizada:
+            return CODIGO_ESTADO[EstadoJuego.PALABRA_CORRECTA], int(self.calcular_puntos([juego])[0])
+
+        self.otras_adivinadas[juego] = (self.otras_adivinadas[juego] or set()) | {entrada_normal}
+        posiciones = indexar_palabra(self.palabras[fila]).mascaras.get(entrada_normal, 0)
+        revelado = int(self.revelado[juego])
+        if posiciones and not revelado & posiciones:
+            self.revelado[juego] = revelado | posiciones
+            self.letras_restantes[juego] -= 1
+        if self.revelado[juego] == self.todas[fila]:
+            return CODIGO_ESTADO[EstadoJuego.LETRAS_COMPLETAS], int(self.calcular_puntos([juego])[0])
+        return CODIGO_ESTADO[EstadoJuego.SEGUIR_JUGANDO], 0
+
+    def calcular_puntos(self, juegos):
+        """Puntos de `Juego.calcular_puntos` de las partidas dadas (sin tiempo sobrante)."""
+        incorrectas = contar_bits(self.mascara_incorrectas[juegos]) + self.cantidad_otras_incorrectas[juegos]
+        return 200 + self.letras_restantes[juegos] * 20 - incorrectas * 5
+
+    @staticmethod
+    def estados(codigos):
+        """
+        Args:
+            codigos (Iterable): Códigos de estado devueltos por `jugar_turno`.
+
+        Returns:
+            list: El EstadoJuego de cada código, o None para `SIN_TURNO`.
+        """
+        return [ESTADOS[codigo] if codigo != SIN_TURNO else None for codigo in codigos]
+
+    def avance(self, juego):
+        """str: La palabra de una partida con guiones en las posiciones aún no reveladas."""
+        palabra = self.palabras[self.fila[juego]]
+        revelado = int(self.revelado[juego])
+        return " ".join([letra if revelado >> posicion & 1 else "_" for posicion, letra in enumerate(palabra)])
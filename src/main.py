@@ -1,17 +1,103 @@
+import argparse
+import asyncio
+import sys
 from palabras import GestorPalabras
 from diagrama import DiagramaAhorcado
 from juego import Juego
 from interfaz import InteraccionConsola, ControladorAhorcado
+from servidor import ServidorAhorcado
+from renderizado import RenderizadorTerminal
+from sesiones import AlmacenSesiones
+from metricas import Instrumentacion
+from clasificacion import Clasificaciones
+from bitacora import Bitacora
+from entrada import LectorEntrada, RelojPartida
+from recarga import VigilanteCorpus
 
 
 if __name__=="__main__":
-    interacciones = InteraccionConsola()
-    interacciones.mostrar_instrucciones()
-    diagrama_ahorcado = DiagramaAhorcado([])
-    gestor_palabras = GestorPalabras("src/temas_palabras.csv")
-    temas = gestor_palabras.obtener_temas()
-    tema = interacciones.seleccionar_tema(temas)
-    palabra = gestor_palabras.seleccionar_palabra(tema)
-    juego = Juego(palabra)
-    interfaz_ahorcado = ControladorAhorcado(juego, diagrama_ahorcado, interacciones)
-    interfaz_ahorcado.jugar()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Juego del ahorcado en consola.")
+    parser.add_argument("--csv", default="src/temas_palabras.csv", help="Archivo CSV con los temas y palabras")
+    parser.add_argument("--servidor", action="store_true", help="Atiende partidas remotas en lugar de jugar en la consola")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=5000)
+    parser.add_argument("--unix", default=None, help="Ruta de un socket Unix para el servidor")
+    parser.add_argument("--sin-ansi", action="store_true", help="Limpia la pantalla en cada turno en lugar de redibujar con ANSI")
+    parser.add_argument("--sesiones", default=None, help="Archivo SQLite donde el servidor guarda las partidas en curso")
+    parser.add_argument("--metricas", default=None, help="Archivo JSON Lines donde se agrega una instantánea de métricas al terminar")
+    parser.add_argument("--clasificacion", default=None, help="Archivo SQLite con la clasificación de las partidas ganadas")
+    parser.add_argument("--jugador", default="anonimo", help="Nombre con el que se registran los puntos en la clasificación")
+    parser.add_argument("--dificultad", choices=("facil", "media", "dificil"), default=None,
+                        help="Elige la palabra solo entre las de esa dificultad dentro del tema")
+    parser.add_argument("--adversario", action="store_true",
+                        help="La palabra no se fija al comenzar: se conserva la familia de candidatas más grande")
+    parser.add_argument("--tiempo-turno", type=float, default=None, help="Segundos por turno; un turno vencido cuenta como error")
+    parser.add_argument("--tiempo-partida", type=float, default=None, help="Segundos para toda la partida")
+    parser.add_argument("--bitacora", default=None, help="Carpeta donde se registran las partidas y sus turnos")
+    parser.add_argument("--recargar", type=float, default=None,
+                        help="Segundos entre comprobaciones del CSV para recargarlo en caliente en el servidor")
+    parser.add_argument("--inactividad", type=float, default=300, help="Segundos de inactividad antes de cerrar una sesión")
+    argumentos = parser.parse_args()
+    if argumentos.adversario and argumentos.bitacora:
+        parser.error("--adversario no se puede combinar con --bitacora: la palabra no se conoce al iniciar la partida")
+    instrumentacion = Instrumentacion().activar() if argumentos.metricas else None
+    bitacora = Bitacora(argumentos.bitacora) if argumentos.bitacora else None
+
+    if argumentos.servidor:
+        gestor_palabras = GestorPalabras(argumentos.csv, compilado=True)
+        almacen = AlmacenSesiones(argumentos.sesiones) if argumentos.sesiones else None
+        vigilante = VigilanteCorpus(gestor_palabras, argumentos.recargar).iniciar() if argumentos.recargar else None
+        servidor = ServidorAhorcado(gestor_palabras, tiempo_inactividad=argumentos.inactividad,
+                                    almacen=almacen, bitacora=bitacora)
+        try:
+            asyncio.run(servidor.servir(argumentos.host, argumentos.puerto, argumentos.unix))
+        finally:
+            if almacen is not None:
+                almacen.cerrar()
+            if bitacora is not None:
+                bitacora.cerrar()
+            if vigilante is not None:
+                vigilante.detener()
+            if instrumentacion is not None:
+                instrumentacion.exportar_jsonl(argumentos.metricas)
+    else:
+        cronometrado = argumentos.tiempo_turno is not None or argumentos.tiempo_partida is not None
+        # En el modo cronometrado toda la entrada pasa por el mismo lector, desde las instrucciones
+        lector = LectorEntrada() if cronometrado else None
+        interacciones = InteraccionConsola(teclas=False if argumentos.sin_ansi else None, lector=lector)
+        interacciones.mostrar_instrucciones()
+        diagrama_ahorcado = DiagramaAhorcado([])
+        gestor_palabras = GestorPalabras(argumentos.csv)
+        temas = gestor_palabras.obtener_temas()
+        tema = interacciones.seleccionar_tema(temas)
+        if argumentos.adversario:
+            from adversario import IndiceCandidatas, JuegoAdversario
+            palabras = gestor_palabras.opciones[tema]
+            if argumentos.dificultad:
+                palabras = gestor_palabras.obtener_indice_dificultad().palabras_banda(
+                    tema, argumentos.dificultad, palabras)
+            juego = JuegoAdversario(IndiceCandidatas(palabras))
+        else:
+            palabra = gestor_palabras.seleccionar_palabra(tema, dificultad=argumentos.dificultad)
+            juego = Juego(palabra)
+        usar_ansi = sys.stdout.isatty() and not argumentos.sin_ansi
+        renderizador = RenderizadorTerminal() if usar_ansi else None
+        reloj = RelojPartida(argumentos.tiempo_turno, argumentos.tiempo_partida) if cronometrado else None
+        interfaz_ahorcado = ControladorAhorcado(juego, diagrama_ahorcado, interacciones, renderizador,
+                                                bitacora, reloj, lector)
+        try:
+            puntos = interfaz_ahorcado.jugar()
+        finally:
+            if bitacora is not None:
+                bitacora.cerrar()
+        if argumentos.clasificacion:
+            with Clasificaciones(argumentos.clasificacion) as clasificaciones:
+                if puntos is not None:
+                    clasificaciones.registrar(argumentos.jugador, tema, puntos)
+                lugar_jugador = clasificaciones.posicion(argumentos.jugador, tema)
+                if lugar_jugador is not None:
+                    print(f"Lugar en {tema}: {lugar_jugador}")
+                for lugar, (jugador, mejores_puntos) in enumerate(clasificaciones.mejores(tema, 10), start=1):
+                    print(f"{lugar:>3}. {jugador:<20} {mejores_puntos}")
+        if instrumentacion is not None:
+            instrumentacion.exportar_jsonl(argumentos.metricas)
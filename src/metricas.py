@@ -0,0 +1,205 @@
+import json
+import time
+from bisect import bisect_left
+from juego import Juego
+from palabras import GestorPalabras
+
+# Límites superiores de las cubetas de duración de turno, en nanosegundos
+LIMITES_DURACION_NS = (1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000,
+                       250_000, 500_000, 1_000_000, 5_000_000, 10_000_000)
+# Límites superiores de las cubetas de puntos al terminar una partida
+LIMITES_PUNTOS = (0, 50, 100, 150, 200, 250, 300, 400, 500)
+EVENTOS = ("turno_inicio", "turno_fin", "palabra_seleccionada", "juego_terminado")
+
+
+class Histograma:
+    """
+    Histograma de cubetas fijas.
+
+    Attributes:
+        limites (tuple): Límites superiores de las cubetas, en orden creciente.
+        cubetas (list): Observaciones por cubeta; la última cuenta las mayores al último límite.
+        suma (int): Suma de todas las observaciones.
+    """
+
+    def __init__(self, limites):
+        self.limites = tuple(limites)
+        self.cubetas = [0] * (len(self.limites) + 1)
+        self.suma = 0
+
+    def registrar(self, valor):
+        """
+        Agrega una observación.
+
+        Args:
+            valor (int): El valor observado.
+        """
+        self.cubetas[bisect_left(self.limites, valor)] += 1
+        self.suma += valor
+
+    @property
+    def cuenta(self):
+        """int: Total de observaciones."""
+        return sum(self.cubetas)
+
+    def instantanea(self):
+        """
+        Returns:
+            dict: Límites, cubetas (no acumuladas), suma y cuenta.
+        """
+        cubetas = list(self.cubetas)
+        return {"limites": list(self.limites), "cubetas": cubetas,
+                "suma": self.suma, "cuenta": sum(cubetas)}
+
+
+def escapar_etiqueta(valor):
+    """Escapa el valor de una etiqueta para el formato de texto de Prometheus."""
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Instrumentacion:
+    """
+    Eventos y métricas agregadas de las partidas, opcionales.
+
+    Mientras no se active, `Juego` y `GestorPalabras` solo comprueban que su
+    atributo `instrumentacion` sea None. Los contadores se actualizan sin candados;
+    bajo hilos, una carrera puede perder algún incremento, lo que es aceptable para métricas.
+
+    Attributes:
+        turnos (dict): Nombre de EstadoJuego -> turnos con ese resultado.
+        duracion_turnos (Histograma): Duración de los turnos en nanosegundos.
+        palabras_seleccionadas (dict): Tema -> palabras seleccionadas.
+        partidas_terminadas (dict): "ganada"/"perdida" -> partidas.
+        puntos (Histograma): Puntos de `calcular_puntos` al terminar cada partida.
+        oyentes (dict): Evento -> funciones suscritas.
+    """
+
+    def __init__(self):
+        self.turnos = {}
+        self.duracion_turnos = Histograma(LIMITES_DURACION_NS)
+        self.palabras_seleccionadas = {}
+        self.partidas_terminadas = {"ganada": 0, "perdida": 0}
+        self.puntos = Histograma(LIMITES_PUNTOS)
+        self.oyentes = {evento: [] for evento in EVENTOS}
+
+    def activar(self):
+        """Instala esta instrumentación en `Juego` y `GestorPalabras`."""
+        Juego.instrumentacion = self
+        GestorPalabras.instrumentacion = self
+        return self
+
+    @staticmethod
+    def desactivar():
+        """Retira la instrumentación de `Juego` y `GestorPalabras`."""
+        Juego.instrumentacion = None
+        GestorPalabras.instrumentacion = None
+
+    def suscribir(self, evento, funcion):
+        """
+        Registra una función que se llamará con los argumentos del evento.
+
+        Args:
+            evento (str): Uno de "turno_inicio" (juego, entrada), "turno_fin"
+                (juego, entrada, estado, puntos, duracion_ns), "palabra_seleccionada"
+                (tema, palabra) o "juego_terminado" (juego, gano, puntos). La entrada
+                es None en los turnos vencidos.
+            funcion (callable): La función a llamar.
+        """
+        self.oyentes[evento].append(funcion)
+
+    def medir_turno(self, juego, entrada_usuario, *args):
+        """
+        Procesa un turno de `juego` emitiendo sus eventos y midiendo su duración.
+
+        Args:
+            juego (Juego): El juego del turno.
+            entrada_usuario (str): La entrada del jugador, o None si el turno venció.
+
+        Returns:
+            tuple: El resultado de `Juego.procesar_turno` o de `Juego.procesar_expiracion`.
+        """
+        for funcion in self.oyentes["turno_inicio"]:
+            funcion(juego, entrada_usuario)
+        inicio = time.perf_counter_ns()
+        if entrada_usuario is None:
+            estado, puntos = juego.procesar_expiracion()
+        else:
+            estado, puntos = juego.procesar_turno(entrada_usuario, *args)
+        duracion = time.perf_counter_ns() - inicio
+        self.turnos[estado.name] = self.turnos.get(estado.name, 0) + 1
+        self.duracion_turnos.registrar(duracion)
+        for funcion in self.oyentes["turno_fin"]:
+            funcion(juego, entrada_usuario, estado, puntos, duracion)
+        return estado, puntos
+
+    def palabra_seleccionada(self, tema, palabra):
+        """Registra la selección de una palabra de un tema."""
+        self.palabras_seleccionadas[tema] = self.palabras_seleccionadas.get(tema, 0) + 1
+        for funcion in self.oyentes["palabra_seleccionada"]:
+            funcion(tema, palabra)
+
+    def juego_terminado(self, juego, gano, puntos):
+        """Registra el final de una partida con los puntos de `calcular_puntos`."""
+        self.partidas_terminadas["ganada" if gano else "perdida"] += 1
+        self.puntos.registrar(puntos)
+        for funcion in self.oyentes["juego_terminado"]:
+            funcion(juego, gano, puntos)
+
+    def instantanea(self):
+        """
+        Copia el estado actual de todas las métricas.
+
+        Returns:
+            dict: Métricas serializables como JSON.
+        """
+        return {"marca_tiempo": time.time(),
+                "turnos": dict(self.turnos),
+                "duracion_turnos_ns": self.duracion_turnos.instantanea(),
+                "palabras_seleccionadas": dict(self.palabras_seleccionadas),
+                "partidas_terminadas": dict(self.partidas_terminadas),
+                "puntos": self.puntos.instantanea()}
+
+    def exportar_prometheus(self):
+        """
+        Exporta las métricas en el formato de texto de Prometheus.
+
+        Returns:
+            str: Las métricas, una por línea.
+        """
+        datos = self.instantanea()
+        lineas = ["# TYPE ahorcado_turnos_total counter"]
+        lineas += [f'ahorcado_turnos_total{{estado="{escapar_etiqueta(estado)}"}} {cantidad}'
+                   for estado, cantidad in datos["turnos"].items()]
+        lineas += self.lineas_histograma("ahorcado_turno_duracion_segundos",
+                                         datos["duracion_turnos_ns"], escala=1e-9)
+        lineas.append("# TYPE ahorcado_palabras_seleccionadas_total counter")
+        lineas += [f'ahorcado_palabras_seleccionadas_total{{tema="{escapar_etiqueta(tema)}"}} {cantidad}'
+                   for tema, cantidad in datos["palabras_seleccionadas"].items()]
+        lineas.append("# TYPE ahorcado_partidas_terminadas_total counter")
+        lineas += [f'ahorcado_partidas_terminadas_total{{resultado="{resultado}"}} {cantidad}'
+                   for resultado, cantidad in datos["partidas_terminadas"].items()]
+        lineas += self.lineas_histograma("ahorcado_puntos", datos["puntos"])
+        return "\n".join(lineas) + "\n"
+
+    @staticmethod
+    def lineas_histograma(nombre, histograma, escala=1):
+        """Líneas de Prometheus de un histograma con cubetas acumuladas."""
+        lineas = [f"# TYPE {nombre} histogram"]
+        acumulado = 0
+        for limite, cantidad in zip(histograma["limites"], histograma["cubetas"]):
+            acumulado += cantidad
+            lineas.append(f'{nombre}_bucket{{le="{limite * escala:g}"}} {acumulado}')
+        lineas.append(f'{nombre}_bucket{{le="+Inf"}} {histograma["cuenta"]}')
+        lineas.append(f"{nombre}_sum {histograma['suma'] * escala:g}")
+        lineas.append(f"{nombre}_count {histograma['cuenta']}")
+        return lineas
+
+    def exportar_jsonl(self, ruta):
+        """
+        Agrega una instantánea de las métricas como una línea JSON al final de un archivo.
+
+        Args:
+            ruta (str): Ruta del archivo JSON Lines.
+        """
+        with open(ruta, mode='a', encoding='utf-8') as archivo:
+            archivo.write(json.dumps(self.instantanea(), ensure_ascii=False) + "\n")
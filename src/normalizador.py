@@ -0,0 +1,92 @@
+import unicodedata
+from functools import lru_cache
+
+# Último punto de código del rango latino (Latin-1 y Latin Extended-A/B)
+LIMITE_LATINO = 0x024F
+
+
+def normalizar_unicode(texto):
+    """
+    Normaliza un texto eliminando acentos y convirtiendo a minúsculas,
+    preservando la letra 'ñ'. Es la implementación de referencia.
+
+    Args:
+        texto (str): El texto a normalizar.
+
+    Returns:
+        str: El texto normalizado.
+    """
+    # Convertir a minúsculas
+    texto = texto.lower()
+
+    # Reemplazar "ñ" con un marcador temporal antes de normalizar
+    texto = texto.replace("ñ", "__TEMP_N__")
+
+    # Descomponer caracteres y eliminar marcas de acento
+    texto = ''.join(
+        c for c in unicodedata.normalize('NFD', texto)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+    # Restaurar "ñ" desde el marcador
+    return texto.replace("__TEMP_N__", "ñ")
+
+
+class Normalizador:
+    """
+    Normalizador de letras y palabras construido una sola vez.
+
+    Los textos del rango latino se normalizan con una tabla de traducción
+    precalculada; el resto pasa por `normalizar_unicode` con una caché LRU acotada.
+
+    Attributes:
+        tabla (dict): Tabla de traducción para `str.translate`.
+    """
+
+    def __init__(self, tamano_cache=4096):
+        """
+        Precalcula la tabla de traducción del rango latino.
+
+        Args:
+            tamano_cache (int): Máximo de textos fuera del rango latino en la caché.
+        """
+        self.tabla = {}
+        for codigo in range(LIMITE_LATINO + 1):
+            caracter = chr(codigo)
+            normalizado = normalizar_unicode(caracter)
+            if normalizado != caracter:
+                self.tabla[codigo] = normalizado
+        self.normalizar_otro = lru_cache(maxsize=tamano_cache)(normalizar_unicode)
+
+    def normalizar(self, texto):
+        """
+        Normaliza una letra o palabra con las mismas reglas que `normalizar_unicode`.
+
+        Args:
+            texto (str): La letra o palabra a normalizar.
+
+        Returns:
+            str: La letra o palabra normalizada.
+        """
+        if texto.isascii():
+            return texto.lower()
+        if ord(max(texto)) <= LIMITE_LATINO:
+            return texto.translate(self.tabla)
+        return self.normalizar_otro(texto)
+
+    def normalizar_lote(self, textos):
+        """
+        Normaliza un conjunto de textos de forma perezosa.
+
+        Args:
+            textos (iterable): Textos a normalizar.
+
+        Returns:
+            iterator: Los textos normalizados en el mismo orden.
+        """
+        return map(self.normalizar, textos)
+
+
+normalizador = Normalizador()
+normalizar = normalizador.normalizar
+normalizar_lote = normalizador.normalizar_lote
@@ -1,5 +1,92 @@
 import csv
-from random import choice
+import io
+import json
+import os
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from compilado import CorpusCompilado, compilar_corpus, corpus_vigente
+from seleccion import MotorSeleccion
+
+
+class TemasDiferidos(MutableMapping):
+    """
+    Diccionario de temas que solo lee del archivo CSV las palabras de los temas consultados.
+
+    Attributes:
+        archivo_csv (str): La ruta al archivo CSV que contiene los temas y las palabras.
+        indice (dict): Temas como claves y tuplas (desplazamiento, longitud) en bytes como valores.
+        cargados (dict): Temas ya materializados y sus listas de palabras.
+    """
+
+    def __init__(self, archivo_csv, indice):
+        """
+        Inicializa el diccionario con el índice de desplazamientos del archivo.
+
+        Args:
+            archivo_csv (str): La ruta al archivo CSV.
+            indice (dict): Índice tema -> (desplazamiento, longitud).
+        """
+        self.archivo_csv = archivo_csv
+        self.indice = indice
+        self.cargados = {}
+        self.orden = dict.fromkeys(indice)
+
+    def leer_tema(self, tema):
+        """
+        Lee y decodifica la fila de un tema a partir de su desplazamiento.
+
+        Args:
+            tema (str): El tema a leer.
+
+        Returns:
+            list: Las palabras del tema.
+        """
+        desplazamiento, longitud = self.indice[tema]
+        with open(self.archivo_csv, mode='rb') as archivo:
+            archivo.seek(desplazamiento)
+            linea = archivo.read(longitud).decode('utf-8')
+        _, *palabras = next(csv.reader([linea]))
+        return palabras
+
+    def leer_linea(self, tema):
+        """
+        Lee la fila de un tema tal como está escrita en el archivo, sin decodificar el CSV.
+
+        Args:
+            tema (str): El tema a leer.
+
+        Returns:
+            str: La fila del tema sin el salto de línea.
+        """
+        desplazamiento, longitud = self.indice[tema]
+        with open(self.archivo_csv, mode='rb') as archivo:
+            archivo.seek(desplazamiento)
+            return archivo.read(longitud).decode('utf-8')
+
+    def __getitem__(self, tema):
+        if tema not in self.cargados:
+            if tema not in self.indice:
+                raise KeyError(tema)
+            self.cargados[tema] = self.leer_tema(tema)
+        return self.cargados[tema]
+
+    def __setitem__(self, tema, palabras):
+        self.cargados[tema] = palabras
+        self.orden[tema] = None
+
+    def __delitem__(self, tema):
+        del self.orden[tema]
+        self.cargados.pop(tema, None)
+        self.indice.pop(tema, None)
+
+    def __contains__(self, tema):
+        return tema in self.orden
+
+    def __iter__(self):
+        return iter(self.orden)
+
+    def __len__(self):
+        return len(self.orden)
 
 class GestorPalabras:
     """
@@ -8,41 +95,255 @@ class GestorPalabras:
     Attributes:
         archivo_csv (str): La ruta al archivo CSV que contiene los temas y las palabras.
         opciones (dict): Un diccionario que contiene temas como claves y listas de palabras como valores.
+            Con un `recarga.VigilanteCorpus` es una instantánea inmutable que se reemplaza entera.
+        carga_diferida (bool): Si es True, las palabras de cada tema se leen al consultarlo por primera vez.
+        compilado (bool): Si es True, las palabras se leen del archivo binario compilado a partir del CSV.
+        seleccion (MotorSeleccion): Motor que elige las palabras sin repetirlas hasta agotar cada tema.
+        indice_dificultad (IndiceDificultad): Dificultad precalculada de las palabras; se
+            construye al pedir la primera palabra por dificultad.
     """
+    # Instrumentación opcional compartida por todos los gestores (ver metricas.Instrumentacion)
+    instrumentacion = None
 
-    def __init__(self, archivo_csv="temas_palabras.csv"):
+    def __init__(self, archivo_csv="temas_palabras.csv", opciones=None, carga_diferida=False,
+                 compilado=False, semilla=None):
         """
         Inicializa la clase con la ruta del archivo CSV y carga las opciones.
+
+        Args:
+            archivo_csv (str): La ruta al archivo CSV.
+            opciones (dict, optional): Temas y palabras a usar en lugar de los del archivo.
+            carga_diferida (bool): Indexa el archivo y carga cada tema solo cuando se solicita.
+            compilado (bool): Abre con `mmap` el archivo binario `.bin`, que se
+                regenera automáticamente cuando el CSV cambia. Tiene prioridad sobre `carga_diferida`.
+            semilla (int, optional): Semilla del motor de selección, para obtener secuencias reproducibles.
         """
         self.archivo_csv = archivo_csv
-        self.opciones = self.cargar_palabras()
+        self.carga_diferida = carga_diferida
+        self.compilado = compilado
+        self.seleccion = MotorSeleccion(semilla)
+        self.indice_dificultad = None
+        self.desde_archivo = opciones is None
+        self.opciones = opciones if opciones is not None else self.cargar_palabras()
 
     def cargar_palabras(self):
         """
         Carga las palabras desde el archivo CSV y las organiza en un diccionario.
 
+        Las palabras del diario que aún no se han compactado se aplican al final.
+
         Returns:
             dict: Un diccionario con los temas como claves y listas de palabras como valores.
         """
-        opciones = {}
+        if self.compilado:
+            opciones = self.cargar_compilado()
+        elif self.carga_diferida:
+            opciones = TemasDiferidos(self.archivo_csv, self.cargar_indice())
+        else:
+            opciones = {}
+            try:
+                with open(self.archivo_csv, mode='r', encoding='utf-8') as archivo:
+                    lector = csv.reader(archivo)
+                    for fila in lector:
+                        tema, *palabras = fila
+                        opciones[tema] = palabras
+            except FileNotFoundError:
+                print(f"El archivo {self.archivo_csv} no se encontró. Asegúrate de que existe.")
+
+        for tema, *palabras in self.leer_diario():
+            self.extender_tema(opciones, tema, palabras)
+        return opciones
+
+    def cargar_compilado(self):
+        """
+        Abre el archivo binario compilado, regenerándolo si no corresponde al CSV actual.
+
+        Returns:
+            CorpusCompilado: Diccionario de temas respaldado por el archivo binario.
+        """
+        archivo_binario = self.archivo_csv + ".bin"
+        if not os.path.exists(self.archivo_csv):
+            print(f"El archivo {self.archivo_csv} no se encontró. Asegúrate de que existe.")
+            return {}
+        if not corpus_vigente(self.archivo_csv, archivo_binario):
+            compilar_corpus(self.archivo_csv, archivo_binario)
+        return CorpusCompilado(archivo_binario)
+
+    @property
+    def archivo_diario(self):
+        """str: Ruta del diario de palabras agregadas pendientes de compactar."""
+        return self.archivo_csv + ".diario"
+
+    @property
+    def archivo_compactacion(self):
+        """str: Ruta de la marca que identifica al CSV compactado mientras se vacía el diario."""
+        return self.archivo_csv + ".compactado"
+
+    def recuperar_compactacion(self):
+        """
+        Termina una compactación interrumpida antes de leer el diario.
+
+        La marca guarda el inodo y el tamaño del CSV nuevo. Si el CSV actual es ese
+        archivo, el renombrado ocurrió y el diario ya está incorporado, así que se
+        elimina en lugar de aplicarse dos veces; si no, la compactación no llegó a
+        reemplazar el CSV y el diario sigue vigente.
+        """
+        try:
+            with open(self.archivo_compactacion, mode='r', encoding='utf-8') as archivo:
+                marca = json.load(archivo)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            marca = None
+        try:
+            estado = os.stat(self.archivo_csv)
+            if (isinstance(marca, dict) and marca.get("inodo") == estado.st_ino
+                    and marca.get("tamano") == estado.st_size):
+                os.remove(self.archivo_diario)
+        except FileNotFoundError:
+            pass
+        os.remove(self.archivo_compactacion)
+
+    def leer_diario(self):
+        """
+        Lee las entradas completas del diario. Una última línea sin salto de línea
+        corresponde a una escritura interrumpida y se descarta.
+
+        Returns:
+            list: Filas [tema, palabra, ...] en el orden en que se agregaron.
+        """
+        self.recuperar_compactacion()
         try:
-            with open(self.archivo_csv, mode='r', encoding='utf-8') as archivo:
-                lector = csv.reader(archivo)
-                for fila in lector:
-                    tema, *palabras = fila
-                    opciones[tema] = palabras
+            with open(self.archivo_diario, mode='rb') as archivo:
+                contenido = archivo.read()
+        except FileNotFoundError:
+            return []
+        completo = contenido[:contenido.rfind(b"\n") + 1].decode('utf-8')
+        return [fila for fila in csv.reader(io.StringIO(completo)) if fila]
+
+    @staticmethod
+    def extender_tema(opciones, tema, palabras):
+        """
+        Agrega palabras a un tema del diccionario de opciones, creándolo si no existe.
+
+        Args:
+            opciones (dict): Temas y palabras sobre los que se agrega.
+            tema (str): El tema al que se agregan las palabras.
+            palabras (list): Las palabras a agregar.
+        """
+        if tema not in opciones:
+            opciones[tema] = list(palabras)
+        elif isinstance(opciones[tema], list):
+            opciones[tema].extend(palabras)
+        else:
+            opciones[tema] = [*opciones[tema], *palabras]
+
+    def cargar_indice(self):
+        """
+        Obtiene el índice de desplazamientos por tema, reutilizando el archivo
+        auxiliar `.idx` mientras la fecha de modificación y el tamaño del CSV no cambien.
+
+        Returns:
+            dict: Temas como claves y tuplas (desplazamiento, longitud) como valores.
+        """
+        ruta_indice = self.archivo_csv + ".idx"
+        try:
+            estado = os.stat(self.archivo_csv)
         except FileNotFoundError:
             print(f"El archivo {self.archivo_csv} no se encontró. Asegúrate de que existe.")
-        return opciones
+            return {}
+
+        try:
+            with open(ruta_indice, mode='r', encoding='utf-8') as archivo:
+                guardado = json.load(archivo)
+            if guardado["mtime_ns"] == estado.st_mtime_ns and guardado["tamano"] == estado.st_size:
+                return {tema: (desplazamiento, longitud)
+                        for tema, desplazamiento, longitud in guardado["temas"]}
+        except (OSError, ValueError, KeyError):
+            pass
+
+        indice = self.indexar_csv()
+        try:
+            with open(ruta_indice, mode='w', encoding='utf-8') as archivo:
+                json.dump({"mtime_ns": estado.st_mtime_ns,
+                           "tamano": estado.st_size,
+                           "temas": [[tema, *posicion] for tema, posicion in indice.items()]},
+                          archivo, ensure_ascii=False)
+        except OSError:
+            pass
+        return indice
+
+    def indexar_csv(self):
+        """
+        Recorre el archivo CSV una sola vez registrando dónde empieza y cuánto mide la fila de cada tema.
+
+        Cada fila debe ocupar una sola línea del archivo: no se admiten saltos de
+        línea dentro de un campo entre comillas.
+
+        Returns:
+            dict: Temas como claves y tuplas (desplazamiento, longitud) como valores.
+
+        Raises:
+            ValueError: Si una fila tiene comillas sin cerrar, es decir, continúa en la línea siguiente.
+        """
+        indice = {}
+        desplazamiento = 0
+        with open(self.archivo_csv, mode='rb') as archivo:
+            for linea in archivo:
+                contenido = linea.rstrip(b"\r\n")
+                if contenido:
+                    if contenido.count(b'"') % 2:
+                        raise ValueError(f"{self.archivo_csv}: fila con un salto de línea entre comillas "
+                                         f"en el byte {desplazamiento}; la carga diferida no lo admite")
+                    if contenido.startswith(b'"'):
+                        tema = next(csv.reader([contenido.decode('utf-8')]))[0]
+                    else:
+                        tema = contenido.split(b",", 1)[0].decode('utf-8')
+                    indice[tema] = (desplazamiento, len(contenido))
+                desplazamiento += len(linea)
+        return indice
 
     def guardar_palabras(self):
         """
-        Guarda las palabras actuales en el archivo CSV.
+        Guarda las palabras actuales en el archivo CSV y vacía el diario.
+
+        El archivo se escribe en uno temporal que reemplaza al original con un
+        renombrado atómico, de modo que una interrupción no deja el CSV truncado.
         """
-        with open(self.archivo_csv, mode='w', encoding='utf-8', newline='') as archivo:
+        temporal = self.archivo_csv + ".tmp"
+        with open(temporal, mode='w', encoding='utf-8', newline='') as archivo:
             escritor = csv.writer(archivo)
-            for tema, palabras in self.opciones.items():
-                escritor.writerow([tema] + palabras)
+            for tema in self.opciones:
+                if isinstance(self.opciones, TemasDiferidos) and tema not in self.opciones.cargados:
+                    archivo.write(self.opciones.leer_linea(tema) + escritor.dialect.lineterminator)
+                else:
+                    escritor.writerow([tema, *self.opciones[tema]])
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        # La marca permite saber, tras una interrupción entre el renombrado y el
+        # borrado del diario, que el diario ya está en el CSV (ver `recuperar_compactacion`)
+        estado = os.stat(temporal)
+        with open(self.archivo_compactacion, mode='w', encoding='utf-8') as archivo:
+            json.dump({"inodo": estado.st_ino, "tamano": estado.st_size}, archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self.archivo_csv)
+
+        try:
+            os.remove(self.archivo_diario)
+        except FileNotFoundError:
+            pass
+        os.remove(self.archivo_compactacion)
+        if isinstance(self.opciones, (TemasDiferidos, CorpusCompilado)):
+            self.opciones = self.cargar_palabras()
+        self.indice_dificultad = None
+
+    def compactar(self):
+        """
+        Incorpora las palabras del diario al archivo CSV principal.
+        """
+        if os.path.exists(self.archivo_diario):
+            self.guardar_palabras()
 
     def agregar_palabra(self, tema, palabra):
         """
@@ -52,11 +353,44 @@ class GestorPalabras:
             tema (str): El tema al que se quiere agregar la palabra.
             palabra (str): La palabra a agregar.
         """
-        if tema in self.opciones:
-            self.opciones[tema].append(palabra)
+        self.agregar_palabras(tema, [palabra])
+
+    def agregar_palabras(self, tema, palabras):
+        """
+        Agrega varias palabras a un tema registrándolas en el diario con una sola escritura.
+
+        Las palabras quedan en el diario hasta que se llama a `compactar`. Si el
+        diario termina en una escritura interrumpida, se recorta hasta su última
+        línea completa antes de agregar la nueva.
+
+        Args:
+            tema (str): El tema al que se quieren agregar las palabras.
+            palabras (list): Las palabras a agregar.
+        """
+        palabras = list(palabras)
+        if not palabras:
+            return
+        fila = io.StringIO()
+        csv.writer(fila, lineterminator="\n").writerow([tema, *palabras])
+        self.recuperar_compactacion()
+        with open(self.archivo_diario, mode='a+b') as archivo:
+            if archivo.seek(0, os.SEEK_END):
+                archivo.seek(-1, os.SEEK_END)
+                if archivo.read(1) != b"\n":
+                    archivo.seek(0)
+                    contenido = archivo.read()
+                    archivo.truncate(contenido.rfind(b"\n") + 1)
+            archivo.write(fila.getvalue().encode('utf-8'))
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        if isinstance(self.opciones, MappingProxyType):
+            # Instantánea de `VigilanteCorpus`: se copia, quien la esté leyendo no ve el cambio a medias
+            opciones = dict(self.opciones)
+            opciones[tema] = tuple(opciones.get(tema, ())) + tuple(palabras)
+            self.opciones = MappingProxyType(opciones)
         else:
-            self.opciones[tema] = [palabra]
-        self.guardar_palabras()
+            self.extender_tema(self.opciones, tema, palabras)
+        self.indice_dificultad = None
 
     def obtener_temas(self):
         """
@@ -67,18 +401,69 @@ class GestorPalabras:
         """
         return list(self.opciones.keys())
 
-    def seleccionar_palabra(self, tema):
+    def obtener_indice_dificultad(self):
+        """
+        Obtiene la dificultad precalculada de todas las palabras.
+
+        Se calcula en lote una sola vez y, si las palabras provienen del CSV y no hay
+        diario pendiente, se guarda junto a él en `<csv>.dif.npz` para reutilizarla
+        mientras el CSV no cambie.
+
+        Returns:
+            IndiceDificultad: El índice de dificultad por tema y banda.
+        """
+        if self.indice_dificultad is None:
+            from dificultad import IndiceDificultad
+
+            ruta = self.archivo_csv + ".dif.npz"
+            usar_archivo = (self.desde_archivo and os.path.exists(self.archivo_csv)
+                            and not os.path.exists(self.archivo_diario))
+            indice = None
+            if usar_archivo:
+                estado = os.stat(self.archivo_csv)
+                estado = (estado.st_mtime_ns, estado.st_size)
+                indice = IndiceDificultad.cargar(ruta, estado, self.obtener_temas())
+            if indice is None:
+                indice = IndiceDificultad.construir(self.opciones)
+                if usar_archivo:
+                    indice.guardar(ruta, estado)
+            self.indice_dificultad = indice
+        return self.indice_dificultad
+
+    def seleccionar_palabra(self, tema, jugador=None, pesos=None, dificultad=None):
         """
         Selecciona una palabra al azar del tema elegido por el usuario.
 
+        Sin pesos, las palabras del tema salen en orden aleatorio sin repetirse
+        hasta que se agota el tema.
+
         Args:
             tema (str): El tema del que se seleccionará una palabra.
+            jugador (str, optional): Si se indica, se evitan las palabras que ese jugador vio recientemente.
+            pesos (Sequence, optional): Peso de cada palabra del tema, en el mismo orden;
+                pasar el mismo objeto en cada llamada evita reconstruir la tabla de muestreo.
+            dificultad (str or int, optional): Banda de dificultad ("facil", "media" o
+                "dificil"); la palabra se elige solo entre las de esa banda o, si el tema no
+                tiene palabras en ella, entre las de la banda más cercana. No se combina con `pesos`.
 
         Returns:
             str: Una palabra aleatoria del tema seleccionado.
         """
-        if tema in self.opciones:
-            return choice(self.opciones[tema])
+        # Una sola lectura de las opciones: si se recargan mientras tanto, se usa la versión leída
+        opciones = self.opciones
+        if tema in opciones:
+            if dificultad is None:
+                palabra = self.seleccion.elegir(tema, opciones[tema], jugador, pesos)
+            else:
+                if pesos is not None:
+                    raise ValueError("No se pueden usar pesos y dificultad a la vez.")
+                indice = self.obtener_indice_dificultad()
+                banda = indice.banda_disponible(tema, dificultad)
+                palabras = indice.palabras_banda(tema, banda, opciones[tema])
+                palabra = self.seleccion.elegir((tema, banda), palabras, jugador)
+            if self.instrumentacion is not None:
+                self.instrumentacion.palabra_seleccionada(tema, palabra)
+            return palabra
         else:
             raise ValueError(f"El tema '{tema}' no existe. Por favor, elige uno de los temas disponibles.")
 
@@ -0,0 +1,170 @@
+from math import log2
+from normalizador import normalizar
+
+
+def conjunto_de_indices(indices, cantidad):
+    """
+    Construye un conjunto de bits a partir de los índices de sus elementos.
+
+    Args:
+        indices (iterable): Índices de los bits encendidos.
+        cantidad (int): Número total de elementos.
+
+    Returns:
+        int: El conjunto de bits.
+    """
+    mapa = bytearray((cantidad + 7) // 8)
+    for indice in indices:
+        mapa[indice >> 3] |= 1 << (indice & 7)
+    return int.from_bytes(mapa, "little")
+
+
+class CubetaPistas:
+    """
+    Palabras de una misma longitud indexadas con conjuntos de bits.
+
+    El bit i de cada conjunto corresponde a la palabra i de la cubeta.
+
+    Attributes:
+        palabras (list): Las palabras de la cubeta.
+        todas (int): Conjunto con todas las palabras.
+        posiciones (dict): (posición, letra normalizada) -> conjunto de palabras con esa letra en esa posición.
+        contiene (dict): Letra normalizada -> conjunto de palabras que la contienen.
+        exactas (dict): Palabra normalizada -> índices de las palabras con esa forma.
+    """
+
+    def __init__(self, palabras):
+        self.palabras = palabras
+        self.todas = (1 << len(palabras)) - 1
+        posiciones = {}
+        contiene = {}
+        self.exactas = {}
+        for indice, palabra in enumerate(palabras):
+            letras = [normalizar(letra) for letra in palabra]
+            for clave in enumerate(letras):
+                posiciones.setdefault(clave, []).append(indice)
+            for letra in set(letras):
+                contiene.setdefault(letra, []).append(indice)
+            self.exactas.setdefault("".join(letras), []).append(indice)
+        self.posiciones = {clave: conjunto_de_indices(indices, len(palabras))
+                           for clave, indices in posiciones.items()}
+        self.contiene = {letra: conjunto_de_indices(indices, len(palabras))
+                         for letra, indices in contiene.items()}
+
+
+class MotorPistas:
+    """
+    Índice de las palabras de un tema para sugerir la siguiente letra de una partida.
+
+    Attributes:
+        cubetas (dict): Longitud de palabra -> CubetaPistas.
+    """
+
+    def __init__(self, palabras):
+        """
+        Agrupa las palabras por longitud e indexa cada cubeta.
+
+        Args:
+            palabras (iterable): Las palabras del tema, por ejemplo `gestor.opciones[tema]`.
+        """
+        por_longitud = {}
+        for palabra in palabras:
+            por_longitud.setdefault(len(palabra), []).append(palabra)
+        self.cubetas = {longitud: CubetaPistas(grupo) for longitud, grupo in por_longitud.items()}
+
+    def seguir(self, juego):
+        """
+        Crea el seguimiento de pistas de una partida.
+
+        Args:
+            juego (Juego): La partida a seguir.
+
+        Returns:
+            SeguimientoPistas: Seguimiento que se actualiza después de cada turno.
+        """
+        return SeguimientoPistas(self, juego)
+
+
+class SeguimientoPistas:
+    """
+    Conjunto de palabras candidatas de una partida, reducido de forma incremental
+    con las letras que se han jugado desde la última actualización.
+
+    Attributes:
+        juego (Juego): La partida seguida.
+        cubeta (CubetaPistas): Cubeta de las palabras con la longitud de la palabra secreta.
+        candidatas (int): Conjunto de bits de las palabras aún compatibles con la partida.
+        procesadas (set): Entradas ya aplicadas al conjunto de candidatas.
+    """
+
+    def __init__(self, motor, juego):
+        self.juego = juego
+        self.cubeta = motor.cubetas.get(len(juego.palabra)) or CubetaPistas([])
+        self.candidatas = self.cubeta.todas
+        self.procesadas = set()
+
+    def actualizar(self):
+        """
+        Aplica las entradas jugadas desde la última actualización. Se llama después de cada `jugar_turno`.
+        """
+        nuevas = self.juego.letras_usadas - self.procesadas
+        if not nuevas:
+            return
+        revelado = self.juego.revelado
+        for entrada in nuevas:
+            if len(entrada) != 1:
+                # Solo se descartan los intentos que se comprobaron y fallaron: uno
+                # fuera de tiempo queda en letras_usadas sin haberse comprobado
+                if entrada in self.juego.letras_adivinadas and entrada != self.juego.palabra_normalizada:
+                    for indice in self.cubeta.exactas.get(entrada, ()):
+                        self.candidatas &= ~(1 << indice)
+            elif entrada in self.juego.letras_incorrectas:
+                self.candidatas &= ~self.cubeta.contiene.get(entrada, 0)
+            else:
+                reveladas = self.juego.indice.mascaras.get(entrada, 0) & revelado
+                for posicion in range(len(self.juego.palabra)):
+                    conjunto = self.cubeta.posiciones.get((posicion, entrada), 0)
+                    if reveladas >> posicion & 1:
+                        self.candidatas &= conjunto
+                    else:
+                        self.candidatas &= ~conjunto
+        self.procesadas |= nuevas
+
+    def candidatas_restantes(self):
+        """
+        Returns:
+            list: Las palabras aún compatibles con la partida.
+        """
+        return [palabra for indice, palabra in enumerate(self.cubeta.palabras)
+                if self.candidatas >> indice & 1]
+
+    def sugerir(self, cantidad=3):
+        """
+        Ordena las letras no jugadas por la información esperada de su respuesta
+        (si la letra está o no en la palabra) sobre las palabras candidatas.
+
+        Args:
+            cantidad (int): Máximo de letras a devolver.
+
+        Returns:
+            list: Tuplas (letra, bits de información esperada) de mayor a menor.
+        """
+        self.actualizar()
+        total = self.candidatas.bit_count()
+        if total == 0:
+            return []
+        usadas = self.juego.letras_usadas
+        sugerencias = []
+        for letra, conjunto in self.cubeta.contiene.items():
+            if letra in usadas:
+                continue
+            con_letra = (self.candidatas & conjunto).bit_count()
+            if con_letra == 0:
+                continue
+            probabilidad = con_letra / total
+            informacion = -probabilidad * log2(probabilidad)
+            if con_letra < total:
+                informacion -= (1 - probabilidad) * log2(1 - probabilidad)
+            sugerencias.append((letra, informacion, con_letra))
+        sugerencias.sort(key=lambda sugerencia: (-sugerencia[1], -sugerencia[2]))
+        return [(letra, informacion) for letra, informacion, _ in sugerencias[:cantidad]]
@@ -0,0 +1,202 @@
+import csv
+import os
+import threading
+import time
+import zlib
+from types import MappingProxyType
+from compilado import CorpusCompilado
+
+
+class Instantanea:
+    """
+    Versión inmutable del corpus: se construye completa y luego solo se lee.
+
+    Attributes:
+        version (int): Número de versión, creciente desde 1.
+        temas (Mapping): Tema -> tupla de palabras, de solo lectura; con un gestor
+            compilado o de carga diferida, el propio `CorpusCompilado` o `TemasDiferidos`.
+        filas (dict): Tema -> (firma de su fila en el CSV, palabras de esa fila), para
+            reutilizar en la siguiente recarga las filas que no cambiaron.
+        estado (tuple): (inodo, mtime_ns, tamaño) del CSV y del diario al leerlos.
+    """
+
+    def __init__(self, version, temas, filas, estado):
+        self.version = version
+        self.temas = MappingProxyType(temas) if isinstance(temas, dict) else temas
+        self.filas = filas
+        self.estado = estado
+
+
+def firma_fila(linea):
+    """Firma de una fila del CSV para detectar si cambió: longitud y CRC32 de sus bytes."""
+    return len(linea), zlib.crc32(linea)
+
+
+def tema_de_fila(linea):
+    """Tema de una fila del CSV en bytes, sin decodificar el resto de la fila."""
+    if linea.startswith(b'"'):
+        return next(csv.reader([linea.decode('utf-8')]))[0]
+    return linea.split(b",", 1)[0].decode('utf-8')
+
+
+class VigilanteCorpus:
+    """
+    Recarga en caliente el corpus de un `GestorPalabras` cuando cambian su CSV o su diario.
+
+    Cada comprobación solo consulta `os.stat` de los dos archivos. Si cambió su
+    inodo, fecha de modificación o tamaño, se lee el CSV, se vuelven a decodificar
+    solo las filas cuya firma cambió (las demás reutilizan las tuplas de la
+    instantánea anterior), se aplica el diario y la nueva instantánea reemplaza a
+    `gestor.opciones` con una sola asignación. Los lectores no toman ningún candado:
+    ven la instantánea anterior o la nueva, nunca una a medias.
+
+    Un gestor compilado o de carga diferida conserva su representación: cada
+    recarga vuelve a abrir el corpus con `GestorPalabras.cargar_palabras` (en modo
+    compilado, recompilando el `.bin` y abriendo un `mmap` nuevo) en lugar de
+    decodificar el CSV completo en memoria. La primera instantánea de un gestor
+    compilado es el corpus que ya tiene abierto, si sigue vigente.
+
+    Attributes:
+        gestor (GestorPalabras): El gestor cuyas opciones se reemplazan.
+        intervalo (float): Segundos entre comprobaciones del hilo vigilante.
+        instantanea (Instantanea): La instantánea vigente.
+        latencia (float): Segundos que tomó la última recarga, desde que se detectó el cambio.
+        retraso (float): Segundos entre la última modificación de los archivos y el fin de la última recarga.
+        reutilizadas (int): Filas reutilizadas en la última recarga.
+        decodificadas (int): Filas decodificadas en la última recarga.
+        ultimo_error (Exception): Error de la última recarga fallida; se conserva la instantánea anterior.
+    """
+
+    def __init__(self, gestor, intervalo=1.0):
+        """
+        Construye la primera instantánea y la instala en el gestor.
+
+        Args:
+            gestor (GestorPalabras): El gestor a mantener actualizado.
+            intervalo (float): Segundos entre comprobaciones del hilo vigilante.
+        """
+        self.gestor = gestor
+        self.intervalo = intervalo
+        self.instantanea = Instantanea(0, {}, {}, None)
+        self.latencia = self.retraso = 0.0
+        self.reutilizadas = self.decodificadas = 0
+        self.ultimo_error = None
+        self.detenido = threading.Event()
+        self.hilo = None
+        estado = self.estado_archivos()
+        if (isinstance(gestor.opciones, CorpusCompilado) and estado[1] is None
+                and gestor.opciones.corresponde_a(gestor.archivo_csv)):
+            self.instantanea = Instantanea(1, gestor.opciones, {}, estado)
+        else:
+            self.comprobar()
+
+    @property
+    def version(self):
+        """int: Versión de la instantánea vigente."""
+        return self.instantanea.version
+
+    def estado_archivos(self):
+        """
+        Returns:
+            tuple: (inodo, mtime_ns, tamaño) del CSV y del diario, o None si no existen.
+        """
+        estados = []
+        for ruta in (self.gestor.archivo_csv, self.gestor.archivo_diario):
+            try:
+                estado = os.stat(ruta)
+            except FileNotFoundError:
+                estados.append(None)
+            else:
+                estados.append((estado.st_ino, estado.st_mtime_ns, estado.st_size))
+        return tuple(estados)
+
+    def comprobar(self):
+        """
+        Recarga el corpus si cambiaron los archivos.
+
+        El estado se toma antes de leer, así que un cambio que ocurra durante la
+        lectura se detecta en la comprobación siguiente.
+
+        Returns:
+            bool: True si se instaló una nueva instantánea.
+        """
+        estado = self.estado_archivos()
+        if estado == self.instantanea.estado or estado[0] is None:
+            return False
+        inicio = time.perf_counter()
+        try:
+            instantanea = self.construir(estado)
+        except (OSError, ValueError) as error:
+            self.ultimo_error = error
+            return False
+        self.instantanea = instantanea
+        self.gestor.opciones = instantanea.temas
+        self.gestor.indice_dificultad = None
+        self.latencia = time.perf_counter() - inicio
+        modificacion = max(archivo[1] for archivo in estado if archivo is not None) / 1e9
+        self.retraso = max(time.time() - modificacion, 0.0)
+        self.ultimo_error = None
+        return True
+
+    def construir(self, estado):
+        """
+        Construye la siguiente instantánea reutilizando las filas sin cambios.
+
+        Args:
+            estado (tuple): El estado de los archivos tomado antes de leerlos.
+
+        Returns:
+            Instantanea: La nueva instantánea.
+        """
+        if self.gestor.compilado or self.gestor.carga_diferida:
+            self.reutilizadas, self.decodificadas = 0, 0
+            return Instantanea(self.instantanea.version + 1, self.gestor.cargar_palabras(), {}, estado)
+        with open(self.gestor.archivo_csv, mode='rb') as archivo:
+            contenido = archivo.read()
+        anteriores = self.instantanea.filas
+        filas = {}
+        reutilizadas = decodificadas = 0
+        for linea in contenido.splitlines():
+            if not linea:
+                continue
+            firma = firma_fila(linea)
+            tema = tema_de_fila(linea)
+            anterior = anteriores.get(tema)
+            if anterior is not None and anterior[0] == firma:
+                filas[tema] = anterior
+                reutilizadas += 1
+            else:
+                _, *palabras = next(csv.reader([linea.decode('utf-8')]))
+                filas[tema] = (firma, tuple(palabras))
+                decodificadas += 1
+        temas = {tema: palabras for tema, (_, palabras) in filas.items()}
+        for tema, *palabras in self.gestor.leer_diario():
+            temas[tema] = temas.get(tema, ()) + tuple(palabras)
+        self.reutilizadas, self.decodificadas = reutilizadas, decodificadas
+        return Instantanea(self.instantanea.version + 1, temas, filas, estado)
+
+    def vigilar(self):
+        """Bucle del hilo vigilante: comprueba cada `intervalo` segundos hasta que se detenga."""
+        while not self.detenido.wait(self.intervalo):
+            self.comprobar()
+
+    def iniciar(self):
+        """Inicia el hilo vigilante en segundo plano."""
+        if self.hilo is None:
+            self.detenido.clear()
+            self.hilo = threading.Thread(target=self.vigilar, daemon=True)
+            self.hilo.start()
+        return self
+
+    def detener(self):
+        """Detiene el hilo vigilante y espera a que termine."""
+        self.detenido.set()
+        if self.hilo is not None:
+            self.hilo.join()
+            self.hilo = None
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excepcion):
+        self.detener()
@@ -0,0 +1,145 @@
+import sys
+import threading
+import time
+from collections import deque
+
+BORRAR_PANTALLA = "\x1b[H\x1b[2J"
+BORRAR_LINEA = "\x1b[K"
+GUARDAR_CURSOR = "\x1b7"
+RESTAURAR_CURSOR = "\x1b8"
+
+
+def mover_cursor(fila):
+    """Secuencia ANSI que lleva el cursor al inicio de una fila (empezando en 1)."""
+    return f"\x1b[{fila};1H"
+
+
+class RenderizadorTerminal:
+    """
+    Dibuja cuadros completos en la terminal con secuencias ANSI, reescribiendo solo
+    las líneas que cambiaron respecto al cuadro anterior y con una sola escritura por cuadro.
+
+    Debajo del cuadro hay una línea de estado para mensajes temporales y, después,
+    la línea donde se pide la entrada al jugador.
+
+    Attributes:
+        flujo: Flujo de texto donde se escribe, por defecto `sys.stdout`.
+        lineas_previas (list): Líneas del último cuadro dibujado.
+        tiempos_ns (deque): Duración en nanosegundos de los últimos cuadros dibujados.
+    """
+
+    def __init__(self, flujo=None, historial_tiempos=1000):
+        self.flujo = flujo or sys.stdout
+        self.lineas_previas = None
+        self.estado = ""
+        self.temporizador = None
+        self.candado = threading.Lock()
+        self.tiempos_ns = deque(maxlen=historial_tiempos)
+
+    @property
+    def fila_estado(self):
+        """int: Fila de la línea de estado, justo debajo del cuadro."""
+        return len(self.lineas_previas or ()) + 1
+
+    def componer(self, lineas):
+        """
+        Construye el texto que transforma el cuadro anterior en el nuevo.
+
+        Args:
+            lineas (list): Líneas del nuevo cuadro.
+
+        Returns:
+            str: Secuencias ANSI y texto a escribir.
+        """
+        partes = []
+        previas = self.lineas_previas
+        if previas is None:
+            partes.append(BORRAR_PANTALLA)
+            previas = []
+        for fila, linea in enumerate(lineas, start=1):
+            if fila > len(previas) or previas[fila - 1] != linea:
+                partes.append(f"{mover_cursor(fila)}{linea}{BORRAR_LINEA}")
+        for fila in range(len(lineas) + 3, len(previas) + 3):
+            partes.append(f"{mover_cursor(fila)}{BORRAR_LINEA}")
+        fila_estado = len(lineas) + 1
+        partes.append(f"{mover_cursor(fila_estado)}{self.estado}{BORRAR_LINEA}")
+        partes.append(f"{mover_cursor(fila_estado + 1)}{BORRAR_LINEA}")
+        return "".join(partes)
+
+    def dibujar(self, lineas):
+        """
+        Dibuja un cuadro y deja el cursor en la línea de entrada.
+
+        Args:
+            lineas (list): Líneas del cuadro.
+
+        Returns:
+            int: Nanosegundos que tomó componer y escribir el cuadro.
+        """
+        inicio = time.perf_counter_ns()
+        lineas = list(lineas)
+        with self.candado:
+            self.flujo.write(self.componer(lineas))
+            self.flujo.flush()
+            self.lineas_previas = lineas
+        duracion = time.perf_counter_ns() - inicio
+        self.tiempos_ns.append(duracion)
+        return duracion
+
+    def mostrar_estado(self, mensaje, duracion=2.0):
+        """
+        Muestra un mensaje en la línea de estado y programa su borrado sin bloquear al jugador.
+
+        Args:
+            mensaje (str): El mensaje a mostrar.
+            duracion (float): Segundos que el mensaje permanece visible.
+        """
+        if self.temporizador is not None:
+            self.temporizador.cancel()
+        self.escribir_estado(mensaje)
+        self.temporizador = threading.Timer(duracion, self.escribir_estado, args=("",))
+        self.temporizador.daemon = True
+        self.temporizador.start()
+
+    def escribir_estado(self, mensaje):
+        """
+        Reescribe la línea de estado conservando la posición del cursor del jugador.
+
+        Args:
+            mensaje (str): El texto de la línea de estado.
+        """
+        with self.candado:
+            self.estado = mensaje
+            self.flujo.write(f"{GUARDAR_CURSOR}{mover_cursor(self.fila_estado)}"
+                             f"{mensaje}{BORRAR_LINEA}{RESTAURAR_CURSOR}")
+            self.flujo.flush()
+
+    def actualizar_linea(self, indice, linea):
+        """
+        Reescribe una línea del último cuadro sin mover el cursor del jugador,
+        por ejemplo para una cuenta regresiva mientras escribe.
+
+        Args:
+            indice (int): Posición de la línea en el cuadro (se admiten negativos).
+            linea (str): El nuevo texto de la línea.
+        """
+        with self.candado:
+            if not self.lineas_previas or self.lineas_previas[indice] == linea:
+                return
+            fila = range(1, len(self.lineas_previas) + 1)[indice]
+            self.lineas_previas[indice] = linea
+            self.flujo.write(f"{GUARDAR_CURSOR}{mover_cursor(fila)}{linea}{BORRAR_LINEA}{RESTAURAR_CURSOR}")
+            self.flujo.flush()
+
+    def resumen_tiempos(self):
+        """
+        Resume la duración de los últimos cuadros dibujados.
+
+        Returns:
+            dict: Cantidad de cuadros y duración promedio y máxima en milisegundos.
+        """
+        if not self.tiempos_ns:
+            return {"cuadros": 0, "promedio_ms": 0.0, "maximo_ms": 0.0}
+        return {"cuadros": len(self.tiempos_ns),
+                "promedio_ms": sum(self.tiempos_ns) / len(self.tiempos_ns) / 1e6,
+                "maximo_ms": max(self.tiempos_ns) / 1e6}
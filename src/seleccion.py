@@ -0,0 +1,226 @@
+import hashlib
+import math
+import random
+from array import array
+
+
+class BolsaBarajada:
+    """
+    Baraja incremental de índices: cada índice sale una vez por ronda, en O(1) por extracción.
+
+    Es un Fisher-Yates que avanza un paso en cada extracción: los índices aún no
+    extraídos ocupan el prefijo `indices[:restantes]`. Al agotarse la ronda empieza otra.
+
+    Attributes:
+        indices (array): Permutación de 0..cantidad-1.
+        restantes (int): Índices que faltan por salir en la ronda actual.
+    """
+
+    def __init__(self, cantidad, aleatorio):
+        self.indices = array('I', range(cantidad))
+        self.restantes = cantidad
+        self.aleatorio = aleatorio
+
+    def __len__(self):
+        return len(self.indices)
+
+    def ajustar(self, cantidad):
+        """
+        Adapta la bolsa a una lista que cambió de tamaño.
+
+        Los índices nuevos se agregan a los que faltan por salir en esta ronda; si la
+        lista se achicó, la bolsa se reinicia.
+
+        Args:
+            cantidad (int): El nuevo tamaño de la lista.
+        """
+        if cantidad < len(self.indices):
+            self.indices = array('I', range(cantidad))
+            self.restantes = cantidad
+            return
+        for indice in range(len(self.indices), cantidad):
+            self.indices.append(indice)
+            self.indices[self.restantes], self.indices[-1] = self.indices[-1], self.indices[self.restantes]
+            self.restantes += 1
+
+    def sacar(self):
+        """
+        Returns:
+            int: Un índice que no ha salido en la ronda actual.
+
+        Raises:
+            IndexError: Si la bolsa está vacía.
+        """
+        if not self.indices:
+            raise IndexError("No hay palabras para seleccionar")
+        if self.restantes == 0:
+            self.restantes = len(self.indices)
+        j = self.aleatorio.randrange(self.restantes)
+        self.restantes -= 1
+        indices = self.indices
+        indices[j], indices[self.restantes] = indices[self.restantes], indices[j]
+        return indices[self.restantes]
+
+
+class MuestreoAlias:
+    """
+    Muestreo ponderado por el método de alias de Vose: O(n) para construir la
+    tabla y O(1) por extracción.
+
+    Attributes:
+        probabilidades (array): Probabilidad de quedarse con la columna elegida.
+        alias (array): Índice alternativo de cada columna.
+    """
+
+    def __init__(self, pesos, aleatorio):
+        cantidad = len(pesos)
+        total = float(sum(pesos))
+        if cantidad == 0 or total <= 0 or min(pesos) < 0:
+            raise ValueError("Los pesos deben ser no negativos y sumar más de cero")
+        escalados = [peso * cantidad / total for peso in pesos]
+        self.probabilidades = array('d', [1.0]) * cantidad
+        self.alias = array('I', range(cantidad))
+        pequenos = [i for i, peso in enumerate(escalados) if peso < 1.0]
+        grandes = [i for i, peso in enumerate(escalados) if peso >= 1.0]
+        while pequenos and grandes:
+            pequeno = pequenos.pop()
+            grande = grandes[-1]
+            self.probabilidades[pequeno] = escalados[pequeno]
+            self.alias[pequeno] = grande
+            escalados[grande] -= 1.0 - escalados[pequeno]
+            if escalados[grande] < 1.0:
+                pequenos.append(grandes.pop())
+        self.aleatorio = aleatorio
+
+    def sacar(self):
+        """
+        Returns:
+            int: Un índice elegido con probabilidad proporcional a su peso.
+        """
+        columna = self.aleatorio.randrange(len(self.alias))
+        if self.aleatorio.random() < self.probabilidades[columna]:
+            return columna
+        return self.alias[columna]
+
+
+class FiltroBloomRotativo:
+    """
+    Conjunto aproximado de las palabras vistas recientemente, con memoria acotada.
+
+    Las palabras se agregan al filtro más nuevo; cuando éste alcanza `capacidad`
+    elementos se descarta el más viejo. Recuerda entre `capacidad` y
+    `capacidad * generaciones` palabras, con falsos positivos cerca de `tasa_error`
+    y sin falsos negativos dentro de esa ventana.
+
+    Attributes:
+        capacidad (int): Palabras por generación.
+        bits (int): Bits de cada filtro.
+        funciones (int): Posiciones marcadas por palabra.
+        filtros (list): Filtros de bits, del más viejo al más nuevo.
+        cantidad (int): Palabras agregadas al filtro más nuevo.
+    """
+
+    def __init__(self, capacidad=1000, tasa_error=0.01, generaciones=2):
+        self.capacidad = capacidad
+        self.bits = max(8, math.ceil(-capacidad * math.log(tasa_error) / math.log(2) ** 2))
+        self.funciones = max(1, round(self.bits / capacidad * math.log(2)))
+        self.filtros = [bytearray((self.bits + 7) // 8) for _ in range(generaciones)]
+        self.cantidad = 0
+
+    def posiciones(self, palabra):
+        """Posiciones de bits de una palabra, por doble hashing."""
+        resumen = hashlib.blake2b(palabra.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(resumen[:8], 'little')
+        h2 = int.from_bytes(resumen[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.funciones)]
+
+    def __contains__(self, palabra):
+        posiciones = self.posiciones(palabra)
+        return any(all(filtro[p >> 3] & (1 << (p & 7)) for p in posiciones) for filtro in self.filtros)
+
+    def agregar(self, palabra):
+        """
+        Args:
+            palabra (str): La palabra vista.
+        """
+        if self.cantidad >= self.capacidad:
+            self.filtros.pop(0)
+            self.filtros.append(bytearray((self.bits + 7) // 8))
+            self.cantidad = 0
+        filtro = self.filtros[-1]
+        for p in self.posiciones(palabra):
+            filtro[p >> 3] |= 1 << (p & 7)
+        self.cantidad += 1
+
+
+class MotorSeleccion:
+    """
+    Elige palabras de un tema sin repetirlas hasta agotarlo, opcionalmente con pesos
+    y evitando las que cada jugador vio hace poco.
+
+    Attributes:
+        aleatorio (random.Random): Generador compartido; con la misma semilla se repite la secuencia.
+        bolsas (dict): Tema -> BolsaBarajada.
+        muestreos (dict): Tema -> (pesos, MuestreoAlias) construido para esos pesos.
+        vistas (dict): Jugador -> FiltroBloomRotativo.
+        capacidad_vistas (int): Palabras por generación del filtro de cada jugador.
+        max_reintentos (int): Extracciones extra para evitar palabras ya vistas por el jugador.
+    """
+
+    def __init__(self, semilla=None, capacidad_vistas=1000, max_reintentos=16):
+        self.aleatorio = random.Random(semilla)
+        self.bolsas = {}
+        self.muestreos = {}
+        self.vistas = {}
+        self.capacidad_vistas = capacidad_vistas
+        self.max_reintentos = max_reintentos
+
+    def bolsa(self, tema, cantidad):
+        """Bolsa barajada del tema, adaptada a `cantidad` palabras."""
+        bolsa = self.bolsas.get(tema)
+        if bolsa is None:
+            bolsa = self.bolsas[tema] = BolsaBarajada(cantidad, self.aleatorio)
+        elif len(bolsa) != cantidad:
+            bolsa.ajustar(cantidad)
+        return bolsa
+
+    def muestreo(self, tema, pesos):
+        """Tabla de alias del tema; se reconstruye solo si cambia el objeto de pesos."""
+        guardado = self.muestreos.get(tema)
+        if guardado is None or guardado[0] is not pesos:
+            guardado = self.muestreos[tema] = (pesos, MuestreoAlias(pesos, self.aleatorio))
+        return guardado[1]
+
+    def elegir(self, tema, palabras, jugador=None, pesos=None):
+        """
+        Elige una palabra del tema.
+
+        Args:
+            tema (str): El tema, que identifica la bolsa o la tabla de alias a usar.
+            palabras (Sequence): Las palabras del tema.
+            jugador (str, optional): Si se indica, se evitan las palabras que vio
+                recientemente, dentro de `max_reintentos` intentos.
+            pesos (Sequence, optional): Peso de cada palabra; reutiliza la tabla de
+                alias mientras se pase el mismo objeto.
+
+        Returns:
+            str: La palabra elegida.
+        """
+        if pesos is not None:
+            if len(pesos) != len(palabras):
+                raise ValueError("Debe haber un peso por palabra")
+            sacar = self.muestreo(tema, pesos).sacar
+        else:
+            sacar = self.bolsa(tema, len(palabras)).sacar
+        palabra = palabras[sacar()]
+        if jugador is None:
+            return palabra
+        vistas = self.vistas.get(jugador)
+        if vistas is None:
+            vistas = self.vistas[jugador] = FiltroBloomRotativo(self.capacidad_vistas)
+        for _ in range(self.max_reintentos):
+            if palabra not in vistas:
+                break
+            palabra = palabras[sacar()]
+        vistas.agregar(palabra)
+        return palabra
@@ -0,0 +1,217 @@
+import asyncio
+import uuid
+from random import choice
+from juego import Juego, EstadoJuego
+
+ESTADOS_GANADORES = {EstadoJuego.LETRAS_COMPLETAS, EstadoJuego.PALABRA_CORRECTA}
+
+
+class SesionRemota:
+    """
+    Partida de una conexión al servidor.
+
+    Attributes:
+        juego (Juego): La partida en curso, o None si aún no se ha iniciado.
+        tema (str): El tema de la partida en curso.
+        id_sesion (str): Identificador con el que se guarda la partida en el almacén.
+        id_bitacora (int): Identificador de la partida en la bitácora, o None sin bitácora.
+    """
+
+    def __init__(self):
+        self.juego = None
+        self.tema = None
+        self.id_sesion = None
+        self.id_bitacora = None
+
+
+class ServidorAhorcado:
+    """
+    Servidor asyncio que atiende muchas partidas simultáneas con un protocolo de líneas de texto.
+
+    Cada conexión tiene su propio `Juego` y todas comparten el mismo `GestorPalabras`.
+    Comandos (una línea UTF-8 cada uno):
+
+        TEMAS              -> TEMAS <tema>\\t<tema>...
+        NUEVO [tema]       -> PARTIDA <intentos_max> <avance>
+        JUGAR <entrada>    -> TURNO <estado> <puntos> <errores> <avance>
+                              y, si la partida termina, FIN GANASTE|PERDISTE <palabra>
+        SALIR              -> ADIOS
+
+    Con un almacén de sesiones, NUEVO responde además SESION <id> antes de PARTIDA,
+    cada turno se guarda y REANUDAR <id> retoma una partida tras una desconexión.
+
+    Attributes:
+        gestor (GestorPalabras): Gestor de palabras compartido por todas las sesiones.
+        tiempo_inactividad (float): Segundos sin recibir líneas antes de cerrar la conexión.
+        max_sesiones (int): Máximo de sesiones simultáneas; las conexiones extra reciben OCUPADO.
+        longitud_maxima (int): Longitud máxima de una línea recibida, en bytes.
+        sesiones_activas (int): Sesiones abiertas en este momento.
+        almacen (AlmacenSesiones): Almacén donde se guardan las partidas en curso, opcional.
+        bitacora (Bitacora): Bitácora donde se registra cada turno, opcional.
+    """
+
+    def __init__(self, gestor, tiempo_inactividad=300, max_sesiones=20000, longitud_maxima=1024,
+                 almacen=None, bitacora=None):
+        self.gestor = gestor
+        self.almacen = almacen
+        self.bitacora = bitacora
+        self.tiempo_inactividad = tiempo_inactividad
+        self.max_sesiones = max_sesiones
+        self.longitud_maxima = longitud_maxima
+        self.sesiones_activas = 0
+        self.servidor = None
+
+    async def iniciar(self, host="127.0.0.1", puerto=5000, unix=None):
+        """
+        Empieza a aceptar conexiones por TCP o, si se indica `unix`, por un socket Unix.
+
+        Args:
+            host (str): Dirección en la que escuchar.
+            puerto (int): Puerto TCP.
+            unix (str, optional): Ruta del socket Unix.
+
+        Returns:
+            asyncio.Server: El servidor iniciado.
+        """
+        if unix:
+            self.servidor = await asyncio.start_unix_server(self.atender, path=unix,
+                                                            limit=self.longitud_maxima)
+        else:
+            self.servidor = await asyncio.start_server(self.atender, host, puerto,
+                                                       limit=self.longitud_maxima, backlog=4096)
+        return self.servidor
+
+    async def servir(self, host="127.0.0.1", puerto=5000, unix=None):
+        """
+        Inicia el servidor y atiende conexiones hasta que se cancele.
+        """
+        servidor = await self.iniciar(host, puerto, unix)
+        async with servidor:
+            await servidor.serve_forever()
+
+    async def atender(self, lector, escritor):
+        """
+        Atiende una conexión hasta que el cliente sale, se desconecta o supera el tiempo de inactividad.
+
+        Args:
+            lector (asyncio.StreamReader): Flujo de entrada de la conexión.
+            escritor (asyncio.StreamWriter): Flujo de salida de la conexión.
+        """
+        if self.sesiones_activas >= self.max_sesiones:
+            try:
+                await self.responder(escritor, "OCUPADO")
+            except ConnectionError:
+                pass
+            await self.cerrar(escritor)
+            return
+
+        self.sesiones_activas += 1
+        sesion = SesionRemota()
+        try:
+            while True:
+                try:
+                    linea = await asyncio.wait_for(lector.readline(), self.tiempo_inactividad)
+                except asyncio.TimeoutError:
+                    await self.responder(escritor, "TIEMPO_AGOTADO")
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    await self.responder(escritor, "ERROR Línea demasiado larga")
+                    break
+                if not linea:
+                    break
+                respuestas = self.procesar(sesion, linea.decode('utf-8', 'replace').strip())
+                if respuestas is None:
+                    await self.responder(escritor, "ADIOS")
+                    break
+                await self.responder(escritor, *respuestas)
+        except ConnectionError:
+            pass
+        finally:
+            self.sesiones_activas -= 1
+            await self.cerrar(escritor)
+
+    def procesar(self, sesion, linea):
+        """
+        Ejecuta un comando de la sesión.
+
+        Args:
+            sesion (SesionRemota): La sesión que envía el comando.
+            linea (str): La línea recibida, sin salto de línea.
+
+        Returns:
+            list: Líneas de respuesta, o None si el cliente pidió salir.
+        """
+        comando, _, argumento = linea.partition(" ")
+        comando = comando.upper()
+        if comando == "SALIR":
+            return None
+        if comando == "TEMAS":
+            return ["TEMAS " + "\t".join(self.gestor.obtener_temas())]
+        if comando == "NUEVO":
+            temas = self.gestor.obtener_temas()
+            tema = argumento or (choice(temas) if temas else "")
+            try:
+                palabra = self.gestor.seleccionar_palabra(tema)
+            except (KeyError, ValueError, IndexError):
+                return [f"ERROR El tema '{tema}' no existe"]
+            sesion.juego = Juego(palabra)
+            sesion.tema = tema
+            respuestas = [f"PARTIDA {sesion.juego.intentos_max} {sesion.juego.avance}"]
+            if self.bitacora is not None:
+                sesion.id_bitacora = self.bitacora.iniciar(palabra)
+            if self.almacen is not None:
+                sesion.id_sesion = uuid.uuid4().hex
+                self.almacen.guardar(sesion.id_sesion, sesion.juego)
+                respuestas.insert(0, f"SESION {sesion.id_sesion}")
+            return respuestas
+        if comando == "REANUDAR":
+            juego = self.almacen.cargar(argumento) if self.almacen is not None and argumento else None
+            if juego is None:
+                return [f"ERROR La sesión '{argumento}' no existe o ya terminó"]
+            sesion.juego = juego
+            sesion.id_sesion = argumento
+            if self.bitacora is not None:
+                sesion.id_bitacora = self.bitacora.retomar(juego)
+            return [f"PARTIDA {juego.intentos_max} {juego.avance}"]
+        if comando == "JUGAR":
+            juego = sesion.juego
+            if juego is None:
+                return ["ERROR No hay una partida en curso; envía NUEVO"]
+            if not argumento:
+                return ["ERROR Falta la entrada"]
+            estado, puntos = juego.jugar_turno(argumento)
+            if self.bitacora is not None:
+                self.bitacora.registrar(sesion.id_bitacora, argumento, estado, puntos)
+            respuestas = [f"TURNO {estado.name} {puntos} {juego.errores} {juego.avance}"]
+            if estado in ESTADOS_GANADORES:
+                respuestas.append(f"FIN GANASTE {juego.palabra}")
+                sesion.juego = None
+                if juego.instrumentacion is not None:
+                    juego.instrumentacion.juego_terminado(juego, True, puntos)
+            elif juego.errores >= juego.intentos_max:
+                respuestas.append(f"FIN PERDISTE {juego.palabra}")
+                sesion.juego = None
+                if juego.instrumentacion is not None:
+                    juego.instrumentacion.juego_terminado(juego, False, juego.calcular_puntos())
+            if self.almacen is not None and sesion.id_sesion is not None:
+                self.almacen.guardar(sesion.id_sesion, juego, terminado=sesion.juego is None)
+            return respuestas
+        return [f"ERROR Comando desconocido: {comando}"]
+
+    @staticmethod
+    async def responder(escritor, *lineas):
+        """
+        Envía líneas al cliente y espera a que el búfer de salida se vacíe,
+        de modo que un cliente lento frena solo a su propia sesión.
+        """
+        escritor.write("".join(linea + "\n" for linea in lineas).encode('utf-8'))
+        await escritor.drain()
+
+    @staticmethod
+    async def cerrar(escritor):
+        """Cierra la conexión ignorando errores de un cliente ya desconectado."""
+        try:
+            escritor.close()
+            await escritor.wait_closed()
+        except ConnectionError:
+            pass
@@ -0,0 +1,101 @@
+import pathlib
+import sqlite3
+import threading
+import time
+from almacen_grupo import AlmacenEnGrupo
+from juego import Juego
+
+
+class AlmacenSesiones(AlmacenEnGrupo):
+    """
+    Almacén persistente de partidas en curso respaldado por SQLite en modo WAL.
+
+    Las actualizaciones se confirman en grupo como en `AlmacenEnGrupo`, de modo
+    que miles de turnos por segundo cuestan unas pocas sincronizaciones a disco.
+    El mismo hilo escritor elimina periódicamente las partidas terminadas.
+
+    Attributes:
+        intervalo_compactacion (float): Segundos entre eliminaciones de partidas terminadas.
+        pendientes (dict): Sesión -> (estado, terminado, actualizado) aún sin escribir.
+        lectura (sqlite3.Connection): Conexión de solo lectura de `cargar`. En modo WAL
+            lee sin esperar a las transacciones del hilo escritor, así que retomar una
+            partida desde el bucle del servidor no espera a un fsync.
+    """
+
+    def __init__(self, ruta, intervalo_commit=0.05, max_pendientes=5000, intervalo_compactacion=60.0):
+        super().__init__(ruta, intervalo_commit, max_pendientes, sincronizacion="FULL")
+        self.intervalo_compactacion = intervalo_compactacion
+        self.ultima_compactacion = time.monotonic()
+        self.conexion.execute("""CREATE TABLE IF NOT EXISTS sesiones (
+                                     id TEXT PRIMARY KEY,
+                                     estado BLOB NOT NULL,
+                                     terminado INTEGER NOT NULL,
+                                     actualizado REAL NOT NULL
+                                 ) WITHOUT ROWID""")
+        self.conexion.execute("""CREATE INDEX IF NOT EXISTS sesiones_terminadas
+                                 ON sesiones (terminado) WHERE terminado = 1""")
+        self.lectura = sqlite3.connect(pathlib.Path(ruta).absolute().as_uri() + "?mode=ro", uri=True,
+                                       check_same_thread=False, isolation_level=None)
+        self.candado_lectura = threading.Lock()
+        self.iniciar_escritor()
+
+    def guardar(self, id_sesion, juego, terminado=False):
+        """
+        Registra el estado actual de una partida; se confirma en la siguiente escritura en grupo.
+
+        Args:
+            id_sesion (str): Identificador de la sesión.
+            juego (Juego): La partida a guardar.
+            terminado (bool): Si la partida ya terminó y puede eliminarse al compactar.
+        """
+        self.acumular({id_sesion: (juego.to_bytes(), int(terminado), time.time())})
+
+    def cargar(self, id_sesion, incluir_terminadas=False):
+        """
+        Reconstruye una partida guardada sin repetir sus turnos.
+
+        Args:
+            id_sesion (str): Identificador de la sesión.
+            incluir_terminadas (bool): Si también se devuelven las partidas ya terminadas.
+
+        Returns:
+            Juego: La partida, o None si no existe (o terminó y no se piden las terminadas).
+        """
+        fila = self.leer_pendiente(id_sesion)
+        if fila is None:
+            # Lo que no está pendiente ni en vuelo ya se confirmó (o nunca se guardó)
+            with self.candado_lectura:
+                fila = self.lectura.execute("SELECT estado, terminado FROM sesiones WHERE id = ?",
+                                             (id_sesion,)).fetchone()
+        if fila is None or (fila[1] and not incluir_terminadas):
+            return None
+        return Juego.from_bytes(fila[0])
+
+    def escribir_lote(self, lote):
+        """Guarda un lote de sesiones (id -> (estado, terminado, actualizado))."""
+        self.conexion.executemany("INSERT OR REPLACE INTO sesiones VALUES (?, ?, ?, ?)",
+                                  [(id_sesion, estado, terminado, actualizado)
+                                   for id_sesion, (estado, terminado, actualizado) in lote.items()])
+
+    def compactar(self):
+        """
+        Elimina las partidas terminadas.
+
+        Returns:
+            int: Cantidad de partidas eliminadas.
+        """
+        self.sincronizar()
+        with self.candado_bd:
+            return self.conexion.execute("DELETE FROM sesiones WHERE terminado = 1").rowcount
+
+    def mantener(self):
+        """Compacta cada `intervalo_compactacion` segundos."""
+        if time.monotonic() - self.ultima_compactacion >= self.intervalo_compactacion:
+            self.compactar()
+            self.ultima_compactacion = time.monotonic()
+
+    def cerrar(self):
+        """Cierra la conexión de lectura y, como `AlmacenEnGrupo.cerrar`, confirma lo pendiente y cierra la base."""
+        with self.candado_lectura:
+            self.lectura.close()
+        super().cerrar()
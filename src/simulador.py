@@ -0,0 +1,286 @@
+import argparse
+import os
+import random
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from juego import Juego, EstadoJuego
+from palabras import GestorPalabras
+
+ESTADOS_GANADORES = {EstadoJuego.LETRAS_COMPLETAS, EstadoJuego.PALABRA_CORRECTA}
+# Letras del español ordenadas de más a menos frecuente
+FRECUENCIA_ESPANOL = "eaosrnidlctumpbgvyqhfzjñxkw"
+
+
+class Estrategia:
+    """Estrategia base para elegir la siguiente entrada de una partida sin intervención humana."""
+
+    def iniciar(self, juego):
+        """
+        Prepara la estrategia para una nueva partida.
+
+        Args:
+            juego (Juego): La partida que va a comenzar.
+        """
+
+    def siguiente(self, juego):
+        """
+        Elige la siguiente entrada para la partida.
+
+        Args:
+            juego (Juego): La partida en curso.
+
+        Returns:
+            str: La letra o palabra a jugar, o None para abandonar la partida.
+        """
+        raise NotImplementedError("Implementa este método en la subclase")
+
+
+class EstrategiaFrecuencia(Estrategia):
+    """Juega las letras no usadas en orden de frecuencia."""
+
+    def __init__(self, orden=FRECUENCIA_ESPANOL):
+        self.orden = orden
+
+    def siguiente(self, juego):
+        usadas = juego.letras_usadas
+        for letra in self.orden:
+            if letra not in usadas:
+                return letra
+        return None
+
+
+class EstrategiaAleatoria(Estrategia):
+    """Juega letras no usadas al azar con una semilla reproducible."""
+
+    def __init__(self, semilla=None, alfabeto=FRECUENCIA_ESPANOL):
+        self.aleatorio = random.Random(semilla)
+        self.alfabeto = alfabeto
+
+    def siguiente(self, juego):
+        usadas = juego.letras_usadas
+        disponibles = [letra for letra in self.alfabeto if letra not in usadas]
+        return self.aleatorio.choice(disponibles) if disponibles else None
+
+
+class EstrategiaGuionada(Estrategia):
+    """Juega una secuencia fija de entradas, reiniciándola en cada partida."""
+
+    def __init__(self, entradas):
+        self.entradas = list(entradas)
+        self.posicion = 0
+
+    def iniciar(self, juego):
+        self.posicion = 0
+
+    def siguiente(self, juego):
+        if self.posicion >= len(self.entradas):
+            return None
+        self.posicion += 1
+        return self.entradas[self.posicion - 1]
+
+
+ESTRATEGIAS = {
+    "frecuencia": EstrategiaFrecuencia,
+    "aleatoria": EstrategiaAleatoria,
+}
+
+
+class EstadisticasPalabra:
+    """
+    Resultados acumulados de todas las partidas simuladas con una palabra.
+
+    Attributes:
+        partidas (int): Partidas jugadas.
+        victorias (int): Partidas ganadas.
+        suma_errores (int): Suma de los errores de todas las partidas.
+        puntos (Counter): Distribución de los puntos de `calcular_puntos` en las partidas ganadas.
+    """
+
+    def __init__(self):
+        self.partidas = 0
+        self.victorias = 0
+        self.suma_errores = 0
+        self.puntos = Counter()
+
+    def registrar(self, gano, errores, puntos):
+        """
+        Acumula el resultado de una partida.
+
+        Args:
+            gano (bool): Si la partida se ganó.
+            errores (int): Errores cometidos.
+            puntos (int): Puntos obtenidos.
+        """
+        self.partidas += 1
+        self.suma_errores += errores
+        if gano:
+            self.victorias += 1
+            self.puntos[puntos] += 1
+
+    def fusionar(self, otras):
+        """
+        Suma a estas estadísticas las de otro fragmento de la simulación.
+
+        Args:
+            otras (EstadisticasPalabra): Estadísticas a incorporar.
+        """
+        self.partidas += otras.partidas
+        self.victorias += otras.victorias
+        self.suma_errores += otras.suma_errores
+        self.puntos.update(otras.puntos)
+
+    @property
+    def tasa_victorias(self):
+        """float: Proporción de partidas ganadas."""
+        return self.victorias / self.partidas if self.partidas else 0.0
+
+    @property
+    def errores_promedio(self):
+        """float: Errores promedio por partida."""
+        return self.suma_errores / self.partidas if self.partidas else 0.0
+
+
+def jugar_partida(palabra, estrategia, max_turnos=100):
+    """
+    Juega una partida completa sin interacción, como lo haría `ControladorAhorcado.jugar`.
+
+    Args:
+        palabra (str): La palabra secreta.
+        estrategia (Estrategia): La estrategia que elige cada entrada.
+        max_turnos (int): Límite de turnos para estrategias que no terminan.
+
+    Returns:
+        tuple: (gano, errores, puntos) de la partida.
+    """
+    juego = Juego(palabra)
+    estrategia.iniciar(juego)
+    for _ in range(max_turnos):
+        if juego.errores >= juego.intentos_max:
+            break
+        entrada = estrategia.siguiente(juego)
+        if entrada is None:
+            break
+        estado, puntos = juego.jugar_turno(entrada)
+        if estado in ESTADOS_GANADORES:
+            return True, juego.errores, puntos
+    return False, juego.errores, 0
+
+
+def simular_fragmento(tema, palabras, estrategia, partidas_por_palabra):
+    """
+    Simula las partidas de un fragmento de palabras de un tema. Se ejecuta en un proceso trabajador.
+
+    Args:
+        tema (str): El tema del fragmento.
+        palabras (list): Las palabras del fragmento.
+        estrategia (Estrategia): La estrategia a usar.
+        partidas_por_palabra (int): Partidas a jugar con cada palabra.
+
+    Returns:
+        tuple: (tema, dict palabra -> EstadisticasPalabra).
+    """
+    resultados = {}
+    for palabra in palabras:
+        estadisticas = resultados.setdefault(palabra, EstadisticasPalabra())
+        for _ in range(partidas_por_palabra):
+            estadisticas.registrar(*jugar_partida(palabra, estrategia))
+    return tema, resultados
+
+
+class Simulador:
+    """
+    Juega partidas sin interfaz repartiendo los temas de un `GestorPalabras` entre varios procesos.
+
+    Attributes:
+        gestor (GestorPalabras): Gestor con los temas y palabras a simular.
+        estrategia (Estrategia): Estrategia que juega las partidas; se copia a cada proceso.
+        partidas_por_palabra (int): Partidas a jugar con cada palabra.
+        procesos (int): Número de procesos trabajadores.
+        tamano_fragmento (int): Máximo de palabras por tarea enviada a un proceso.
+    """
+
+    def __init__(self, gestor, estrategia, partidas_por_palabra=1, procesos=None, tamano_fragmento=1000):
+        self.gestor = gestor
+        self.estrategia = estrategia
+        self.partidas_por_palabra = partidas_por_palabra
+        self.procesos = procesos or os.cpu_count()
+        self.tamano_fragmento = tamano_fragmento
+
+    def fragmentos(self, temas):
+        """
+        Divide las palabras de cada tema en fragmentos de tamaño acotado.
+
+        Args:
+            temas (list): Temas a simular.
+
+        Yields:
+            tuple: (tema, lista de palabras del fragmento).
+        """
+        for tema in temas:
+            palabras = self.gestor.opciones[tema]
+            for inicio in range(0, len(palabras), self.tamano_fragmento):
+                yield tema, list(palabras[inicio:inicio + self.tamano_fragmento])
+
+    def ejecutar(self, temas=None):
+        """
+        Ejecuta la simulación y entrega los resultados de cada fragmento a medida que terminan.
+        Solo se mantienen en vuelo dos fragmentos por proceso para acotar la memoria.
+
+        Args:
+            temas (list, optional): Temas a simular; por defecto todos los del gestor.
+
+        Yields:
+            tuple: (tema, dict palabra -> EstadisticasPalabra) de cada fragmento.
+        """
+        temas = self.gestor.obtener_temas() if temas is None else temas
+        pendientes = self.fragmentos(temas)
+        en_vuelo = set()
+        with ProcessPoolExecutor(max_workers=self.procesos) as ejecutor:
+            while True:
+                for tema, palabras in pendientes:
+                    en_vuelo.add(ejecutor.submit(simular_fragmento, tema, palabras,
+                                                 self.estrategia, self.partidas_por_palabra))
+                    if len(en_vuelo) >= 2 * self.procesos:
+                        break
+                if not en_vuelo:
+                    break
+                terminadas, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                for tarea in terminadas:
+                    yield tarea.result()
+
+    def resumir(self, temas=None):
+        """
+        Ejecuta la simulación y fusiona los fragmentos por tema y palabra.
+
+        Args:
+            temas (list, optional): Temas a simular; por defecto todos los del gestor.
+
+        Returns:
+            dict: tema -> dict palabra -> EstadisticasPalabra.
+        """
+        resumen = {}
+        for tema, resultados in self.ejecutar(temas):
+            por_palabra = resumen.setdefault(tema, {})
+            for palabra, estadisticas in resultados.items():
+                por_palabra.setdefault(palabra, EstadisticasPalabra()).fusionar(estadisticas)
+        return resumen
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simula partidas del ahorcado sin interfaz.")
+    parser.add_argument("--csv", default="temas_palabras.csv", help="Archivo CSV con los temas y palabras")
+    parser.add_argument("--estrategia", choices=sorted(ESTRATEGIAS), default="frecuencia")
+    parser.add_argument("--partidas", type=int, default=1, help="Partidas por palabra")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos trabajadores")
+    argumentos = parser.parse_args()
+
+    simulador = Simulador(GestorPalabras(argumentos.csv, compilado=True),
+                          ESTRATEGIAS[argumentos.estrategia](),
+                          argumentos.partidas, argumentos.procesos)
+    for tema, por_palabra in simulador.resumir().items():
+        total = EstadisticasPalabra()
+        for estadisticas in por_palabra.values():
+            total.fusionar(estadisticas)
+        print(f"{tema}: {total.partidas} partidas, "
+              f"{total.tasa_victorias:.1%} ganadas, "
+              f"{total.errores_promedio:.2f} errores promedio")
@@ -0,0 +1,75 @@
+import random
+import unittest
+from src.adversario import IndiceCandidatas, JuegoAdversario  # Asegúrate de que el nombre del archivo sea correcto
+from juego import Juego, EstadoJuego
+
+class TestJuegoAdversario(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un índice con palabras de cuatro letras y una de otra longitud.
+        """
+        self.indice = IndiceCandidatas(["casa", "cosa", "masa", "mesa", "pera", "sola", "camión"])
+
+    def test_conserva_familia_mas_grande(self):
+        """
+        Prueba que una letra deje la familia más grande y que, si empatan, se prefiera la que no la contiene.
+        """
+        juego = JuegoAdversario(self.indice)
+        self.assertEqual(juego.avance, "_ _ _ _")
+        # 'a' solo al final: cosa, mesa, pera, sola; en las posiciones 2 y 4: casa, masa
+        self.assertEqual(juego.jugar_turno("a"), (EstadoJuego.SEGUIR_JUGANDO, 0))
+        self.assertEqual(juego.avance, "_ _ _ a")
+        self.assertEqual(len(juego.candidatas), 4)
+        # 'e': mesa y pera la tienen en la misma posición, cosa y sola no; empatan
+        self.assertEqual(juego.jugar_turno("e"), (EstadoJuego.LETRA_INCORRECTA, 0))
+        self.assertEqual(sorted(juego.grupo.palabras[fila] for fila in juego.candidatas), ["cosa", "sola"])
+        self.assertEqual(juego.jugar_turno("e"), (EstadoJuego.LETRA_REPETIDA, 0))
+
+    def test_palabra_completa(self):
+        """
+        Prueba que adivinar la palabra completa la descarte mientras queden otras candidatas.
+        """
+        juego = JuegoAdversario(self.indice)
+        juego.jugar_turno("a")
+        juego.jugar_turno("e")
+        estado, _ = juego.jugar_turno(juego.palabra)
+        self.assertEqual(estado, EstadoJuego.SEGUIR_JUGANDO)
+        self.assertEqual(len(juego.candidatas), 1)
+        self.assertEqual(juego.jugar_turno(juego.palabra)[0], EstadoJuego.PALABRA_CORRECTA)
+
+    def test_longitud_y_acentos(self):
+        """
+        Prueba elegir la longitud y que las letras se comparen normalizadas.
+        """
+        juego = JuegoAdversario(self.indice, longitud=6)
+        self.assertEqual(juego.jugar_turno("o"), (EstadoJuego.SEGUIR_JUGANDO, 0))
+        self.assertEqual(juego.avance, "_ _ _ _ ó _")
+        with self.assertRaises(ValueError):
+            JuegoAdversario(self.indice, longitud=9)
+        with self.assertRaises(ValueError):
+            JuegoAdversario(IndiceCandidatas([]))
+
+    def test_estados_iguales_a_juego_con_la_palabra_final(self):
+        """
+        Prueba que cada turno dé el mismo resultado que un Juego normal con la palabra que quedó al final.
+        """
+        aleatorio = random.Random(7)
+        palabras = ["".join(aleatorio.choices("aeioulmnrst", k=5)) for _ in range(2000)]
+        indice = IndiceCandidatas(palabras)
+        for _ in range(50):
+            juego = JuegoAdversario(indice)
+            entradas = aleatorio.sample("aeioulmnrstxz", 13)
+            for posicion in sorted(aleatorio.sample(range(13), 3), reverse=True):
+                entradas.insert(posicion, aleatorio.choice(palabras))
+            resultados = []
+            for entrada in entradas:
+                resultados.append(juego.jugar_turno(entrada))
+                if juego.errores >= juego.intentos_max or resultados[-1][1]:
+                    break
+            normal = Juego(juego.palabra)
+            self.assertEqual([normal.jugar_turno(entrada) for entrada in entradas[:len(resultados)]], resultados)
+            self.assertEqual(normal.avance, juego.avance)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from src.almacen_grupo import AlmacenEnGrupo  # Asegúrate de que el nombre del archivo sea correcto
+
+class AlmacenMaximos(AlmacenEnGrupo):
+    """Almacén de prueba que guarda el máximo de cada clave y puede fallar a pedido."""
+
+    def __init__(self, ruta, **opciones):
+        super().__init__(ruta, **opciones)
+        self.conexion.execute("CREATE TABLE IF NOT EXISTS valores (clave TEXT PRIMARY KEY, valor INTEGER)")
+        self.fallos = 0
+        self.iniciar_escritor()
+
+    def combinar(self, anterior, nuevo):
+        return max(anterior, nuevo)
+
+    def escribir_lote(self, lote):
+        if self.fallos:
+            self.fallos -= 1
+            raise sqlite3.OperationalError("disco lleno")
+        self.conexion.executemany("INSERT OR REPLACE INTO valores VALUES (?, ?)", lote.items())
+
+class TestAlmacenEnGrupo(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea el almacén en un directorio temporal para cada prueba.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "valores.db")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_lote_fallido_se_combina_y_reintenta(self):
+        """
+        Prueba que un lote que no se pudo escribir vuelva a pendientes combinado con lo posterior.
+        """
+        with AlmacenMaximos(self.ruta, intervalo_commit=10, max_pendientes=100) as almacen:
+            almacen.acumular({"a": 5, "b": 1})
+            almacen.fallos = 1
+            with self.assertRaises(sqlite3.OperationalError):
+                almacen.sincronizar()
+            self.assertEqual(almacen.en_vuelo, {})
+            almacen.acumular({"a": 3, "b": 7})
+            self.assertEqual(almacen.leer_pendiente("a"), 5)
+            self.assertEqual(almacen.leer_pendiente("b"), 7)
+            self.assertEqual(almacen.sincronizar(), 2)
+            self.assertEqual(almacen.confirmaciones, 1)
+            self.assertIsNone(almacen.leer_pendiente("a"))
+
+    def test_hilo_escritor_sobrevive_a_un_fallo(self):
+        """
+        Prueba que el hilo escritor siga vivo tras un fallo y confirme el lote en la siguiente vuelta.
+        """
+        with self.assertLogs(level="ERROR"):
+            with AlmacenMaximos(self.ruta, intervalo_commit=0.01, max_pendientes=100) as almacen:
+                almacen.fallos = 1
+                almacen.acumular({"a": 1})
+                limite = time.monotonic() + 5
+                while almacen.confirmaciones == 0 and time.monotonic() < limite:
+                    time.sleep(0.01)
+                self.assertTrue(almacen.hilo.is_alive())
+                self.assertEqual(almacen.confirmaciones, 1)
+        conexion = sqlite3.connect(self.ruta)
+        self.assertEqual(conexion.execute("SELECT clave, valor FROM valores").fetchall(), [("a", 1)])
+        conexion.close()
+
+if __name__ == "__main__":
+    unittest.main()
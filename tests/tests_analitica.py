@@ -0,0 +1,133 @@
+import unittest
+from src.analitica import AgregadorPartidas, CatalogoPalabras, resumir_turnos  # Asegúrate de que el nombre del archivo sea correcto
+from juego import Juego, EstadoJuego, BIT_LETRA
+
+class TestAgregadorPartidas(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un catálogo con dos temas y tres palabras.
+        """
+        self.catalogo = CatalogoPalabras()
+        self.casa = self.catalogo.internar("hogar", "casa")
+        self.mesa = self.catalogo.internar("hogar", "mesa")
+        self.perro = self.catalogo.internar("animales", "perro")
+        self.agregador = AgregadorPartidas(self.catalogo)
+
+    def test_agregar_lote(self):
+        """
+        Prueba que un lote en columnas se acumule por palabra y por tema.
+        """
+        self.agregador.agregar_lote(
+            palabras=[self.casa, self.casa, self.perro, self.mesa],
+            ganadas=[True, False, True, False],
+            errores=[1, 6, 2, 6],
+            puntos=[300, 0, 250, 0],
+            mascaras_incorrectas=[BIT_LETRA["z"], BIT_LETRA["z"] | BIT_LETRA["x"], BIT_LETRA["a"], 0],
+            intentos_palabra=[1, 0, 2, 0],
+            fuera_de_tiempo=[0, 0, 1, 0])
+        palabras = self.agregador.por_palabra()
+        self.assertEqual(palabras["id"].tolist(), [self.casa, self.mesa, self.perro])
+        self.assertEqual(palabras["partidas"].tolist(), [2, 1, 1])
+        self.assertEqual(palabras["tasa_victorias"].tolist(), [0.5, 0.0, 1.0])
+        self.assertEqual(palabras["errores_promedio"].tolist(), [3.5, 6.0, 2.0])
+        self.assertEqual(palabras["puntos_promedio"].tolist(), [300.0, 0.0, 250.0])
+        self.assertEqual(palabras["tasa_fuera_de_tiempo"].tolist(), [0.0, 0.0, 0.5])
+        self.assertEqual(palabras["letra_incorrecta"].tolist(), ["z", "", "a"])
+        self.assertEqual(self.agregador.por_palabra(minimo_partidas=2)["id"].tolist(), [self.casa])
+
+        temas = self.agregador.por_tema()
+        self.assertEqual(temas["tema"].tolist(), ["hogar", "animales"])
+        self.assertEqual(temas["partidas"].tolist(), [3, 1])
+        self.assertEqual(temas["riesgo_palabra"].tolist(), [1 / 3, 2.0])
+        self.assertEqual(self.agregador.letras_incorrectas("hogar", "casa"), [("z", 2), ("x", 1)])
+        self.assertEqual(self.agregador.letras_incorrectas("hogar", "perro"), [])
+        self.assertEqual(self.agregador.distribucion_puntos(), {250: 1, 300: 1})
+        self.assertEqual(self.agregador.distribucion_puntos("animales"), {250: 1})
+        self.assertEqual(self.agregador.distribucion_puntos("deportes"), {})
+
+    def test_registrar_partidas(self):
+        """
+        Prueba registrar partidas reales, incluso con palabras fuera del catálogo y más partidas que el búfer.
+        """
+        agregador = AgregadorPartidas(self.catalogo, tamano_bufer=2)
+        for palabra, entradas in (("casa", ["x", "c", "a", "s"]), ("casa", ["z", "x", "w", "y", "q", "j"]),
+                                  ("gato", ["o", "gato"]), ("gato", ["g", "a", "t", "gato"])):
+            tema = "animales" if palabra == "gato" else "hogar"
+            juego = Juego(palabra)
+            turnos, puntos = [], 0
+            for entrada in entradas:
+                estado, puntos = juego.jugar_turno(entrada)
+                turnos.append((entrada, estado))
+            agregador.registrar(tema, juego, puntos > 0, puntos, *resumir_turnos(turnos))
+        self.assertEqual(len(agregador.pendientes), 0)
+
+        palabras = agregador.por_palabra()
+        gato = self.catalogo.id_palabra[(self.catalogo.id_tema["animales"], "gato")]
+        self.assertEqual(palabras["id"].tolist(), [self.casa, gato])
+        self.assertEqual(palabras["partidas"].tolist(), [2, 2])
+        self.assertEqual(palabras["tasa_victorias"].tolist(), [0.5, 0.5])
+        self.assertEqual(palabras["riesgo_palabra"].tolist(), [0.0, 1.0])
+        self.assertEqual(palabras["tasa_fuera_de_tiempo"].tolist(), [0.0, 0.5])
+        self.assertEqual(agregador.letras_incorrectas("hogar", "casa", cantidad=1), [("x", 2)])
+
+    def test_partida_perdida_y_lote_invalido(self):
+        """
+        Prueba que los puntos None cuenten como 0 y que un lote inválido no toque los contadores ni los pendientes.
+        """
+        agregador = AgregadorPartidas(self.catalogo, tamano_bufer=10)
+        juego = Juego("mesa")
+        for letra in "zxwvqj":
+            juego.jugar_turno(letra)
+        agregador.registrar("hogar", juego, False, None)
+        agregador.pendientes.append((self.casa, True, 0, "muchos", 0, 0, 0))
+        with self.assertRaises(ValueError):
+            agregador.vaciar()
+        self.assertEqual(len(agregador.pendientes), 2)
+        self.assertEqual(int(agregador.contadores["partidas"].sum()), 0)
+        self.assertEqual(int(agregador.incorrectas.sum()), 0)
+
+        del agregador.pendientes[-1]
+        with self.assertRaises(ValueError):
+            agregador.agregar_lote(palabras=[len(self.catalogo)], ganadas=[True], errores=[0], puntos=[1],
+                                   mascaras_incorrectas=[0])
+        palabras = agregador.por_palabra()
+        self.assertEqual(palabras["id"].tolist(), [self.mesa])
+        self.assertEqual(palabras["puntos_promedio"].tolist(), [0.0])
+        self.assertEqual(agregador.letras_incorrectas("hogar", "mesa", cantidad=1), [("j", 1)])
+
+    def test_resumir_turnos(self):
+        """
+        Prueba contar los intentos de palabra completa sin contar los repetidos.
+        """
+        turnos = [("a", EstadoJuego.SEGUIR_JUGANDO), ("cosa", EstadoJuego.SEGUIR_JUGANDO),
+                  ("cosa", EstadoJuego.LETRA_REPETIDA), ("casa", EstadoJuego.PALABRA_FUERA_DE_TIEMPO)]
+        self.assertEqual(resumir_turnos(turnos), (2, 1))
+
+    def test_fusionar_catalogos_distintos(self):
+        """
+        Prueba fusionar un agregador cuyo catálogo tiene otro orden y palabras nuevas.
+        """
+        otro_catalogo = CatalogoPalabras()
+        otro = AgregadorPartidas(otro_catalogo)
+        otro.agregar_lote(
+            palabras=[otro_catalogo.internar("animales", "perro"), otro_catalogo.internar("deportes", "tenis"),
+                      otro_catalogo.internar("hogar", "casa")],
+            ganadas=[True, True, False], errores=[0, 1, 6], puntos=[400, 200, 0],
+            mascaras_incorrectas=[0, BIT_LETRA["ñ"], BIT_LETRA["b"]])
+        self.agregador.agregar_lote(palabras=[self.casa], ganadas=[True], errores=[2], puntos=[300],
+                                    mascaras_incorrectas=[BIT_LETRA["b"]])
+        self.agregador.fusionar(otro)
+
+        palabras = self.agregador.por_palabra()
+        tenis = self.catalogo.id_palabra[(self.catalogo.id_tema["deportes"], "tenis")]
+        self.assertEqual(palabras["id"].tolist(), [self.casa, self.perro, tenis])
+        self.assertEqual(palabras["partidas"].tolist(), [2, 1, 1])
+        self.assertEqual(palabras["letra_incorrecta"].tolist(), ["b", "", "ñ"])
+        self.assertEqual(self.agregador.letras_incorrectas("hogar", "casa"), [("b", 2)])
+        self.assertEqual(self.agregador.por_tema()["tema"].tolist(), ["hogar", "animales", "deportes"])
+        self.assertEqual(self.agregador.distribucion_puntos("deportes"), {200: 1})
+        self.assertEqual(self.agregador.distribucion_puntos(), {200: 1, 300: 1, 400: 1})
+
+if __name__ == '__main__':
+    unittest.main()
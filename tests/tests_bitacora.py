@@ -0,0 +1,197 @@
+import os
+import tempfile
+import unittest
+from src.bitacora import Bitacora, Reproductor, listar_segmentos, numero_de_segmento, CODIGO_ESTADO, TAMANO_CABECERA  # Asegúrate de que el nombre del archivo sea correcto
+from juego import Juego, EstadoJuego
+
+class TestBitacora(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un directorio temporal para los segmentos de la bitácora.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = self.directorio.name
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def jugar(self, bitacora, palabra, entradas):
+        """
+        Juega una partida registrando cada turno y devuelve (id, juego); guarda los puntos del último turno.
+        """
+        juego = Juego(palabra)
+        id_sesion = bitacora.iniciar(palabra)
+        for entrada in entradas:
+            estado, puntos = juego.jugar_turno(entrada)
+            bitacora.registrar(id_sesion, entrada, estado, puntos)
+        self.puntos = puntos
+        return id_sesion, juego
+
+    def test_reconstruir_partida(self):
+        """
+        Prueba que la partida reconstruida tenga el mismo estado que la original.
+        """
+        with Bitacora(self.ruta) as bitacora:
+            id_uno, uno = self.jugar(bitacora, "camión", ["a", "x", "o", "a"])
+            id_dos, dos = self.jugar(bitacora, "perro", ["p", "e", "z", "r", "o"])
+        self.assertEqual(Reproductor(self.ruta).reconstruir(id_uno).to_bytes(), uno.to_bytes())
+        self.assertEqual(Reproductor(self.ruta).reconstruir(id_dos).to_bytes(), dos.to_bytes())
+        self.assertIsNone(Reproductor(self.ruta).reconstruir(99))
+
+    def test_verificar_sin_discrepancias(self):
+        """
+        Prueba que la verificación repita todos los turnos y obtenga los puntos de las ganadas.
+        """
+        with Bitacora(self.ruta) as bitacora:
+            id_ganada, _ = self.jugar(bitacora, "sol", ["s", "o", "l"])
+            puntos = self.puntos
+            self.jugar(bitacora, "luna", ["x", "y", "z", "w", "q", "k"])
+        resultado = Reproductor(self.ruta).verificar()
+        self.assertEqual(resultado["partidas"], 2)
+        self.assertEqual(resultado["turnos"], 9)
+        self.assertEqual(resultado["discrepancias"], [])
+        self.assertEqual(resultado["puntos"], {id_ganada: puntos})
+
+    def test_verificar_detecta_discrepancia(self):
+        """
+        Prueba que un turno registrado con un estado distinto del real se informe.
+        """
+        with Bitacora(self.ruta) as bitacora:
+            id_sesion = bitacora.iniciar("gato")
+            bitacora.registrar(id_sesion, "g", EstadoJuego.LETRA_INCORRECTA)
+        discrepancias = Reproductor(self.ruta).verificar()["discrepancias"]
+        self.assertEqual(discrepancias, [(id_sesion, 1, EstadoJuego.LETRA_INCORRECTA, EstadoJuego.SEGUIR_JUGANDO)])
+
+    def test_verificar_puntos_y_bono_de_tiempo(self):
+        """
+        Prueba que se comparen los puntos registrados, incluido el bono por los segundos sobrantes.
+        """
+        with Bitacora(self.ruta) as bitacora:
+            juego = Juego("sol")
+            id_cronometrada = bitacora.iniciar("sol")
+            for letra in "so":
+                bitacora.registrar(id_cronometrada, letra, juego.jugar_turno(letra)[0])
+            estado, _ = juego.jugar_turno("l")
+            bitacora.registrar(id_cronometrada, "l", estado, juego.calcular_puntos(12.5), 12.5)
+            id_alterada = bitacora.iniciar("sol")
+            bitacora.registrar(id_alterada, "sol", EstadoJuego.PALABRA_CORRECTA, 999)
+        resultado = Reproductor(self.ruta).verificar()
+        self.assertEqual(resultado["discrepancias"], [(id_alterada, 1, 999, Juego("sol").calcular_puntos())])
+        self.assertEqual(resultado["puntos"][id_cronometrada], juego.calcular_puntos() + 12 * 2)
+
+    def test_verificar_en_varios_procesos(self):
+        """
+        Prueba que repartir los segmentos entre procesos dé el mismo resultado, con partidas que cruzan tramos.
+        """
+        with Bitacora(self.ruta, tamano_segmento=64, tamano_bufer=16) as bitacora:
+            juegos = {bitacora.iniciar(palabra): Juego(palabra) for palabra in ["mesa", "perro", "luna", "sol"] * 3}
+            ganadas = {}
+            for entrada in "aeioumsprlnxyzwq":
+                for id_sesion, juego in list(juegos.items()):
+                    estado, puntos = juego.jugar_turno(entrada)
+                    bitacora.registrar(id_sesion, entrada, estado, puntos)
+                    if puntos:
+                        ganadas[id_sesion] = puntos
+                    if puntos or juego.errores >= juego.intentos_max:
+                        del juegos[id_sesion]
+            id_sesion = bitacora.iniciar("gato")
+            bitacora.registrar(id_sesion, "g", EstadoJuego.LETRA_INCORRECTA)
+        self.assertGreater(len(listar_segmentos(self.ruta)), 3)
+        secuencial = Reproductor(self.ruta).verificar()
+        self.assertEqual(len(secuencial["discrepancias"]), 1)
+        self.assertEqual(secuencial["puntos"], ganadas)
+        self.assertEqual(Reproductor(self.ruta).verificar(procesos=3), secuencial)
+
+    def test_registro_cortado_se_descarta(self):
+        """
+        Prueba que un registro final incompleto se recorte al reabrir la bitácora.
+        """
+        with Bitacora(self.ruta) as bitacora:
+            id_sesion, juego = self.jugar(bitacora, "casa", ["c", "a"])
+        segmento = listar_segmentos(self.ruta)[-1]
+        with open(segmento, mode='ab') as archivo:
+            archivo.write(bytes([CODIGO_ESTADO[EstadoJuego.SEGUIR_JUGANDO], id_sesion, 5, ord("s")]))
+        with Bitacora(self.ruta) as bitacora:
+            self.assertEqual(bitacora.siguiente_id, id_sesion + 1)
+            estado, puntos = juego.jugar_turno("s")
+            bitacora.registrar(id_sesion, "s", estado, puntos)
+        resultado = Reproductor(self.ruta).verificar()
+        self.assertEqual(resultado["discrepancias"], [])
+        self.assertEqual(resultado["turnos"], 3)
+
+    def test_rotacion_de_segmentos(self):
+        """
+        Prueba que los segmentos roten al llenarse y que la lectura los recorra todos.
+        """
+        with Bitacora(self.ruta, tamano_segmento=64, tamano_bufer=16) as bitacora:
+            for _ in range(20):
+                self.jugar(bitacora, "mesa", ["m", "e", "s", "a"])
+        self.assertGreater(len(listar_segmentos(self.ruta)), 1)
+        resultado = Reproductor(self.ruta).verificar()
+        self.assertEqual((resultado["partidas"], resultado["turnos"]), (20, 80))
+        self.assertEqual(len(resultado["puntos"]), 20)
+
+    def test_siguiente_id_tras_varios_segmentos(self):
+        """
+        Prueba que al reabrir no se repitan ids aunque el último segmento no tenga inicios de partida.
+        """
+        with Bitacora(self.ruta, tamano_segmento=64, tamano_bufer=16) as bitacora:
+            for _ in range(5):
+                id_sesion, _ = self.jugar(bitacora, "mesa", ["m", "e", "s", "a"])
+            for entrada in ["x", "y", "z"]:
+                bitacora.registrar(id_sesion, entrada, EstadoJuego.LETRA_INCORRECTA)
+        self.assertGreater(len(listar_segmentos(self.ruta)), 2)
+        with Bitacora(self.ruta) as bitacora:
+            self.assertEqual(bitacora.siguiente_id, 5)
+
+        # Un segmento cortado al crearse toma los ids del anterior
+        numero = numero_de_segmento(listar_segmentos(self.ruta)[-1])
+        with open(os.path.join(self.ruta, f"{numero + 1:08d}.bit"), mode='wb') as archivo:
+            archivo.write(b"AHBI")
+        with Bitacora(self.ruta) as bitacora:
+            self.assertEqual(bitacora.siguiente_id, 5)
+            self.assertEqual(bitacora.iniciar("sol"), 5)
+        self.assertEqual(Reproductor(self.ruta).verificar()["partidas"], 6)
+
+    def test_registrar_no_escribe_en_el_disco(self):
+        """
+        Prueba que registrar solo acumule en memoria y que cerrar escriba lo pendiente.
+        """
+        bitacora = Bitacora(self.ruta, intervalo_fsync=60)
+        self.jugar(bitacora, "sol", ["s", "o", "l"])
+        segmento = listar_segmentos(self.ruta)[-1]
+        self.assertLessEqual(os.path.getsize(segmento), TAMANO_CABECERA)
+        bitacora.cerrar()
+        self.assertEqual(Reproductor(self.ruta).verificar()["turnos"], 3)
+
+    def test_turno_agotado(self):
+        """
+        Prueba que un turno vencido se repita como error.
+        """
+        juego = Juego("sol")
+        with Bitacora(self.ruta) as bitacora:
+            id_sesion = bitacora.iniciar("sol")
+            estado, _ = juego.expirar_turno()
+            bitacora.registrar(id_sesion, "", estado)
+        resultado = Reproductor(self.ruta).verificar()
+        self.assertEqual((resultado["turnos"], resultado["discrepancias"]), (1, []))
+        self.assertEqual(Reproductor(self.ruta).reconstruir(id_sesion).errores, 1)
+
+    def test_retomar_partida(self):
+        """
+        Prueba que una partida retomada se registre con su estado y siga desde él.
+        """
+        juego = Juego("árbol")
+        juego.jugar_turno("a")
+        juego.jugar_turno("z")
+        with Bitacora(self.ruta) as bitacora:
+            id_sesion = bitacora.retomar(juego)
+            estado, _ = juego.jugar_turno("r")
+            bitacora.registrar(id_sesion, "r", estado)
+        reconstruido = Reproductor(self.ruta).reconstruir(id_sesion)
+        self.assertEqual(reconstruido.to_bytes(), juego.to_bytes())
+        self.assertEqual(reconstruido.errores, 1)
+
+if __name__ == '__main__':
+    unittest.main()
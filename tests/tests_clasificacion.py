@@ -0,0 +1,101 @@
+import os
+import random
+import tempfile
+import unittest
+from src.clasificacion import Clasificaciones, ListaSaltos, TablaPosiciones  # Asegúrate de que el nombre del archivo sea correcto
+
+class TestListaSaltos(unittest.TestCase):
+
+    def test_orden_y_posiciones(self):
+        """
+        Prueba que la lista se mantenga ordenada y que posición y acceso por índice coincidan con una lista ordenada.
+        """
+        aleatorio = random.Random(7)
+        lista = ListaSaltos(semilla=1)
+        referencia = []
+        for _ in range(2000):
+            clave = aleatorio.randrange(100000)
+            if clave in referencia:
+                lista.eliminar(clave)
+                referencia.remove(clave)
+            else:
+                lista.insertar(clave, str(clave))
+                referencia.append(clave)
+        referencia.sort()
+        self.assertEqual([clave for clave, _ in lista], referencia)
+        for indice in range(0, len(referencia), 37):
+            self.assertEqual(lista.posicion(referencia[indice]), indice)
+            self.assertEqual(lista.en_posicion(indice), (referencia[indice], str(referencia[indice])))
+        with self.assertRaises(KeyError):
+            lista.posicion(-1)
+
+class TestTablaPosiciones(unittest.TestCase):
+
+    def test_capacidad_y_mejor_por_jugador(self):
+        """
+        Prueba que la tabla conserve solo los mejores K jugadores, con la mejor puntuación de cada uno.
+        """
+        tabla = TablaPosiciones(capacidad=3)
+        for secuencia, (jugador, puntos) in enumerate([("ana", 200), ("beto", 250), ("caro", 180),
+                                                       ("dani", 190), ("ana", 150), ("caro", 300)]):
+            tabla.registrar(jugador, puntos, secuencia)
+        self.assertEqual(tabla.mejores(), [("caro", 300), ("beto", 250), ("ana", 200)])
+        self.assertEqual(tabla.posicion("ana"), 3)
+        self.assertIsNone(tabla.posicion("dani"))
+        self.assertEqual(tabla.minimo, 200)
+
+    def test_empate_gana_el_primero(self):
+        """
+        Prueba que a igual puntuación quede por delante quien llegó primero.
+        """
+        tabla = TablaPosiciones(capacidad=2)
+        tabla.registrar("ana", 200, 0)
+        tabla.registrar("beto", 200, 1)
+        self.assertFalse(tabla.registrar("caro", 200, 2))
+        self.assertEqual(tabla.mejores(), [("ana", 200), ("beto", 200)])
+
+class TestClasificaciones(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea las clasificaciones en un directorio temporal para cada prueba.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clasificacion.db")
+        self.clasificaciones = Clasificaciones(self.ruta, capacidad=10, intervalo_commit=10)
+
+    def tearDown(self):
+        self.clasificaciones.cerrar()
+        self.directorio.cleanup()
+
+    def test_global_y_por_tema_persistentes(self):
+        """
+        Prueba que las puntuaciones se reflejen en la tabla global y en la del tema, y sobrevivan al reabrir.
+        """
+        self.clasificaciones.registrar("ana", "Animales", 220)
+        self.clasificaciones.registrar("beto", "Frutas", 260)
+        self.clasificaciones.registrar("ana", "Animales", 210)
+        self.assertEqual(self.clasificaciones.mejores(), [("beto", 260), ("ana", 220)])
+        self.assertEqual(self.clasificaciones.mejores("Animales"), [("ana", 220)])
+        self.assertEqual(self.clasificaciones.confirmaciones, 0, "La escritura debería ser diferida")
+        self.clasificaciones.cerrar()
+
+        self.clasificaciones = Clasificaciones(self.ruta, capacidad=10)
+        self.assertEqual(self.clasificaciones.mejores(), [("beto", 260), ("ana", 220)])
+        self.assertEqual(self.clasificaciones.posicion("beto", "Frutas"), 1)
+
+    def test_ingerir(self):
+        """
+        Prueba la carga masiva: la tabla en memoria es acotada y la base guarda el mejor de cada jugador.
+        """
+        resultados = [(f"j{numero % 50}", "Animales", numero) for numero in range(1000)]
+        self.assertEqual(self.clasificaciones.ingerir(resultados, tamano_lote=64), 1000)
+        self.assertEqual(len(self.clasificaciones.tabla("Animales")), 10)
+        self.assertEqual(self.clasificaciones.mejores("Animales", 2), [("j49", 999), ("j48", 998)])
+        self.assertEqual(self.clasificaciones.posicion("j40"), 10)
+        filas = self.clasificaciones.conexion.execute(
+            "SELECT COUNT(*), MIN(puntos) FROM puntuaciones WHERE tema = 'Animales'").fetchone()
+        self.assertEqual(filas, (50, 950))
+
+if __name__ == "__main__":
+    unittest.main()
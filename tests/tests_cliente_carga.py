@@ -0,0 +1,52 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from src.cliente_carga import InicioComun, ejecutar_carga, percentil  # Asegúrate de que el nombre del archivo sea correcto
+from src.palabras import GestorPalabras
+from src.servidor import ServidorAhorcado
+from src.sesiones import AlmacenSesiones
+
+class TestClienteCarga(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """
+        Inicia un servidor con almacén de sesiones, que responde SESION antes de PARTIDA.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.almacen = AlmacenSesiones(os.path.join(self.directorio.name, "sesiones.db"))
+        self.servidor = ServidorAhorcado(GestorPalabras(opciones={"Bebidas": ["café", "té"]}),
+                                         almacen=self.almacen)
+        servidor = await self.servidor.iniciar(puerto=0)
+        self.puerto = servidor.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.servidor.servidor.close()
+        await self.servidor.servidor.wait_closed()
+        self.almacen.cerrar()
+        self.directorio.cleanup()
+
+    async def test_carga_con_sesiones(self):
+        """
+        Prueba que todas las sesiones jueguen aunque el servidor envíe primero la línea SESION.
+        """
+        latencias = await ejecutar_carga("127.0.0.1", self.puerto, None, 20)
+        self.assertGreaterEqual(len(latencias), 20 * 2)
+        self.assertEqual(latencias, sorted(latencias))
+        self.assertGreater(percentil(latencias, 99), 0)
+
+    async def test_inicio_comun_espera_a_todas(self):
+        """
+        Prueba que las sesiones se liberen solo cuando todas se conectaron o fallaron.
+        """
+        inicio = InicioComun(3)
+        esperando = asyncio.create_task(inicio.esperar())
+        inicio.conectada()
+        inicio.conectada()
+        await asyncio.sleep(0)
+        self.assertFalse(esperando.done())
+        inicio.conectada()
+        await asyncio.wait_for(esperando, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,25 @@ class TestDiagramaAhorcado(unittest.TestCase):
         )
         self._verificar_dibujo(6, salida_esperada)
 
+    def test_renderizar_y_escribir(self):
+        """
+        Prueba que renderizar devuelva el mismo texto que dibujar y que escribir lo envíe al flujo indicado.
+        """
+        flujo = StringIO()
+        self.diagrama.escribir(3, flujo)
+        self.assertEqual(flujo.getvalue(), self.diagrama.renderizar(3))
+        self.assertEqual(self.diagrama.renderizar(10), self.diagrama.renderizar(6))
+
+    def test_cuadros_compartidos_entre_instancias(self):
+        """
+        Prueba que las instancias con el mismo cuerpo compartan los cuadros precalculados.
+        """
+        otro = DiagramaAhorcado()
+        self.assertIs(otro.cuadros(), self.diagrama.cuadros())
+        personalizado = DiagramaAhorcado(["O", "I"])
+        self.assertEqual(len(personalizado.cuadros()), 3)
+        self.assertIn("||    /|\\", DiagramaAhorcado(["O", "|", "/", "\\", "x", "x"]).renderizar(4))
+
     def _verificar_dibujo(self, errores, salida_esperada):
         """
         Verifica que la salida del dibujo del ahorcado coincida con la esperada.
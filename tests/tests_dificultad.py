@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from src.dificultad import BANDAS, IndiceDificultad, calcular_dificultad  # Asegúrate de que el nombre del archivo sea correcto
+from src.palabras import GestorPalabras
+
+class TestCalcularDificultad(unittest.TestCase):
+
+    def test_metricas(self):
+        """
+        Prueba longitud, letras únicas normalizadas y errores esperados de un jugador por frecuencia.
+        """
+        columnas = calcular_dificultad(["Ala", "alá", "ola", "kiwi"])
+        self.assertEqual(columnas["longitud"].tolist(), [3, 3, 3, 4])
+        self.assertEqual(columnas["unicas"].tolist(), [2, 2, 3, 3])
+        # a y l están en 3 palabras; i, k, o y w en 1 y empatan en orden alfabético: a, l, i, k, o, w
+        self.assertEqual(columnas["errores_esperados"].tolist(), [0, 0, 2, 3])
+        self.assertLess(columnas["rareza"][0], columnas["rareza"][3])
+        self.assertLess(columnas["puntaje"][0], columnas["puntaje"][3])
+
+    def test_sin_palabras(self):
+        """
+        Prueba que una lista vacía o con palabras vacías no falle.
+        """
+        self.assertEqual(len(calcular_dificultad([])["puntaje"]), 0)
+        self.assertEqual(calcular_dificultad([""])["unicas"].tolist(), [0])
+
+class TestIndiceDificultad(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un gestor con dos temas de seis palabras cada uno.
+        """
+        self.opciones = {
+            "Animales": ["oso", "ala", "kiwi", "yak", "ñu", "búho"],
+            "Frutas": ["pera", "piña", "kiwi", "uva", "coco", "fresa"]
+        }
+        self.gestor = GestorPalabras(opciones=self.opciones, semilla=3)
+
+    def test_bandas_por_tema(self):
+        """
+        Prueba que cada tema se reparta en tercios y que las bandas estén ordenadas por puntaje.
+        """
+        indice = self.gestor.obtener_indice_dificultad()
+        for tema, palabras in self.opciones.items():
+            bandas = [list(indice.palabras_banda(tema, banda, palabras)) for banda in BANDAS]
+            self.assertEqual([len(banda) for banda in bandas], [2, 2, 2])
+            self.assertEqual(sorted(sum(bandas, [])), sorted(palabras))
+        puntaje = indice.columnas["puntaje"]
+        facil = indice.palabras_banda("Animales", "facil", range(6))
+        dificil = indice.palabras_banda("Animales", "dificil", range(6))
+        self.assertLessEqual(max(puntaje[i] for i in facil), min(puntaje[i] for i in dificil))
+
+    def test_seleccionar_por_dificultad(self):
+        """
+        Prueba que seleccionar_palabra elija solo palabras de la banda pedida.
+        """
+        indice = self.gestor.obtener_indice_dificultad()
+        esperadas = set(indice.palabras_banda("Frutas", "dificil", self.opciones["Frutas"]))
+        elegidas = {self.gestor.seleccionar_palabra("Frutas", dificultad="dificil") for _ in range(10)}
+        self.assertEqual(elegidas, esperadas)
+        with self.assertRaises(ValueError):
+            self.gestor.seleccionar_palabra("Frutas", dificultad="imposible")
+
+    def test_temas_con_bandas_vacias(self):
+        """
+        Prueba que en un tema con menos palabras que bandas se use la banda más cercana con palabras.
+        """
+        gestor = GestorPalabras(opciones={"A": ["uno", "dos"], "B": ["tres"]})
+        indice = gestor.obtener_indice_dificultad()
+        self.assertEqual(indice.banda_disponible("A", "dificil"), 1)
+        self.assertEqual(indice.banda_disponible("B", "media"), 0)
+        self.assertEqual(len(indice.palabras_banda("A", "dificil", ["uno", "dos"])), 1)
+        self.assertIn(gestor.seleccionar_palabra("A", dificultad="dificil"), ["uno", "dos"])
+        self.assertEqual(gestor.seleccionar_palabra("B", dificultad="dificil"), "tres")
+
+    def test_archivo_columnar(self):
+        """
+        Prueba que el índice se guarde junto al CSV y se reutilice mientras el CSV no cambie.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "temas.csv")
+            with open(ruta, mode='w', encoding='utf-8', newline='') as archivo:
+                archivo.write("Animales,oso,ala,kiwi,yak\r\n")
+            indice = GestorPalabras(ruta).obtener_indice_dificultad()
+            self.assertTrue(os.path.exists(ruta + ".dif.npz"))
+            estado = os.stat(ruta)
+            cargado = IndiceDificultad.cargar(ruta + ".dif.npz", (estado.st_mtime_ns, estado.st_size), ["Animales"])
+            self.assertEqual(cargado.orden.tolist(), indice.orden.tolist())
+            self.assertIsNone(IndiceDificultad.cargar(ruta + ".dif.npz", (0, 0), ["Animales"]))
+
+if __name__ == "__main__":
+    unittest.main()
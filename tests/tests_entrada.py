@@ -0,0 +1,123 @@
+import contextlib
+import io
+import os
+import time
+import unittest
+from src.entrada import LectorEntrada, RelojPartida  # Asegúrate de que el nombre del archivo sea correcto
+from diagrama import DiagramaAhorcado
+from interfaz import ControladorAhorcado, InteraccionConsola
+from juego import Juego
+from renderizado import RenderizadorTerminal
+
+class RelojFalso:
+    """Reloj monótono controlado por la prueba."""
+
+    def __init__(self):
+        self.ahora = 100.0
+
+    def __call__(self):
+        return self.ahora
+
+class TestRelojPartida(unittest.TestCase):
+
+    def test_plazos(self):
+        """
+        Prueba que el límite sea el primer plazo y que el tiempo sobrante sea el de la partida.
+        """
+        reloj_falso = RelojFalso()
+        reloj = RelojPartida(segundos_turno=10, segundos_partida=25, reloj=reloj_falso)
+        reloj.iniciar()
+        reloj.iniciar_turno()
+        self.assertEqual(reloj.limite(), 110.0)
+        self.assertEqual(reloj.texto(), "Turno: 10 s  Partida: 25 s")
+        reloj_falso.ahora = 118.5
+        reloj.iniciar_turno()
+        self.assertEqual(reloj.limite(), 125.0)
+        self.assertEqual(reloj.segundos_restantes(), 6.5)
+        self.assertFalse(reloj.partida_agotada())
+        reloj_falso.ahora = 125.0
+        self.assertTrue(reloj.partida_agotada())
+        self.assertEqual(reloj.texto(), "Turno: 4 s  Partida: 0 s")
+
+    def test_sin_limites(self):
+        """
+        Prueba que sin plazos no haya límite ni tiempo sobrante.
+        """
+        reloj = RelojPartida()
+        reloj.iniciar()
+        reloj.iniciar_turno()
+        self.assertIsNone(reloj.limite())
+        self.assertEqual(reloj.segundos_restantes(), 0.0)
+
+class TestLectorEntrada(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea una tubería que hace de entrada estándar.
+        """
+        lectura, self.escritura = os.pipe()
+        self.flujo = os.fdopen(lectura, encoding="utf-8")
+
+    def tearDown(self):
+        self.flujo.close()
+        try:
+            os.close(self.escritura)
+        except OSError:
+            pass
+
+    def comprobar_lector(self, lector):
+        os.write(self.escritura, "ñandú\nsegunda\nincompleta".encode("utf-8"))
+        self.assertEqual(lector.leer_linea(time.monotonic() + 1), "ñandú")
+        self.assertEqual(lector.leer_linea(time.monotonic() + 1), "segunda")
+        inicio = time.monotonic()
+        self.assertIsNone(lector.leer_linea(inicio + 0.05))
+        self.assertLess(time.monotonic() - inicio, 0.5)
+        os.close(self.escritura)
+        self.assertEqual(lector.leer_linea(time.monotonic() + 1), "incompleta")
+        with self.assertRaises(EOFError):
+            lector.leer_linea(time.monotonic() + 1)
+        lector.cerrar()
+
+    def test_lectura_con_selector(self):
+        """
+        Prueba las líneas, el plazo vencido y el fin de la entrada con el selector.
+        """
+        self.comprobar_lector(LectorEntrada(self.flujo, usar_hilo=False))
+
+    def test_lectura_con_hilo(self):
+        """
+        Prueba el mismo comportamiento con la lectura en un hilo.
+        """
+        self.comprobar_lector(LectorEntrada(self.flujo, usar_hilo=True))
+
+    def test_cuenta_regresiva(self):
+        """
+        Prueba que la cuenta regresiva se actualice una vez por segundo completo y no en cada espera.
+        """
+        lector = LectorEntrada(self.flujo, usar_hilo=False)
+        tics = []
+        self.assertIsNone(lector.leer_linea(time.monotonic() + 1.2, tics.append))
+        self.assertEqual(len(tics), 2)
+        self.assertGreater(tics[0], 1.0)
+        lector.cerrar()
+
+    def test_menu_y_partida_comparten_el_lector(self):
+        """
+        Prueba que el menú y la partida cronometrada lean del mismo lector y que el fin de la entrada termine la partida.
+        """
+        lector = LectorEntrada(self.flujo, usar_hilo=False)
+        interacciones = InteraccionConsola(teclas=False, lector=lector)
+        os.write(self.escritura, "1\nx\ny\n".encode("utf-8"))
+        os.close(self.escritura)
+        with contextlib.redirect_stdout(io.StringIO()):
+            tema = interacciones.seleccionar_tema(["Animales"])
+            controlador = ControladorAhorcado(Juego("gato"), DiagramaAhorcado([]), interacciones,
+                                              RenderizadorTerminal(), reloj=RelojPartida(segundos_turno=5))
+            self.assertIs(controlador.lector, lector)
+            self.assertIsNone(controlador.jugar())
+        self.assertEqual(tema, "Animales")
+        self.assertEqual(controlador.juego.errores, 2)
+        lector.cerrar()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from src.indice_temas import IndiceTemas, MenuTemas  # Asegúrate de que el nombre del archivo sea correcto
+
+class TestIndiceTemas(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un índice con temas de varias palabras y acentos.
+        """
+        self.temas = ["Animales", "Países de Europa", "Música", "Animales del mar", "Capitales de países"]
+        self.indice = IndiceTemas(self.temas)
+
+    def test_buscar(self):
+        """
+        Prueba buscar por prefijo normalizado, al inicio de cualquier palabra del tema.
+        """
+        self.assertEqual(self.indice.buscar("ANIM"), [0, 3])
+        self.assertEqual(self.indice.buscar("pais"), [1, 4])
+        self.assertEqual(self.indice.buscar("musí"), [2])
+        self.assertEqual(self.indice.buscar("del m"), [3])
+        self.assertEqual(self.indice.buscar("imales"), [])
+        self.assertEqual(self.indice.buscar(""), [0, 1, 2, 3, 4])
+
+    def test_menu_filtra_por_tecla(self):
+        """
+        Prueba que el menú filtre al escribir, vuelva atrás al borrar y elija cuando queda un tema.
+        """
+        menu = MenuTemas(self.indice, tamano_pagina=2)
+        self.assertEqual(menu.paginas, 3)
+        menu.escribir("a")
+        self.assertEqual(menu.visibles(), [(1, "Animales"), (4, "Animales del mar")])
+        self.assertIsNone(menu.elegido())
+        menu.escribir("nimales d")
+        self.assertEqual(menu.elegido(), "Animales del mar")
+        menu.borrar(2)
+        self.assertEqual(len(menu.coincidencias), 2)
+        menu.reemplazar("mu")
+        self.assertEqual(menu.elegido(), "Música")
+        menu.reemplazar("xyz")
+        self.assertEqual((menu.coincidencias, menu.visibles(), menu.paginas), ([], [], 1))
+
+    def test_menu_numeros_y_paginas(self):
+        """
+        Prueba que un número elija el tema del menú completo y salte a su página.
+        """
+        menu = MenuTemas(self.indice, tamano_pagina=2)
+        menu.cambiar_pagina(5)
+        self.assertEqual(menu.visibles(), [(5, "Capitales de países")])
+        menu.cambiar_pagina(-1)
+        self.assertEqual(menu.pagina, 1)
+        menu.reemplazar("3")
+        self.assertEqual((menu.pagina, menu.elegido()), (1, "Música"))
+        menu.reemplazar("9")
+        self.assertIsNone(menu.elegido())
+        self.assertEqual(menu.resumen(), "Página 1/3  (5 de 5 temas)")
+
+if __name__ == '__main__':
+    unittest.main()
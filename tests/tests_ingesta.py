@@ -0,0 +1,82 @@
+import csv
+import os
+import tempfile
+import unittest
+from src.ingesta import IngestaCorpus, validar_palabra  # Asegúrate de que el nombre del archivo sea correcto
+
+class TestIngestaCorpus(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un directorio temporal con un corpus base y dos listas externas.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.base = self.ruta("base.csv")
+        with open(self.base, mode='w', encoding='utf-8', newline='') as archivo:
+            archivo.write("Animales,perro,gato,león\r\nColores,rojo,azul\r\n")
+        self.externa = self.ruta("externa.csv")
+        with open(self.externa, mode='w', encoding='utf-8', newline='') as archivo:
+            archivo.write('Animales,Perro,leon,  oso   pardo ,gato123,,"tigre"\r\nFrutas,piña,uva,kiwi,Uva\r\n')
+        self.lista = self.ruta("colores.txt")
+        with open(self.lista, mode='w', encoding='utf-8') as archivo:
+            archivo.write("verde\nRojo\nmagenta\n" + "x" * 50 + "\n")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio.name, nombre)
+
+    def leer(self, ruta):
+        with open(ruta, encoding='utf-8', newline='') as archivo:
+            return [fila for fila in csv.reader(archivo)]
+
+    def test_fusionar_deduplicar_y_validar(self):
+        """
+        Prueba que la ingesta conserve la base, elimine duplicados normalizados por tema y rechace palabras inválidas.
+        """
+        salida = self.ruta("salida.csv")
+        ingesta = IngestaCorpus(procesos=2, particiones=4, tamano_bloque=3)
+        resultado = ingesta.ejecutar([self.base, self.externa, (self.lista, "Colores")], salida)
+        self.assertEqual(self.leer(salida), [
+            ["Animales", "perro", "gato", "león", "oso pardo", "tigre"],
+            ["Colores", "rojo", "azul", "verde", "magenta"],
+            ["Frutas", "piña", "uva", "kiwi"],
+        ])
+        self.assertEqual(resultado["leidas"], 19)
+        self.assertEqual(resultado["aceptadas"], 12)
+        self.assertEqual(resultado["duplicadas"], 4)
+        self.assertEqual(resultado["rechazadas"], {"vacia": 1, "longitud": 1, "caracteres": 1})
+        self.assertEqual(resultado["temas"], 3)
+
+    def test_reemplazar_base(self):
+        """
+        Prueba que la salida pueda ser el mismo archivo de la base.
+        """
+        IngestaCorpus(procesos=1, particiones=2).ejecutar([self.base, self.externa], self.base)
+        self.assertEqual(self.leer(self.base)[1], ["Colores", "rojo", "azul"])
+        self.assertFalse(os.path.exists(self.base + ".tmp"))
+
+    def test_base_se_conserva_sin_validar(self):
+        """
+        Prueba que las palabras del corpus base pasen sin validar, aunque las entradas sí se validen.
+        """
+        with open(self.base, mode='a', encoding='utf-8', newline='') as archivo:
+            archivo.write("Películas,R2-D2," + "x" * 50 + "\r\n")
+        IngestaCorpus(procesos=1, particiones=2).ejecutar([self.externa], self.base, base=[self.base])
+        filas = self.leer(self.base)
+        self.assertEqual(filas[0][:4], ["Animales", "perro", "gato", "león"])
+        self.assertEqual(filas[2], ["Películas", "R2-D2", "x" * 50])
+        self.assertNotIn("gato123", filas[0])
+
+    def test_validar_palabra(self):
+        """
+        Prueba los motivos de rechazo de una palabra.
+        """
+        self.assertEqual(validar_palabra("Canción", 40), ("cancion", None))
+        self.assertEqual(validar_palabra("", 40), (None, "vacia"))
+        self.assertEqual(validar_palabra("abc", 2), (None, "longitud"))
+        self.assertEqual(validar_palabra("c3po", 40), (None, "caracteres"))
+
+if __name__ == "__main__":
+    unittest.main()
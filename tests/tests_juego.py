@@ -70,6 +70,46 @@ class TestJuego(unittest.TestCase):
         estado, _ = self.juego.jugar_turno("cafe")
         self.assertEqual(estado, EstadoJuego.PALABRA_FUERA_DE_TIEMPO, "Debería marcar como fuera de tiempo")
 
+    def test_generar_avance_incremental(self):
+        """
+        Prueba que una letra adivinada revele todas sus posiciones y descuente una sola letra restante.
+        """
+        juego = Juego("Mañana")
+        estado, _ = juego.jugar_turno("a")
+        self.assertEqual(estado, EstadoJuego.SEGUIR_JUGANDO)
+        self.assertEqual(juego.avance, "_ a _ a _ a")
+        self.assertEqual(juego.letras_restantes, 3)
+        juego.jugar_turno("m")
+        estado, _ = juego.jugar_turno("ñ")
+        self.assertEqual(estado, EstadoJuego.SEGUIR_JUGANDO)
+        estado, puntos = juego.jugar_turno("n")
+        self.assertEqual(estado, EstadoJuego.LETRAS_COMPLETAS)
+        self.assertEqual(juego.avance, "M a ñ a n a")
+        self.assertEqual(puntos, 200)
+
+    def test_to_bytes_from_bytes(self):
+        """
+        Prueba que un juego serializado se reconstruya con el mismo estado sin repetir los turnos.
+        """
+        for entrada in ["z", "c", "cama", "á"]:
+            self.juego.jugar_turno(entrada)
+        datos = self.juego.to_bytes()
+        self.assertLess(len(datos), 48, "El estado serializado debería ocupar pocas decenas de bytes")
+        restaurado = Juego.from_bytes(datos)
+        self.assertEqual(restaurado.avance, "c a _ _")
+        self.assertEqual(restaurado.errores, 1)
+        self.assertEqual(restaurado.letras_usadas, {"z", "c", "cama", "a"})
+        self.assertEqual(restaurado.letras_incorrectas, {"z"})
+        self.assertEqual(restaurado.letras_restantes, self.juego.letras_restantes)
+        estado, _ = restaurado.jugar_turno("c")
+        self.assertEqual(estado, EstadoJuego.LETRA_REPETIDA)
+
+    def test_estado_compacto_sin_diccionario(self):
+        """
+        Prueba que el juego no tenga diccionario de instancia.
+        """
+        self.assertFalse(hasattr(self.juego, "__dict__"))
+
     def test_calcular_puntos(self):
         """
         Prueba que calcular_puntos retorne una puntuación válida.
@@ -79,5 +119,32 @@ class TestJuego(unittest.TestCase):
         puntos = self.juego.calcular_puntos()
         self.assertGreater(puntos, 0, "La puntuación debería ser positiva")
 
+    def test_calcular_puntos_con_tiempo_restante(self):
+        """
+        Prueba que cada segundo completo que sobra sume puntos.
+        """
+        base = self.juego.calcular_puntos()
+        self.assertEqual(self.juego.calcular_puntos(10.7), base + 10 * 2)
+        self.assertEqual(self.juego.calcular_puntos(-3), base)
+
+    def test_expirar_turno(self):
+        """
+        Prueba que un turno vencido cuente como error sin usar ninguna letra.
+        """
+        estado, puntos = self.juego.expirar_turno()
+        self.assertEqual(estado, EstadoJuego.TIEMPO_AGOTADO)
+        self.assertEqual((puntos, self.juego.errores), (0, 1))
+        self.assertEqual(self.juego.letras_usadas, set())
+
+    def test_conjuntos_de_letras_de_solo_lectura(self):
+        """
+        Prueba que los conjuntos de letras no se puedan modificar en el lugar, solo reemplazar.
+        """
+        self.juego.jugar_turno("c")
+        with self.assertRaises(AttributeError):
+            self.juego.letras_usadas.add("z")
+        self.juego.letras_usadas = self.juego.letras_usadas | {"z"}
+        self.assertEqual(self.juego.letras_usadas, {"c", "z"})
+
 if __name__ == "__main__":
     unittest.main()
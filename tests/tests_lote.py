@@ -0,0 +1,69 @@
+import random
+import unittest
+from src.lote import LoteJuegos, ESTADOS, SIN_TURNO  # Asegúrate de que el nombre del archivo sea correcto
+from juego import Juego, EstadoJuego
+
+class TestLoteJuegos(unittest.TestCase):
+
+    def test_turnos_basicos(self):
+        """
+        Prueba letras correctas, incorrectas, repetidas, palabras fuera de tiempo y partidas sin turno.
+        """
+        lote = LoteJuegos(["casa", "perro", "casa"])
+        estados, puntos = lote.jugar_turno(["a", "z", None])
+        self.assertEqual(lote.estados(estados), [EstadoJuego.SEGUIR_JUGANDO, EstadoJuego.LETRA_INCORRECTA, None])
+        self.assertEqual(puntos.tolist(), [0, 0, 0])
+        self.assertEqual(lote.estados(lote.jugar_turno(["á", "Z", "a"])[0]),
+                         [EstadoJuego.LETRA_REPETIDA, EstadoJuego.LETRA_REPETIDA, EstadoJuego.SEGUIR_JUGANDO])
+        lote.jugar_turno(["c", "p", "c"])
+        estados, puntos = lote.jugar_turno(["casa", "perro", "s"])
+        self.assertEqual(lote.estados(estados), [EstadoJuego.PALABRA_FUERA_DE_TIEMPO, EstadoJuego.PALABRA_CORRECTA,
+                                                 EstadoJuego.LETRAS_COMPLETAS])
+        self.assertEqual(puntos.tolist(), [0, 200 + 3 * 20 - 5, 200 + 0 * 20])
+        self.assertEqual(lote.avance(0), "c a _ a")
+        self.assertEqual(lote.errores.tolist(), [0, 1, 0])
+
+    def test_palabra_demasiado_larga(self):
+        """
+        Prueba que se rechacen palabras de más de 64 letras y entradas de otro tamaño.
+        """
+        with self.assertRaises(ValueError):
+            LoteJuegos(["a" * 65])
+        with self.assertRaises(ValueError):
+            LoteJuegos(["casa"]).jugar_turno(["a", "b"])
+
+    def test_igual_a_juego(self):
+        """
+        Prueba que cada paso dé los mismos estados, puntos y avance que un Juego por partida.
+        """
+        aleatorio = random.Random(11)
+        palabras = ["canción", "pingüino", "ÁRBOL", "niño", "søn", "ΟΣ", "straße", "a", "", "x1y", "aa"]
+        palabras += ["".join(aleatorio.choices("aeiouáéñnrstlcü", k=aleatorio.randint(1, 10))) for _ in range(100)]
+        entradas = list("aeiouáÉñNrstlcüxzø1ςß") + ["", "ab"]
+        for _ in range(10):
+            elegidas = [aleatorio.choice(palabras) for _ in range(200)]
+            lote = LoteJuegos(elegidas)
+            juegos = [Juego(palabra) for palabra in elegidas]
+            for _ in range(25):
+                paso = []
+                for palabra in elegidas:
+                    azar = aleatorio.random()
+                    if azar < 0.05:
+                        paso.append(None)
+                    elif azar < 0.1:
+                        paso.append(palabra.upper())
+                    elif azar < 0.15:
+                        paso.append(aleatorio.choice(palabras))
+                    else:
+                        paso.append(aleatorio.choice(entradas))
+                estados, puntos = lote.jugar_turno(paso)
+                for numero, (juego, entrada) in enumerate(zip(juegos, paso)):
+                    if entrada is None:
+                        self.assertEqual(estados[numero], SIN_TURNO)
+                        continue
+                    self.assertEqual((ESTADOS[estados[numero]], int(puntos[numero])), juego.jugar_turno(entrada))
+                    self.assertEqual(lote.avance(numero), juego.avance)
+                    self.assertEqual(lote.errores[numero], juego.errores)
+
+if __name__ == '__main__':
+    unittest.main()
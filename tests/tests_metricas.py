@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+import unittest
+from src import metricas  # Asegúrate de que el nombre del archivo sea correcto
+from src.metricas import Histograma, Instrumentacion
+from juego import EstadoJuego
+
+class TestInstrumentacion(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Activa una instrumentación nueva para cada prueba.
+        """
+        self.instrumentacion = Instrumentacion().activar()
+
+    def tearDown(self):
+        Instrumentacion.desactivar()
+
+    def test_contar_turnos_y_eventos(self):
+        """
+        Prueba que cada turno se cuente por estado y emita sus eventos con la duración.
+        """
+        eventos = []
+        self.instrumentacion.suscribir("turno_inicio", lambda juego, entrada: eventos.append(("inicio", entrada)))
+        self.instrumentacion.suscribir("turno_fin", lambda juego, entrada, estado, puntos, duracion:
+                                       eventos.append(("fin", estado.name, duracion >= 0)))
+        juego = metricas.Juego("sol")
+        juego.jugar_turno("s")
+        juego.jugar_turno("z")
+        juego.jugar_turno("s")
+        self.assertEqual(self.instrumentacion.turnos,
+                         {"SEGUIR_JUGANDO": 1, "LETRA_INCORRECTA": 1, "LETRA_REPETIDA": 1})
+        self.assertEqual(self.instrumentacion.duracion_turnos.cuenta, 3)
+        self.assertEqual(eventos[:2], [("inicio", "s"), ("fin", "SEGUIR_JUGANDO", True)])
+
+    def test_turno_vencido(self):
+        """
+        Prueba que un turno vencido pase por la misma medición que los demás, con entrada None.
+        """
+        eventos = []
+        self.instrumentacion.suscribir("turno_fin", lambda juego, entrada, estado, puntos, duracion:
+                                       eventos.append((entrada, estado.name)))
+        juego = metricas.Juego("sol")
+        self.assertEqual(juego.expirar_turno(), (EstadoJuego.TIEMPO_AGOTADO, 0))
+        self.assertEqual(juego.errores, 1)
+        self.assertEqual(self.instrumentacion.turnos, {"TIEMPO_AGOTADO": 1})
+        self.assertEqual(self.instrumentacion.duracion_turnos.cuenta, 1)
+        self.assertEqual(eventos, [(None, "TIEMPO_AGOTADO")])
+
+    def test_desactivar(self):
+        """
+        Prueba que, desactivada, la instrumentación deje de recibir turnos y selecciones.
+        """
+        Instrumentacion.desactivar()
+        metricas.Juego("sol").jugar_turno("s")
+        metricas.GestorPalabras(opciones={"Animales": ["gato"]}).seleccionar_palabra("Animales")
+        self.assertEqual(self.instrumentacion.turnos, {})
+        self.assertEqual(self.instrumentacion.palabras_seleccionadas, {})
+
+    def test_palabra_seleccionada_y_juego_terminado(self):
+        """
+        Prueba los contadores de selección de palabras y de partidas terminadas.
+        """
+        gestor = metricas.GestorPalabras(opciones={"Animales": ["gato", "perro"]})
+        gestor.seleccionar_palabra("Animales")
+        gestor.seleccionar_palabra("Animales")
+        self.instrumentacion.juego_terminado(None, True, 240)
+        self.instrumentacion.juego_terminado(None, False, 0)
+        self.assertEqual(self.instrumentacion.palabras_seleccionadas, {"Animales": 2})
+        self.assertEqual(self.instrumentacion.partidas_terminadas, {"ganada": 1, "perdida": 1})
+        self.assertEqual(self.instrumentacion.puntos.suma, 240)
+
+    def test_exportar_prometheus(self):
+        """
+        Prueba el formato de texto de Prometheus, con cubetas acumuladas.
+        """
+        self.instrumentacion.palabra_seleccionada('Tema "raro"', "x")
+        self.instrumentacion.juego_terminado(None, True, 120)
+        texto = self.instrumentacion.exportar_prometheus()
+        self.assertIn('ahorcado_palabras_seleccionadas_total{tema="Tema \\"raro\\""} 1', texto)
+        self.assertIn('ahorcado_partidas_terminadas_total{resultado="ganada"} 1', texto)
+        self.assertIn('ahorcado_puntos_bucket{le="100"} 0', texto)
+        self.assertIn('ahorcado_puntos_bucket{le="150"} 1', texto)
+        self.assertIn('ahorcado_puntos_bucket{le="+Inf"} 1', texto)
+        self.assertIn("ahorcado_puntos_sum 120", texto)
+        self.assertTrue(texto.endswith("\n"))
+
+    def test_exportar_jsonl(self):
+        """
+        Prueba que cada exportación agregue una línea JSON al archivo.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "metricas.jsonl")
+            self.instrumentacion.exportar_jsonl(ruta)
+            metricas.Juego("sol").jugar_turno("sol")
+            self.instrumentacion.exportar_jsonl(ruta)
+            with open(ruta, encoding='utf-8') as archivo:
+                lineas = [json.loads(linea) for linea in archivo]
+        self.assertEqual(len(lineas), 2)
+        self.assertEqual(lineas[0]["turnos"], {})
+        self.assertEqual(lineas[1]["turnos"], {"PALABRA_CORRECTA": 1})
+
+class TestHistograma(unittest.TestCase):
+
+    def test_cubetas(self):
+        """
+        Prueba que cada valor caiga en la primera cubeta cuyo límite no supera.
+        """
+        histograma = Histograma((10, 100))
+        for valor in (5, 10, 11, 1000):
+            histograma.registrar(valor)
+        self.assertEqual(histograma.cubetas, [2, 1, 1])
+        self.assertEqual(histograma.cuenta, 4)
+        self.assertEqual(histograma.suma, 1026)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from src.normalizador import Normalizador, normalizar_unicode  # Asegúrate de que el nombre del archivo sea correcto
+
+class TestNormalizador(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura una instancia de Normalizador para cada prueba.
+        """
+        self.normalizador = Normalizador(tamano_cache=8)
+
+    def test_normalizar_conserva_enie(self):
+        """
+        Prueba que normalizar elimine acentos y conserve la letra ñ.
+        """
+        self.assertEqual(self.normalizador.normalizar("Café"), "cafe")
+        self.assertEqual(self.normalizador.normalizar("MAÑANA"), "mañana")
+
+    def test_tabla_equivale_a_referencia(self):
+        """
+        Prueba que la tabla precalculada coincida con la normalización de referencia en el rango latino.
+        """
+        for codigo in range(0x0250):
+            caracter = chr(codigo)
+            self.assertEqual(self.normalizador.normalizar(caracter), normalizar_unicode(caracter))
+
+    def test_normalizar_fuera_del_rango_latino(self):
+        """
+        Prueba que los textos fuera del rango latino usen la normalización de referencia.
+        """
+        for texto in ["café", "ñ", "Ωmega", "日本"]:
+            self.assertEqual(self.normalizador.normalizar(texto), normalizar_unicode(texto))
+
+    def test_normalizar_lote(self):
+        """
+        Prueba que normalizar_lote conserve el orden de los textos.
+        """
+        resultado = list(self.normalizador.normalizar_lote(["Árbol", "niño", "Pingüino"]))
+        self.assertEqual(resultado, ["arbol", "niño", "pinguino"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from src.palabras import GestorPalabras  # Asegúrate de que el nombre del archivo sea correcto
 from random import choice
@@ -50,5 +52,182 @@ class TestGestorPalabras(unittest.TestCase):
         palabra = gestor_por_defecto.seleccionar_palabra(temas[0])
         self.assertIsInstance(palabra, str, "La palabra seleccionada no es de tipo str")
 
+
+class TestCargaDiferida(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un archivo CSV temporal para las pruebas de carga diferida.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.archivo_csv = os.path.join(self.directorio.name, "temas.csv")
+        with open(self.archivo_csv, mode='w', encoding='utf-8', newline='') as archivo:
+            archivo.write('Música,rock,salsa\r\n"Ciudades, capitales",París,"Ciudad de México"\r\nColores,rojo\r\n')
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_carga_solo_el_tema_solicitado(self):
+        """
+        Prueba que solo se materialicen las palabras del tema seleccionado.
+        """
+        gestor = GestorPalabras(self.archivo_csv, carga_diferida=True)
+        self.assertEqual(gestor.obtener_temas(), ["Música", "Ciudades, capitales", "Colores"])
+        self.assertEqual(gestor.opciones.cargados, {})
+        palabra = gestor.seleccionar_palabra("Ciudades, capitales")
+        self.assertIn(palabra, ["París", "Ciudad de México"])
+        self.assertEqual(list(gestor.opciones.cargados), ["Ciudades, capitales"])
+
+    def test_indice_se_invalida_al_cambiar_el_archivo(self):
+        """
+        Prueba que el índice auxiliar se reconstruya cuando cambia el archivo CSV.
+        """
+        GestorPalabras(self.archivo_csv, carga_diferida=True)
+        self.assertTrue(os.path.exists(self.archivo_csv + ".idx"))
+        with open(self.archivo_csv, mode='a', encoding='utf-8', newline='') as archivo:
+            archivo.write("Frutas,pera,uva\r\n")
+        gestor = GestorPalabras(self.archivo_csv, carga_diferida=True)
+        self.assertEqual(gestor.opciones["Frutas"], ["pera", "uva"])
+        self.assertEqual(gestor.opciones["Colores"], ["rojo"])
+
+    def test_guardar_conserva_temas_no_leidos(self):
+        """
+        Prueba que guardar en carga diferida conserve los temas que aún no se leyeron.
+        """
+        gestor = GestorPalabras(self.archivo_csv, carga_diferida=True)
+        gestor.agregar_palabra("Música", "jazz")
+        self.assertEqual(gestor.opciones["Ciudades, capitales"], ["París", "Ciudad de México"])
+        gestor = GestorPalabras(self.archivo_csv, carga_diferida=True)
+        self.assertEqual(gestor.opciones["Música"], ["rock", "salsa", "jazz"])
+        self.assertEqual(gestor.opciones["Colores"], ["rojo"])
+
+    def test_rechaza_saltos_de_linea_entre_comillas(self):
+        """
+        Prueba que la carga diferida rechace filas que ocupan más de una línea.
+        """
+        with open(self.archivo_csv, mode='a', encoding='utf-8', newline='') as archivo:
+            archivo.write('Frases,"hola\r\nmundo"\r\n')
+        with self.assertRaises(ValueError):
+            GestorPalabras(self.archivo_csv, carga_diferida=True)
+
+
+class TestDiario(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un archivo CSV temporal para las pruebas del diario.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.archivo_csv = os.path.join(self.directorio.name, "temas.csv")
+        with open(self.archivo_csv, mode='w', encoding='utf-8', newline='') as archivo:
+            archivo.write("Música,rock,salsa\r\nColores,rojo\r\n")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _leer_csv(self):
+        with open(self.archivo_csv, encoding='utf-8') as archivo:
+            return archivo.read()
+
+    def test_agregar_palabras_no_reescribe_el_csv(self):
+        """
+        Prueba que agregar palabras solo escriba en el diario y que este se aplique al cargar.
+        """
+        gestor = GestorPalabras(self.archivo_csv)
+        opciones, musica = gestor.opciones, gestor.opciones["Música"]
+        gestor.agregar_palabras("Música", ["jazz", "pop"])
+        gestor.agregar_palabra("Frutas", "pera")
+        self.assertIs(gestor.opciones, opciones, "Sin instantánea, las opciones se extienden sin copiarlas")
+        self.assertIs(gestor.opciones["Música"], musica)
+        self.assertEqual(self._leer_csv(), "Música,rock,salsa\nColores,rojo\n")
+        recargado = GestorPalabras(self.archivo_csv)
+        self.assertEqual(recargado.opciones["Música"], ["rock", "salsa", "jazz", "pop"])
+        self.assertEqual(recargado.opciones["Frutas"], ["pera"])
+
+    def test_diario_ignora_escritura_interrumpida(self):
+        """
+        Prueba que una última línea incompleta del diario se descarte.
+        """
+        gestor = GestorPalabras(self.archivo_csv)
+        gestor.agregar_palabra("Colores", "azul")
+        with open(gestor.archivo_diario, mode='a', encoding='utf-8') as archivo:
+            archivo.write("Colores,ver")
+        recargado = GestorPalabras(self.archivo_csv)
+        self.assertEqual(recargado.opciones["Colores"], ["rojo", "azul"])
+        # La siguiente escritura no debe continuar la línea interrumpida
+        recargado.agregar_palabra("Frutas", "pera")
+        recargado = GestorPalabras(self.archivo_csv)
+        self.assertEqual(recargado.opciones["Colores"], ["rojo", "azul"])
+        self.assertEqual(recargado.opciones["Frutas"], ["pera"])
+
+    def test_compactacion_interrumpida(self):
+        """
+        Prueba que, si la compactación se interrumpe, el diario no se aplique dos veces ni se pierda.
+        """
+        gestor = GestorPalabras(self.archivo_csv)
+        gestor.agregar_palabra("Colores", "azul")
+        # Interrupción antes del renombrado: la marca no corresponde al CSV
+        with open(gestor.archivo_compactacion, mode='w', encoding='utf-8') as archivo:
+            archivo.write('{"inodo": -1, "tamano": 0}')
+        self.assertEqual(GestorPalabras(self.archivo_csv).opciones["Colores"], ["rojo", "azul"])
+        self.assertFalse(os.path.exists(gestor.archivo_compactacion))
+        # Interrupción después del renombrado: el CSV nuevo ya incluye el diario
+        temporal = self.archivo_csv + ".tmp"
+        with open(temporal, mode='w', encoding='utf-8', newline='') as archivo:
+            archivo.write("Música,rock,salsa\r\nColores,rojo,azul\r\n")
+        estado = os.stat(temporal)
+        with open(gestor.archivo_compactacion, mode='w', encoding='utf-8') as archivo:
+            archivo.write(f'{{"inodo": {estado.st_ino}, "tamano": {estado.st_size}}}')
+        os.replace(temporal, self.archivo_csv)
+        self.assertEqual(GestorPalabras(self.archivo_csv).opciones["Colores"], ["rojo", "azul"])
+        self.assertFalse(os.path.exists(gestor.archivo_diario))
+
+    def test_compactar(self):
+        """
+        Prueba que compactar incorpore el diario al CSV y lo elimine, también en carga diferida.
+        """
+        gestor = GestorPalabras(self.archivo_csv, carga_diferida=True)
+        gestor.agregar_palabras("Colores", ["azul"])
+        gestor.compactar()
+        self.assertFalse(os.path.exists(gestor.archivo_diario))
+        self.assertEqual(self._leer_csv(), "Música,rock,salsa\nColores,rojo,azul\n")
+        self.assertEqual(gestor.opciones["Música"], ["rock", "salsa"])
+
+class TestCorpusCompilado(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un archivo CSV temporal para las pruebas del formato compilado.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.archivo_csv = os.path.join(self.directorio.name, "temas.csv")
+        with open(self.archivo_csv, mode='w', encoding='utf-8', newline='') as archivo:
+            archivo.write("Frutas,naranja,piña\r\nColores,rojo,naranja\r\n")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_compilado_equivale_al_csv(self):
+        """
+        Prueba que el corpus compilado exponga los mismos temas y palabras que el CSV.
+        """
+        gestor = GestorPalabras(self.archivo_csv, compilado=True)
+        self.assertTrue(os.path.exists(self.archivo_csv + ".bin"))
+        self.assertEqual(gestor.obtener_temas(), ["Frutas", "Colores"])
+        self.assertEqual(list(gestor.opciones["Frutas"]), ["naranja", "piña"])
+        self.assertIn(gestor.seleccionar_palabra("Colores"), ["rojo", "naranja"])
+
+    def test_compilado_se_regenera_y_aplica_el_diario(self):
+        """
+        Prueba que el binario se regenere al cambiar el CSV y que el diario se aplique encima.
+        """
+        GestorPalabras(self.archivo_csv, compilado=True)
+        with open(self.archivo_csv, mode='a', encoding='utf-8', newline='') as archivo:
+            archivo.write("Animales,gato\r\n")
+        gestor = GestorPalabras(self.archivo_csv, compilado=True)
+        gestor.agregar_palabra("Animales", "perro")
+        recargado = GestorPalabras(self.archivo_csv, compilado=True)
+        self.assertEqual(list(recargado.opciones["Animales"]), ["gato", "perro"])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from src.juego import Juego  # Asegúrate de que el nombre del archivo sea correcto
+from src.pistas import MotorPistas
+
+class TestMotorPistas(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un motor de pistas con las palabras de un tema para cada prueba.
+        """
+        self.motor = MotorPistas(["casa", "cosa", "masa", "mesa", "pera", "sol"])
+        self.juego = Juego("casa")
+        self.seguimiento = self.motor.seguir(self.juego)
+
+    def test_candidatas_iniciales_por_longitud(self):
+        """
+        Prueba que las candidatas iniciales sean las palabras con la longitud de la palabra secreta.
+        """
+        self.assertEqual(self.seguimiento.candidatas_restantes(), ["casa", "cosa", "masa", "mesa", "pera"])
+
+    def test_actualizar_filtra_por_patron_y_letras_incorrectas(self):
+        """
+        Prueba que las candidatas se reduzcan con las letras acertadas y las incorrectas.
+        """
+        self.juego.jugar_turno("a")
+        self.seguimiento.actualizar()
+        self.assertEqual(self.seguimiento.candidatas_restantes(), ["casa", "masa"])
+        self.juego.jugar_turno("m")
+        self.seguimiento.actualizar()
+        self.assertEqual(self.seguimiento.candidatas_restantes(), ["casa"])
+
+    def test_intentos_de_palabra_completa(self):
+        """
+        Prueba que se descarte un intento comprobado y fallido, pero no uno fuera de tiempo.
+        """
+        self.juego.jugar_turno("masa")
+        self.seguimiento.actualizar()
+        self.assertEqual(self.seguimiento.candidatas_restantes(), ["casa", "cosa", "mesa", "pera"])
+        self.juego.jugar_turno("c")
+        self.juego.jugar_turno("a")
+        self.juego.jugar_turno("casa")
+        self.seguimiento.actualizar()
+        self.assertEqual(self.seguimiento.candidatas_restantes(), ["casa"])
+
+    def test_sugerir_prefiere_la_letra_mas_informativa(self):
+        """
+        Prueba que la mejor sugerencia divida las candidatas a la mitad y no repita letras usadas.
+        """
+        self.juego.jugar_turno("s")
+        sugerencias = self.seguimiento.sugerir(cantidad=10)
+        letras = [letra for letra, _ in sugerencias]
+        self.assertNotIn("s", letras)
+        self.assertEqual(self.seguimiento.candidatas_restantes(), ["casa", "cosa", "masa", "mesa"])
+        self.assertIn(letras[0], {"c", "m"})
+        self.assertAlmostEqual(sugerencias[0][1], 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
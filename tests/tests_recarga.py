@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+import unittest
+from src.palabras import GestorPalabras  # Asegúrate de que el nombre del archivo sea correcto
+from src.recarga import VigilanteCorpus
+from compilado import CorpusCompilado
+
+class TestVigilanteCorpus(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un CSV temporal con tres temas y un gestor con su vigilante.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.archivo_csv = os.path.join(self.directorio.name, "temas.csv")
+        self.escribir("Música,rock,salsa\nColores,rojo\nFrutas,pera,uva\n")
+        self.gestor = GestorPalabras(self.archivo_csv)
+        self.vigilante = VigilanteCorpus(self.gestor, intervalo=0.01)
+
+    def tearDown(self):
+        self.vigilante.detener()
+        self.directorio.cleanup()
+
+    def escribir(self, contenido):
+        """
+        Reemplaza el CSV de forma atómica, como lo hacen `guardar_palabras` y la ingesta.
+        """
+        temporal = self.archivo_csv + ".tmp"
+        with open(temporal, mode='w', encoding='utf-8') as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, self.archivo_csv)
+
+    def test_instantanea_inmutable(self):
+        """
+        Prueba que las opciones sean una instantánea de solo lectura con su versión.
+        """
+        self.assertEqual(self.vigilante.version, 1)
+        self.assertEqual(self.gestor.opciones["Frutas"], ("pera", "uva"))
+        with self.assertRaises(TypeError):
+            self.gestor.opciones["Frutas"] = ("kiwi",)
+        self.assertFalse(self.vigilante.comprobar())
+        self.assertEqual(self.vigilante.version, 1)
+
+    def test_solo_decodifica_los_temas_que_cambian(self):
+        """
+        Prueba que una recarga reutilice las filas sin cambios y quite los temas eliminados.
+        """
+        anterior = self.gestor.opciones
+        self.escribir("Música,rock,salsa\nColores,rojo,verde\n")
+        self.assertTrue(self.vigilante.comprobar())
+        self.assertEqual(self.vigilante.version, 2)
+        self.assertEqual((self.vigilante.reutilizadas, self.vigilante.decodificadas), (1, 1))
+        self.assertIs(self.gestor.opciones["Música"], anterior["Música"])
+        self.assertEqual(self.gestor.obtener_temas(), ["Música", "Colores"])
+        self.assertEqual(self.gestor.opciones["Colores"], ("rojo", "verde"))
+        # La instantánea anterior no cambia
+        self.assertEqual(list(anterior), ["Música", "Colores", "Frutas"])
+        self.assertGreaterEqual(self.vigilante.latencia, 0.0)
+
+    def test_agregar_palabra_copia_la_instantanea(self):
+        """
+        Prueba que agregar palabras no modifique la instantánea que otros están leyendo.
+        """
+        anterior = self.gestor.opciones
+        self.gestor.agregar_palabra("Colores", "azul")
+        self.assertEqual(anterior["Colores"], ("rojo",))
+        self.assertEqual(self.gestor.opciones["Colores"], ("rojo", "azul"))
+        self.assertTrue(self.vigilante.comprobar())
+        self.assertEqual(self.gestor.opciones["Colores"], ("rojo", "azul"))
+
+    def test_hilo_vigilante(self):
+        """
+        Prueba que el hilo vigilante instale el cambio sin intervención.
+        """
+        self.vigilante.iniciar()
+        self.escribir("Animales,gato\n")
+        limite = time.monotonic() + 2
+        while self.vigilante.version < 2 and time.monotonic() < limite:
+            time.sleep(0.01)
+        self.assertEqual(self.gestor.seleccionar_palabra("Animales"), "gato")
+
+    def test_gestor_compilado_conserva_el_mmap(self):
+        """
+        Prueba que con un gestor compilado la primera instantánea sea su corpus y las recargas sigan compiladas.
+        """
+        gestor = GestorPalabras(self.archivo_csv, compilado=True)
+        corpus = gestor.opciones
+        vigilante = VigilanteCorpus(gestor)
+        self.assertIs(gestor.opciones, corpus)
+        self.assertEqual(vigilante.version, 1)
+        time.sleep(0.01)
+        self.escribir("Animales,gato,perro\n")
+        self.assertTrue(vigilante.comprobar())
+        self.assertIsInstance(gestor.opciones, CorpusCompilado)
+        self.assertEqual(list(gestor.opciones["Animales"]), ["gato", "perro"])
+        self.assertEqual(list(corpus["Frutas"]), ["pera", "uva"], "La instantánea anterior no cambia")
+
+if __name__ == '__main__':
+    unittest.main()
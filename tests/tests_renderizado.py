@@ -0,0 +1,58 @@
+import unittest
+from io import StringIO
+from src.renderizado import RenderizadorTerminal  # Asegúrate de que el nombre del archivo sea correcto
+
+class TestRenderizadorTerminal(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un renderizador que escribe en un búfer de texto para cada prueba.
+        """
+        self.salida = StringIO()
+        self.renderizador = RenderizadorTerminal(self.salida)
+
+    def test_primer_cuadro_limpia_y_dibuja_todo(self):
+        """
+        Prueba que el primer cuadro limpie la pantalla y dibuje todas sus líneas.
+        """
+        self.renderizador.dibujar(["uno", "dos"])
+        self.assertEqual(self.salida.getvalue(),
+                         "\x1b[H\x1b[2J\x1b[1;1Huno\x1b[K\x1b[2;1Hdos\x1b[K\x1b[3;1H\x1b[K\x1b[4;1H\x1b[K")
+
+    def test_solo_redibuja_las_lineas_que_cambian(self):
+        """
+        Prueba que un cuadro posterior solo reescriba las líneas modificadas.
+        """
+        self.renderizador.dibujar(["uno", "dos"])
+        self.salida.seek(0)
+        self.salida.truncate()
+        self.renderizador.dibujar(["uno", "tres"])
+        self.assertEqual(self.salida.getvalue(),
+                         "\x1b[2;1Htres\x1b[K\x1b[3;1H\x1b[K\x1b[4;1H\x1b[K")
+        self.assertEqual(self.renderizador.resumen_tiempos()["cuadros"], 2)
+
+    def test_actualizar_linea_conserva_el_cursor(self):
+        """
+        Prueba que una línea del cuadro se reescriba guardando y restaurando el cursor, y solo si cambió.
+        """
+        self.renderizador.dibujar(["uno", "Tiempo: 9 s"])
+        self.salida.seek(0)
+        self.salida.truncate()
+        self.renderizador.actualizar_linea(-1, "Tiempo: 8 s")
+        self.renderizador.actualizar_linea(-1, "Tiempo: 8 s")
+        self.assertEqual(self.salida.getvalue(), "\x1b7\x1b[2;1HTiempo: 8 s\x1b[K\x1b8")
+        self.assertEqual(self.renderizador.lineas_previas, ["uno", "Tiempo: 8 s"])
+
+    def test_mensaje_de_estado_expira_sin_bloquear(self):
+        """
+        Prueba que el mensaje de estado se muestre de inmediato y se borre al vencer.
+        """
+        self.renderizador.dibujar(["uno"])
+        self.renderizador.mostrar_estado("Letra incorrecta", duracion=0.01)
+        self.assertIn("\x1b7\x1b[2;1HLetra incorrecta\x1b[K\x1b8", self.salida.getvalue())
+        self.renderizador.temporizador.join(1)
+        self.assertEqual(self.renderizador.estado, "")
+        self.assertTrue(self.salida.getvalue().endswith("\x1b7\x1b[2;1H\x1b[K\x1b8"))
+
+if __name__ == "__main__":
+    unittest.main()
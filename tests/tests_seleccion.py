@@ -0,0 +1,110 @@
+import random
+import unittest
+from collections import Counter
+from src.palabras import GestorPalabras  # Asegúrate de que el nombre del archivo sea correcto
+from src.seleccion import BolsaBarajada, FiltroBloomRotativo, MotorSeleccion, MuestreoAlias
+
+class TestBolsaBarajada(unittest.TestCase):
+
+    def test_sin_repeticiones_por_ronda(self):
+        """
+        Prueba que cada índice salga exactamente una vez por ronda.
+        """
+        bolsa = BolsaBarajada(50, random.Random(1))
+        for _ in range(3):
+            self.assertEqual(sorted(bolsa.sacar() for _ in range(50)), list(range(50)))
+
+    def test_ajustar_agrega_indices_pendientes(self):
+        """
+        Prueba que los índices agregados a mitad de ronda salgan antes de que la ronda termine.
+        """
+        bolsa = BolsaBarajada(10, random.Random(2))
+        vistos = [bolsa.sacar() for _ in range(4)]
+        bolsa.ajustar(15)
+        vistos += [bolsa.sacar() for _ in range(11)]
+        self.assertEqual(sorted(vistos), list(range(15)))
+
+    def test_bolsa_vacia(self):
+        """
+        Prueba que una bolsa vacía genere IndexError, como `random.choice`.
+        """
+        with self.assertRaises(IndexError):
+            BolsaBarajada(0, random.Random()).sacar()
+
+class TestMuestreoAlias(unittest.TestCase):
+
+    def test_frecuencias_proporcionales(self):
+        """
+        Prueba que las frecuencias observadas se acerquen a los pesos y que un peso cero nunca salga.
+        """
+        muestreo = MuestreoAlias([1, 3, 0, 6], random.Random(3))
+        conteo = Counter(muestreo.sacar() for _ in range(20000))
+        self.assertEqual(conteo[2], 0)
+        self.assertAlmostEqual(conteo[1] / 20000, 0.3, delta=0.02)
+        self.assertAlmostEqual(conteo[3] / 20000, 0.6, delta=0.02)
+
+    def test_pesos_invalidos(self):
+        """
+        Prueba que se rechacen pesos negativos o que suman cero.
+        """
+        with self.assertRaises(ValueError):
+            MuestreoAlias([0, 0], random.Random())
+        with self.assertRaises(ValueError):
+            MuestreoAlias([1, -1], random.Random())
+
+class TestFiltroBloomRotativo(unittest.TestCase):
+
+    def test_recuerda_y_olvida(self):
+        """
+        Prueba que las palabras recientes se recuerden y que las viejas se olviden al rotar.
+        """
+        filtro = FiltroBloomRotativo(capacidad=100, generaciones=2)
+        for numero in range(300):
+            filtro.agregar(f"palabra{numero}")
+        self.assertTrue(all(f"palabra{numero}" in filtro for numero in range(200, 300)))
+        olvidadas = sum(f"palabra{numero}" not in filtro for numero in range(100))
+        self.assertGreater(olvidadas, 90)
+
+class TestMotorSeleccion(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un gestor con un tema de veinte palabras y una semilla fija.
+        """
+        self.palabras = [f"palabra{numero}" for numero in range(20)]
+        self.gestor = GestorPalabras(opciones={"Tema": self.palabras}, semilla=42)
+
+    def test_sin_repetir_hasta_agotar(self):
+        """
+        Prueba que seleccionar_palabra no repita palabras hasta agotar el tema.
+        """
+        elegidas = [self.gestor.seleccionar_palabra("Tema") for _ in range(20)]
+        self.assertEqual(sorted(elegidas), sorted(self.palabras))
+
+    def test_semilla_reproducible(self):
+        """
+        Prueba que la misma semilla produzca la misma secuencia de palabras.
+        """
+        otro = GestorPalabras(opciones={"Tema": self.palabras}, semilla=42)
+        self.assertEqual([self.gestor.seleccionar_palabra("Tema") for _ in range(30)],
+                         [otro.seleccionar_palabra("Tema") for _ in range(30)])
+
+    def test_pesos(self):
+        """
+        Prueba que con pesos solo salgan palabras con peso positivo.
+        """
+        pesos = [0] * 19 + [1]
+        elegidas = {self.gestor.seleccionar_palabra("Tema", pesos=pesos) for _ in range(50)}
+        self.assertEqual(elegidas, {"palabra19"})
+
+    def test_evitar_vistas_por_jugador(self):
+        """
+        Prueba que con pesos (que sí permiten repeticiones) se eviten las palabras que el jugador ya vio.
+        """
+        motor = MotorSeleccion(semilla=5)
+        pesos = [1] * 20
+        elegidas = [motor.elegir("Tema", self.palabras, jugador="ana", pesos=pesos) for _ in range(10)]
+        self.assertEqual(len(set(elegidas)), 10)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from src.palabras import GestorPalabras  # Asegúrate de que el nombre del archivo sea correcto
+from src.servidor import ServidorAhorcado
+from src.sesiones import AlmacenSesiones
+
+class TestServidorAhorcado(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """
+        Inicia un servidor en un puerto libre con un único tema y una única palabra.
+        """
+        gestor = GestorPalabras(opciones={"Bebidas": ["café"]})
+        self.servidor = ServidorAhorcado(gestor, tiempo_inactividad=0.2)
+        servidor = await self.servidor.iniciar(puerto=0)
+        self.puerto = servidor.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.servidor.servidor.close()
+        await self.servidor.servidor.wait_closed()
+
+    async def _enviar(self, escritor, lector, linea, respuestas=1):
+        escritor.write((linea + "\n").encode('utf-8'))
+        await escritor.drain()
+        return [(await lector.readline()).decode('utf-8').rstrip("\n") for _ in range(respuestas)]
+
+    async def test_partida_completa(self):
+        """
+        Prueba que una sesión pueda jugar una partida hasta ganarla.
+        """
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        self.assertEqual(await self._enviar(escritor, lector, "NUEVO Bebidas"), ["PARTIDA 6 _ _ _ _"])
+        self.assertEqual(await self._enviar(escritor, lector, "JUGAR z"), ["TURNO LETRA_INCORRECTA 0 1 _ _ _ _"])
+        for letra in "caf":
+            await self._enviar(escritor, lector, f"JUGAR {letra}")
+        self.assertEqual(await self._enviar(escritor, lector, "JUGAR e", respuestas=2),
+                         ["TURNO LETRAS_COMPLETAS 195 1 c a f é", "FIN GANASTE café"])
+        self.assertEqual(await self._enviar(escritor, lector, "SALIR"), ["ADIOS"])
+        escritor.close()
+
+    async def test_sesiones_independientes_y_tiempo_de_inactividad(self):
+        """
+        Prueba que cada conexión tenga su propia partida y que una sesión inactiva se cierre.
+        """
+        lector_a, escritor_a = await asyncio.open_connection("127.0.0.1", self.puerto)
+        lector_b, escritor_b = await asyncio.open_connection("127.0.0.1", self.puerto)
+        await self._enviar(escritor_a, lector_a, "NUEVO Bebidas")
+        self.assertEqual(await self._enviar(escritor_b, lector_b, "JUGAR c"),
+                         ["ERROR No hay una partida en curso; envía NUEVO"])
+        self.assertEqual((await lector_a.readline()).decode('utf-8'), "TIEMPO_AGOTADO\n")
+        escritor_a.close()
+        escritor_b.close()
+
+    async def test_reanudar_partida_tras_desconexion(self):
+        """
+        Prueba que con un almacén de sesiones una partida pueda retomarse desde otra conexión.
+        """
+        directorio = tempfile.TemporaryDirectory()
+        self.servidor.almacen = AlmacenSesiones(os.path.join(directorio.name, "sesiones.db"))
+        try:
+            lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+            sesion, _ = await self._enviar(escritor, lector, "NUEVO Bebidas", respuestas=2)
+            await self._enviar(escritor, lector, "JUGAR c")
+            escritor.close()
+
+            lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+            id_sesion = sesion.split()[1]
+            self.assertEqual(await self._enviar(escritor, lector, f"REANUDAR {id_sesion}"),
+                             ["PARTIDA 6 c _ _ _"])
+            for letra in "af":
+                await self._enviar(escritor, lector, f"JUGAR {letra}")
+            self.assertEqual((await self._enviar(escritor, lector, "JUGAR é", respuestas=2))[-1], "FIN GANASTE café")
+            self.assertEqual(await self._enviar(escritor, lector, f"REANUDAR {id_sesion}"),
+                             [f"ERROR La sesión '{id_sesion}' no existe o ya terminó"])
+            escritor.close()
+        finally:
+            self.servidor.almacen.cerrar()
+            directorio.cleanup()
+
+if __name__ == "__main__":
+    unittest.main()
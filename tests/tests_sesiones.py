@@ -0,0 +1,117 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from src.juego import Juego  # Asegúrate de que el nombre del archivo sea correcto
+from src.sesiones import AlmacenSesiones
+
+class TestAlmacenSesiones(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Crea un almacén de sesiones en un directorio temporal para cada prueba.
+        """
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "sesiones.db")
+        self.almacen = AlmacenSesiones(self.ruta, intervalo_commit=10)
+
+    def tearDown(self):
+        self.almacen.cerrar()
+        self.directorio.cleanup()
+
+    def test_reanudar_sin_repetir_turnos(self):
+        """
+        Prueba que una partida guardada se reconstruya tras cerrar y reabrir el almacén.
+        """
+        juego = Juego("café")
+        for letra in "zca":
+            juego.jugar_turno(letra)
+        self.almacen.guardar("s1", juego)
+        self.assertEqual(self.almacen.cargar("s1").avance, "c a _ _", "Debería leer las actualizaciones pendientes")
+        self.almacen.cerrar()
+
+        self.almacen = AlmacenSesiones(self.ruta)
+        restaurado = self.almacen.cargar("s1")
+        self.assertEqual(restaurado.avance, "c a _ _")
+        self.assertEqual(restaurado.errores, 1)
+        self.assertIsNone(self.almacen.cargar("inexistente"))
+
+    def test_confirmacion_en_grupo(self):
+        """
+        Prueba que muchas actualizaciones pendientes se escriban en una sola transacción.
+        """
+        for numero in range(500):
+            self.almacen.guardar(f"s{numero}", Juego("perro"))
+        self.assertEqual(self.almacen.sincronizar(), 500)
+        self.assertEqual(self.almacen.confirmaciones, 1)
+
+    def test_compactar_elimina_partidas_terminadas(self):
+        """
+        Prueba que compactar elimine solo las partidas terminadas.
+        """
+        self.almacen.guardar("en_curso", Juego("gato"))
+        self.almacen.guardar("terminada", Juego("gato"), terminado=True)
+        self.assertEqual(self.almacen.compactar(), 1)
+        self.assertIsNotNone(self.almacen.cargar("en_curso"))
+        self.assertIsNone(self.almacen.cargar("terminada"))
+
+    def test_partidas_terminadas_no_se_reanudan(self):
+        """
+        Prueba que una partida terminada solo se cargue si se piden las terminadas.
+        """
+        self.almacen.guardar("terminada", Juego("gato"), terminado=True)
+        self.assertIsNone(self.almacen.cargar("terminada"))
+        self.assertIsNotNone(self.almacen.cargar("terminada", incluir_terminadas=True))
+        self.almacen.sincronizar()
+        self.assertIsNone(self.almacen.cargar("terminada"))
+        self.assertIsNotNone(self.almacen.cargar("terminada", incluir_terminadas=True))
+
+    def test_cargar_no_espera_al_escritor(self):
+        """
+        Prueba que cargar lea lo confirmado mientras el escritor tiene una transacción abierta.
+        """
+        self.almacen.guardar("s1", Juego("perro"))
+        self.almacen.sincronizar()
+        resultado = []
+        with self.almacen.candado_bd:
+            self.almacen.conexion.execute("BEGIN IMMEDIATE")
+            self.almacen.conexion.execute("UPDATE sesiones SET terminado = 1")
+            hilo = threading.Thread(target=lambda: resultado.append(self.almacen.cargar("s1")))
+            hilo.start()
+            hilo.join(5)
+            self.almacen.conexion.execute("ROLLBACK")
+        self.assertFalse(hilo.is_alive(), "cargar no debería esperar al candado del escritor")
+        self.assertEqual(resultado[0].palabra, "perro")
+
+    def test_lote_visible_y_reintentado_si_falla(self):
+        """
+        Prueba que el lote se lea mientras se escribe y vuelva a pendientes si la escritura falla.
+        """
+        juego = Juego("perro")
+        self.almacen.guardar("s1", juego)
+        conexion = self.almacen.conexion
+
+        class ConexionFallida:
+            def execute(conexion_fallida, sql, *argumentos):
+                return conexion.execute(sql, *argumentos)
+
+            def executemany(conexion_fallida, sql, filas):
+                self.assertEqual(self.almacen.en_vuelo.keys(), {"s1"})
+                self.assertEqual(self.almacen.cargar("s1").palabra, "perro", "Debería leer el lote en vuelo")
+                self.almacen.guardar("s1", Juego("gato"))
+                raise sqlite3.OperationalError("disco lleno")
+
+        self.almacen.conexion = ConexionFallida()
+        with self.assertRaises(sqlite3.OperationalError):
+            self.almacen.sincronizar()
+        self.almacen.conexion = conexion
+        self.assertEqual(self.almacen.en_vuelo, {})
+        self.assertEqual(self.almacen.cargar("s1").palabra, "gato", "No debería pisar lo guardado después")
+        self.assertEqual(self.almacen.sincronizar(), 1)
+        self.almacen.cerrar()
+        self.almacen = AlmacenSesiones(self.ruta)
+        self.assertEqual(self.almacen.cargar("s1").palabra, "gato")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from src.palabras import GestorPalabras  # Asegúrate de que el nombre del archivo sea correcto
+from src.simulador import (Simulador, EstrategiaFrecuencia, EstrategiaGuionada,
+                           jugar_partida)
+
+class TestSimulador(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Configura un gestor con opciones personalizadas para cada prueba.
+        """
+        self.opciones = {
+            "Bebidas": ["café", "té"],
+            "Colores": ["rojo", "azul", "verde"],
+        }
+        self.gestor = GestorPalabras(opciones=self.opciones)
+
+    def test_jugar_partida_guionada_gana(self):
+        """
+        Prueba que una estrategia guionada complete la palabra y obtenga los puntos de calcular_puntos.
+        """
+        gano, errores, puntos = jugar_partida("café", EstrategiaGuionada("xcafe"))
+        self.assertTrue(gano)
+        self.assertEqual(errores, 1)
+        self.assertEqual(puntos, 195)
+
+    def test_jugar_partida_guionada_pierde(self):
+        """
+        Prueba que la partida termine al alcanzar el máximo de errores.
+        """
+        gano, errores, puntos = jugar_partida("té", EstrategiaGuionada("abcdfgh"))
+        self.assertFalse(gano)
+        self.assertEqual(errores, 6)
+        self.assertEqual(puntos, 0)
+
+    def test_simulador_resume_por_tema_y_palabra(self):
+        """
+        Prueba que el simulador acumule las partidas de cada palabra en todos los procesos.
+        """
+        simulador = Simulador(self.gestor, EstrategiaFrecuencia(), partidas_por_palabra=3,
+                              procesos=2, tamano_fragmento=1)
+        resumen = simulador.resumir()
+        self.assertEqual(set(resumen), set(self.opciones))
+        for tema, palabras in self.opciones.items():
+            self.assertEqual(set(resumen[tema]), set(palabras))
+            for estadisticas in resumen[tema].values():
+                self.assertEqual(estadisticas.partidas, 3)
+
+if __name__ == "__main__":
+    unittest.main()